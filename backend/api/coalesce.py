@@ -0,0 +1,118 @@
+"""Coalescing of identical concurrent metric computations within a worker.
+
+Until the first of several identical requests has stored its result, every
+other one misses the cache too and would run the same pandas pipeline. The
+coalescer keeps one future per in-flight computation: the first request
+(the leader) computes, identical requests arriving meanwhile await the
+leader's future instead. Event-loop callers (``run_async``) and threads
+(``run``) share the same flights.
+
+A cancelled ``run_async`` caller (e.g. a disconnected client) only stops
+waiting: the computation runs to completion and still serves every other
+request of its flight.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """One in-flight computation and the number of requests waiting on it."""
+
+    __slots__ = ("future", "requests")
+
+    def __init__(self):
+        self.future: Future = Future()
+        self.requests = 1
+
+
+class RequestCoalescer:
+    """Shares one in-flight computation between identical concurrent requests."""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self.computations = 0
+        self.requests = 0
+        self.max_requests_per_computation = 0
+
+    def _join(self, key: Hashable) -> Tuple[_Flight, bool]:
+        """The flight of ``key`` and whether the caller leads it (must compute)."""
+        with self._lock:
+            self.requests += 1
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.requests += 1
+                return flight, False
+
+            flight = self._flights[key] = _Flight()
+            return flight, True
+
+    def _land(self, key: Hashable, flight: _Flight, result: Any = None,
+              error: Optional[BaseException] = None) -> None:
+        """Publish the leader's outcome to every request that joined the flight."""
+        with self._lock:
+            del self._flights[key]
+            self.computations += 1
+            self.max_requests_per_computation = max(self.max_requests_per_computation, flight.requests)
+            served = flight.requests
+
+        if not flight.future.set_running_or_notify_cancel():
+            return
+        if error is not None:
+            flight.future.set_exception(error)
+        else:
+            flight.future.set_result(result)
+        if served > 1:
+            logger.debug(f"Computation of {key} served {served} requests")
+
+    def _fly(self, key: Hashable, flight: _Flight, compute: Callable[[], Any]) -> None:
+        """Run the leader's computation and land its result or error."""
+        try:
+            result = compute()
+        except BaseException as e:
+            self._land(key, flight, error=e)
+        else:
+            self._land(key, flight, result)
+
+    def run(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Compute ``key`` in this thread, or wait for the identical computation in flight."""
+        flight, leader = self._join(key)
+        if leader:
+            self._fly(key, flight, compute)
+        return flight.future.result()
+
+    async def run_async(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Compute ``key`` in a worker thread, or await the identical computation in flight.
+
+        The event loop stays free while computing, so identical requests
+        arriving meanwhile can join the flight. Every caller awaits the
+        flight through a shield, so cancelling one leaves the others served.
+        """
+        flight, leader = self._join(key)
+        if leader:
+            run = functools.partial(contextvars.copy_context().run, self._fly, key, flight, compute)
+            asyncio.get_running_loop().run_in_executor(None, run)
+        return await asyncio.shield(asyncio.wrap_future(flight.future))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Computations run, requests served by them, and requests sharing another's computation."""
+        with self._lock:
+            return {
+                "in_flight": len(self._flights),
+                "computations": self.computations,
+                "requests": self.requests,
+                "coalesced_requests": self.requests - self.computations - len(self._flights),
+                "max_requests_per_computation": self.max_requests_per_computation
+            }
+
+
+# Global coalescer of the metric endpoints
+metric_flights = RequestCoalescer()
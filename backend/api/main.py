@@ -1,14 +1,20 @@
 """FastAPI main application."""
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import logging
+import secrets
 from datetime import datetime
+from typing import Optional
 
-from backend.config import API_HOST, API_PORT
-from backend.api.routes import metrics, drivers, constructors
-from backend.api.schemas import HealthCheck
+from backend.config import API_HOST, API_PORT, DATASET_ADMIN_TOKEN, DATASET_RELOAD_INTERVAL, ENABLE_WARMUP
+from backend.api.routes import metrics, drivers, constructors, standings
+from backend.api.coalesce import metric_flights
+from backend.api.schemas import HealthCheck, IngestRequest
+from backend.api.warmup import warmup
 from backend.data.cache import metric_cache
 
 
@@ -39,10 +45,23 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to load initial data: {e}")
         raise
 
+    # Hot-reload dataset/ changes, invalidating only the affected results
+    data_loader.add_reload_listener(metrics.invalidate_changed_metrics)
+    if DATASET_RELOAD_INTERVAL > 0:
+        data_loader.start_watching(DATASET_RELOAD_INTERVAL)
+
+    # Warm up in the background once the port is open; /ready gates traffic
+    if ENABLE_WARMUP:
+        # Keep a reference so the task is not garbage collected mid-run
+        app.state.warmup_task = asyncio.create_task(asyncio.to_thread(warmup.run))
+    else:
+        warmup.skip()
+
     yield
 
     # Shutdown
     logger.info("F1 Metrics API shutting down...")
+    data_loader.stop_watching()
 
 
 # Create FastAPI app
@@ -80,6 +99,7 @@ app.add_middleware(
 app.include_router(metrics.router, prefix="/api/v1")
 app.include_router(drivers.router, prefix="/api/v1")
 app.include_router(constructors.router, prefix="/api/v1")
+app.include_router(standings.router, prefix="/api/v1")
 
 
 @app.get("/")
@@ -90,10 +110,13 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "health": "/health",
+            "ready": "/ready",
             "docs": "/docs",
             "metrics": "/api/v1/metrics/available",
             "drivers": "/api/v1/drivers/",
-            "constructors": "/api/v1/constructors/"
+            "constructors": "/api/v1/constructors/",
+            "standings": "/api/v1/standings/{season}",
+            "seasons": "/api/v1/seasons"
         }
     }
 
@@ -109,6 +132,9 @@ async def health_check():
 
         # Get cache stats
         cache_stats = metric_cache.get_stats()
+        cache_stats["frames"] = data_loader.frame_cache.get_stats()
+        cache_stats["coalescing"] = metric_flights.get_stats()
+        cache_stats["dataset_version"] = data_loader.dataset_version
 
         return HealthCheck(
             status="healthy" if data_healthy else "unhealthy",
@@ -122,6 +148,12 @@ async def health_check():
         raise HTTPException(status_code=500, detail=f"Health check failed: {str(e)}")
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 503 until the background warm-up has finished."""
+    return JSONResponse(status_code=200 if warmup.ready else 503, content=warmup.get_stats())
+
+
 @app.get("/api/v1/cache/clear")
 async def clear_cache(metric_name: str = None):
     """Clear metric cache."""
@@ -140,6 +172,75 @@ async def clear_cache(metric_name: str = None):
         raise HTTPException(status_code=500, detail=f"Cache clearing failed: {str(e)}")
 
 
+@app.get("/api/v1/seasons")
+async def get_seasons():
+    """Seasons served, and the first season of the tables only recorded for part of them."""
+    try:
+        from backend.data.loader import data_loader
+        return {
+            "full_history": data_loader.full_history,
+            "first_season": data_loader.min_year,
+            "last_season": data_loader.latest_season(),
+            "data_available_from": data_loader.data_coverage()
+        }
+
+    except Exception as e:
+        logger.error(f"Fetching seasons failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Fetching seasons failed: {str(e)}")
+
+
+def require_dataset_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Allow dataset changes only to callers presenting ``DATASET_ADMIN_TOKEN``."""
+    if not DATASET_ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Dataset changes over the API are disabled")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, DATASET_ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid or missing X-Admin-Token header")
+
+
+@app.post("/api/v1/dataset/reload", dependencies=[Depends(require_dataset_admin)])
+async def reload_dataset():
+    """Hot-reload dataset/ now instead of waiting for the next poll."""
+    try:
+        from backend.data.loader import data_loader
+        # Building the new tables blocks, so keep it off the event loop
+        change = await asyncio.to_thread(data_loader.reload)
+
+        return {
+            "reloaded": change is not None,
+            "dataset_version": data_loader.dataset_version,
+            "change": change.to_dict() if change else None,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    except Exception as e:
+        logger.error(f"Dataset reload failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Dataset reload failed: {str(e)}")
+
+
+@app.post("/api/v1/dataset/ingest", dependencies=[Depends(require_dataset_admin)])
+async def ingest_race(request: IngestRequest):
+    """Append one race weekend's new rows without rebuilding the dataset."""
+    from backend.data.loader import data_loader
+    from backend.data.schema import parse_rows
+
+    try:
+        tables = {filename: parse_rows(rows, filename) for filename, rows in request.tables.items()}
+        # Writing the segment and extending the tables blocks, so keep it off the event loop
+        change = await asyncio.to_thread(data_loader.ingest, tables)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid race rows: {str(e)}")
+    except Exception as e:
+        logger.error(f"Dataset ingest failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Dataset ingest failed: {str(e)}")
+
+    return {
+        "dataset_version": data_loader.dataset_version,
+        "change": change.to_dict(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -174,4 +275,4 @@ if __name__ == "__main__":
         host=API_HOST,
         port=API_PORT,
         log_level="info"
-    )
\ No newline at end of file
+    )
@@ -102,6 +102,7 @@ async def get_constructor_races(
         # Convert to race info, removing duplicates
         races = results.groupby(["raceId", "year", "round", "name", "date"]).first().reset_index()
 
+        circuits = data_loader.entities.circuits
         race_list = [
             RaceInfo(
                 race_id=int(row["raceId"]),
@@ -109,7 +110,7 @@ async def get_constructor_races(
                 round=int(row["round"]),
                 name=row["name"],
                 date=row["date"],
-                circuit_name=row.get("circuitId")  # May need to join with circuits table
+                circuit_name=circuits.name(row["circuitId"])
             )
             for _, row in races.iterrows()
         ]
@@ -106,6 +106,7 @@ async def get_driver_races(
         # Convert to race info
         races = results.groupby(["raceId", "year", "round", "name", "date"]).first().reset_index()
 
+        circuits = data_loader.entities.circuits
         race_list = [
             RaceInfo(
                 race_id=int(row["raceId"]),
@@ -113,7 +114,7 @@ async def get_driver_races(
                 round=int(row["round"]),
                 name=row["name"],
                 date=row["date"],
-                circuit_name=row.get("circuit_name")
+                circuit_name=circuits.name(row["circuitId"])
             )
             for _, row in races.iterrows()
         ]
@@ -1,170 +1,76 @@
 """API routes for metrics."""
 
 from fastapi import APIRouter, HTTPException
-from typing import List
+from typing import Any, Callable, List, Optional
+import functools
 import logging
 
+from backend.api.coalesce import metric_flights
 from backend.api.schemas import MetricRequest, MetricResponse
-from backend.data.loader import data_loader
-from backend.metrics.driver.qualifying import (
-    QualifyingPositionAverage,
-    QualifyingConsistency,
-    PolePositionRate
-)
-from backend.metrics.driver.race import (
-    AverageFinishPosition,
-    PointsPerRace,
-    DNFRate,
-    PodiumRate
-)
-from backend.metrics.driver.teammate import (
-    TeammateQualifyingComparison,
-    TeammateRaceComparison
-)
-from backend.metrics.constructor.championship import (
-    ConstructorChampionshipPosition,
-    ConstructorChampionshipWins,
-    ConstructorPointsPerSeason,
-    ConstructorPointsPerRace,
-    ConstructorTopThreeFinishes
-)
-from backend.metrics.constructor.race_performance import (
-    ConstructorWinRate,
-    ConstructorPodiumRate,
-    ConstructorRaceWins,
-    ConstructorPodiumLockouts,
-    ConstructorAverageFinishPosition,
-    ConstructorPointsScoringRate,
-    ConstructorFrontRowLockouts,
-    ConstructorDoublePodiums
-)
-from backend.metrics.constructor.qualifying import (
-    ConstructorPolePositionRate,
-    ConstructorAverageQualifyingPosition,
-    ConstructorQualifyingConsistency,
-    ConstructorFrontRowStartRate,
-    ConstructorTopTenQualifyingRate,
-    ConstructorQualifyingAdvantage
-)
-from backend.metrics.constructor.reliability import (
-    ConstructorDNFRate,
-    ConstructorMechanicalFailureRate,
-    ConstructorFinishRate,
-    ConstructorReliabilityIndex,
-    ConstructorAverageReliability
-)
-from backend.metrics.constructor.competitiveness import (
-    ConstructorSeasonDominance,
-    ConstructorConsistencyIndex,
-    ConstructorCompetitivenessRating,
-    ConstructorPerformanceConsistency,
-    ConstructorRaceWinStreak,
-    ConstructorSeasonalImprovement
-)
-from backend.metrics.constructor.pit_stops import (
-    ConstructorAveragePitStopTime,
-    ConstructorFastestPitStop,
-    ConstructorPitStopConsistency,
-    ConstructorSubThreeSecondStops,
-    ConstructorPitStopEfficiency,
-    ConstructorAveragePitStopsPerRace,
-    ConstructorPitStopTimeImprovement,
-    ConstructorPitStopReliability,
-    ConstructorPitStopStrategicSuccess
-)
-from backend.metrics.constructor.lap_performance import (
-    ConstructorAverageLapTime,
-    ConstructorFastestLap,
-    ConstructorLapTimeConsistency,
-    ConstructorRacePace,
-    ConstructorLapTimeImprovement,
-    ConstructorTireManagement,
-    ConstructorCompetitiveLapRate,
-    ConstructorLapTimeVariability,
-    ConstructorPaceDominance,
-    ConstructorFuelAdjustedPace
-)
+from backend.data.loader import COVERAGE_TABLES, data_loader
+from backend.data.cache import metric_cache
+from backend.data.frame_cache import frame_key
+from backend.data.reload import DatasetChange
+from backend.metrics.base import MetricResult
+from backend.metrics.registry import metric_registry
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
-# Initialize metric calculators
-DRIVER_METRICS = {
-    "qualifying_position_average": QualifyingPositionAverage(),
-    "qualifying_consistency": QualifyingConsistency(),
-    "pole_position_rate": PolePositionRate(),
-    "average_finish_position": AverageFinishPosition(),
-    "points_per_race": PointsPerRace(),
-    "dnf_rate": DNFRate(),
-    "podium_rate": PodiumRate(),
-    "teammate_qualifying_comparison": TeammateQualifyingComparison(),
-    "teammate_race_comparison": TeammateRaceComparison()
-}
-
-CONSTRUCTOR_METRICS = {
-    # Championship metrics
-    "constructor_championship_position": ConstructorChampionshipPosition(),
-    "constructor_championship_wins": ConstructorChampionshipWins(),
-    "constructor_points_per_season": ConstructorPointsPerSeason(),
-    "constructor_points_per_race": ConstructorPointsPerRace(),
-    "constructor_top_three_finishes": ConstructorTopThreeFinishes(),
-
-    # Race performance metrics
-    "constructor_win_rate": ConstructorWinRate(),
-    "constructor_podium_rate": ConstructorPodiumRate(),
-    "constructor_race_wins": ConstructorRaceWins(),
-    "constructor_podium_lockouts": ConstructorPodiumLockouts(),
-    "constructor_average_finish_position": ConstructorAverageFinishPosition(),
-    "constructor_points_scoring_rate": ConstructorPointsScoringRate(),
-    "constructor_front_row_lockouts": ConstructorFrontRowLockouts(),
-    "constructor_double_podiums": ConstructorDoublePodiums(),
-
-    # Qualifying metrics
-    "constructor_pole_position_rate": ConstructorPolePositionRate(),
-    "constructor_average_qualifying_position": ConstructorAverageQualifyingPosition(),
-    "constructor_qualifying_consistency": ConstructorQualifyingConsistency(),
-    "constructor_front_row_start_rate": ConstructorFrontRowStartRate(),
-    "constructor_top_ten_qualifying_rate": ConstructorTopTenQualifyingRate(),
-    "constructor_qualifying_advantage": ConstructorQualifyingAdvantage(),
-
-    # Reliability metrics
-    "constructor_dnf_rate": ConstructorDNFRate(),
-    "constructor_mechanical_failure_rate": ConstructorMechanicalFailureRate(),
-    "constructor_finish_rate": ConstructorFinishRate(),
-    "constructor_reliability_index": ConstructorReliabilityIndex(),
-    "constructor_average_reliability": ConstructorAverageReliability(),
-
-    # Competitiveness metrics
-    "constructor_season_dominance": ConstructorSeasonDominance(),
-    "constructor_consistency_index": ConstructorConsistencyIndex(),
-    "constructor_competitiveness_rating": ConstructorCompetitivenessRating(),
-    "constructor_performance_consistency": ConstructorPerformanceConsistency(),
-    "constructor_race_win_streak": ConstructorRaceWinStreak(),
-    "constructor_seasonal_improvement": ConstructorSeasonalImprovement(),
-
-    # Pit stop metrics
-    "constructor_average_pit_stop_time": ConstructorAveragePitStopTime(),
-    "constructor_fastest_pit_stop": ConstructorFastestPitStop(),
-    "constructor_pit_stop_consistency": ConstructorPitStopConsistency(),
-    "constructor_sub_three_second_stops": ConstructorSubThreeSecondStops(),
-    "constructor_pit_stop_efficiency": ConstructorPitStopEfficiency(),
-    "constructor_average_pit_stops_per_race": ConstructorAveragePitStopsPerRace(),
-    "constructor_pit_stop_time_improvement": ConstructorPitStopTimeImprovement(),
-    "constructor_pit_stop_reliability": ConstructorPitStopReliability(),
-    "constructor_pit_stop_strategic_success": ConstructorPitStopStrategicSuccess(),
-
-    # Lap performance metrics
-    "constructor_average_lap_time": ConstructorAverageLapTime(),
-    "constructor_fastest_lap": ConstructorFastestLap(),
-    "constructor_lap_time_consistency": ConstructorLapTimeConsistency(),
-    "constructor_race_pace": ConstructorRacePace(),
-    "constructor_lap_time_improvement": ConstructorLapTimeImprovement(),
-    "constructor_tire_management": ConstructorTireManagement(),
-    "constructor_competitive_lap_rate": ConstructorCompetitiveLapRate(),
-    "constructor_lap_time_variability": ConstructorLapTimeVariability(),
-    "constructor_pace_dominance": ConstructorPaceDominance(),
-    "constructor_fuel_adjusted_pace": ConstructorFuelAdjustedPace()
-}
+
+def invalidate_changed_metrics(change: DatasetChange) -> None:
+    """Drop cached metric results whose input tables changed in a reload."""
+    affected = [spec.name for spec in metric_registry.specs() if change.files & set(spec.tables)]
+    metric_cache.invalidate(affected, seasons=change.seasons, race_ids=change.race_ids)
+
+
+def _missing_data_result(metric_name: str, request: MetricRequest) -> Optional[MetricResult]:
+    """Result for a season predating a table the metric needs, or ``None``.
+
+    E.g. lap times before 1996 in full-history mode; the metric is not computed.
+    """
+    if not request.season:
+        return None
+
+    for table in metric_registry.spec(metric_name).tables:
+        if table not in COVERAGE_TABLES:
+            continue
+        first_season = data_loader.first_season(table)
+        if first_season is None or request.season < first_season:
+            label = table.removesuffix(".csv").replace("_", " ")
+            return MetricResult(
+                metric_name, None,
+                driver_id=request.driver_id,
+                constructor_id=request.constructor_id,
+                season=request.season,
+                metadata={"error": f"No {label} data for season {request.season}",
+                          "data_available_from": first_season}
+            )
+    return None
+
+
+async def _calculate(family: str, metric_name: str, compute: Callable[[], Any], **params) -> Any:
+    """A metric's cached result, or its computation shared by identical concurrent requests.
+
+    ``params`` are the metric's cache key; ``compute`` caches what it returns.
+    """
+    result = metric_cache.get(metric_name, **params)
+    if result is None:
+        result = await metric_flights.run_async(frame_key(f"{family}:{metric_name}", **params), compute)
+    return result
+
+
+def _driver_params(request: MetricRequest) -> dict:
+    return {
+        "driver_id": request.driver_id,
+        "constructor_id": request.constructor_id,
+        "season": request.season,
+        "race_ids": request.race_ids
+    }
+
+
+def _constructor_params(request: MetricRequest) -> dict:
+    return {"constructor_id": request.constructor_id, "season": request.season}
 
 
 def _convert_metric_result_to_response(result) -> MetricResponse:
@@ -187,14 +93,12 @@ def _convert_metric_result_to_response(result) -> MetricResponse:
 
 @router.get("/available")
 async def get_available_metrics():
-    """Get list of available metrics."""
+    """Get list of available metrics (served from registry metadata, nothing is imported)."""
     return {
-        "driver_metrics": list(DRIVER_METRICS.keys()),
-        "constructor_metrics": list(CONSTRUCTOR_METRICS.keys()),
-        "comparison_metrics": [
-            "teammate_qualifying_comparison",
-            "teammate_race_comparison"
-        ]
+        "driver_metrics": metric_registry.names("driver"),
+        "constructor_metrics": metric_registry.names("constructor"),
+        "comparison_metrics": [spec.name for spec in metric_registry.specs() if spec.comparison],
+        "metrics": {spec.name: spec.to_dict() for spec in metric_registry.specs()}
     }
 
 
@@ -206,20 +110,24 @@ async def calculate_multiple_driver_metrics(
     """Calculate multiple driver metrics at once."""
     results = []
     errors = []
+    # Every metric reads the same season slices; build them once for the request
+    view = None if request.race_ids else data_loader.season_view(request.season)
 
     for metric_name in metric_names:
-        if metric_name not in DRIVER_METRICS:
+        if not metric_registry.has(metric_name, "driver"):
             errors.append(f"Metric '{metric_name}' not found")
             continue
 
         try:
-            metric_calculator = DRIVER_METRICS[metric_name]
-            result = metric_calculator.calculate(
-                driver_id=request.driver_id,
-                constructor_id=request.constructor_id,
-                season=request.season,
-                race_ids=request.race_ids
-            )
+            result = _missing_data_result(metric_name, request)
+            if result is None:
+                metric_calculator = metric_registry.get(metric_name, "driver")
+                params = _driver_params(request)
+                result = await _calculate(
+                    "driver", metric_name,
+                    functools.partial(metric_calculator.calculate, **params, view=view),
+                    **params
+                )
             results.append(_convert_metric_result_to_response(result))
 
         except Exception as e:
@@ -238,20 +146,19 @@ async def calculate_multiple_driver_metrics(
 @router.post("/driver/{metric_name}")
 async def calculate_driver_metric(metric_name: str, request: MetricRequest) -> MetricResponse:
     """Calculate a specific driver metric."""
-    if metric_name not in DRIVER_METRICS:
+    if not metric_registry.has(metric_name, "driver"):
         raise HTTPException(
             status_code=404,
-            detail=f"Metric '{metric_name}' not found. Available metrics: {list(DRIVER_METRICS.keys())}"
+            detail=f"Metric '{metric_name}' not found. Available metrics: {metric_registry.names("driver")}"
         )
 
     try:
-        metric_calculator = DRIVER_METRICS[metric_name]
-        result = metric_calculator.calculate(
-            driver_id=request.driver_id,
-            constructor_id=request.constructor_id,
-            season=request.season,
-            race_ids=request.race_ids
-        )
+        result = _missing_data_result(metric_name, request)
+        if result is None:
+            metric_calculator = metric_registry.get(metric_name, "driver")
+            params = _driver_params(request)
+            result = await _calculate("driver", metric_name, functools.partial(metric_calculator.calculate, **params),
+                                      **params)
 
         return _convert_metric_result_to_response(result)
 
@@ -266,13 +173,13 @@ async def calculate_driver_metric(metric_name: str, request: MetricRequest) -> M
 @router.get("/driver/{metric_name}/info")
 async def get_metric_info(metric_name: str):
     """Get information about a specific metric."""
-    if metric_name not in DRIVER_METRICS:
+    if not metric_registry.has(metric_name, "driver"):
         raise HTTPException(
             status_code=404,
             detail=f"Metric '{metric_name}' not found"
         )
 
-    metric = DRIVER_METRICS[metric_name]
+    metric = metric_registry.get(metric_name, "driver")
     return {
         "name": metric.name,
         "description": metric.description,
@@ -296,18 +203,27 @@ async def calculate_multiple_constructor_metrics(
 
     results = []
     errors = []
+    # Every metric reads the same season slices; build them once for the request
+    view = data_loader.season_view(request.season)
 
     for metric_name in metric_names:
-        if metric_name not in CONSTRUCTOR_METRICS:
+        if not metric_registry.has(metric_name, "constructor"):
             errors.append(f"Metric '{metric_name}' not found")
             continue
 
         try:
-            metric_calculator = CONSTRUCTOR_METRICS[metric_name]
-            result = metric_calculator.calculate(
-                constructor_id=request.constructor_id,
-                season=request.season
-            )
+            result = _missing_data_result(metric_name, request)
+            if result is None:
+                metric_calculator = metric_registry.get(metric_name, "constructor")
+                params = _constructor_params(request)
+                result = await _calculate(
+                    "constructor", metric_name,
+                    functools.partial(
+                        metric_cache.get_or_compute, metric_name,
+                        functools.partial(metric_calculator.calculate, **params, view=view), **params
+                    ),
+                    **params
+                )
             results.append(_convert_metric_result_to_response(result))
 
         except Exception as e:
@@ -326,10 +242,10 @@ async def calculate_multiple_constructor_metrics(
 @router.post("/constructor/{metric_name}")
 async def calculate_constructor_metric(metric_name: str, request: MetricRequest) -> MetricResponse:
     """Calculate a specific constructor metric."""
-    if metric_name not in CONSTRUCTOR_METRICS:
+    if not metric_registry.has(metric_name, "constructor"):
         raise HTTPException(
             status_code=404,
-            detail=f"Metric '{metric_name}' not found. Available metrics: {list(CONSTRUCTOR_METRICS.keys())}"
+            detail=f"Metric '{metric_name}' not found. Available metrics: {metric_registry.names("constructor")}"
         )
 
     if not request.constructor_id:
@@ -339,11 +255,18 @@ async def calculate_constructor_metric(metric_name: str, request: MetricRequest)
         )
 
     try:
-        metric_calculator = CONSTRUCTOR_METRICS[metric_name]
-        result = metric_calculator.calculate(
-            constructor_id=request.constructor_id,
-            season=request.season
-        )
+        result = _missing_data_result(metric_name, request)
+        if result is None:
+            metric_calculator = metric_registry.get(metric_name, "constructor")
+            params = _constructor_params(request)
+            result = await _calculate(
+                "constructor", metric_name,
+                functools.partial(
+                    metric_cache.get_or_compute, metric_name,
+                    functools.partial(metric_calculator.calculate, **params), **params
+                ),
+                **params
+            )
 
         return _convert_metric_result_to_response(result)
 
@@ -358,13 +281,13 @@ async def calculate_constructor_metric(metric_name: str, request: MetricRequest)
 @router.get("/constructor/{metric_name}/info")
 async def get_constructor_metric_info(metric_name: str):
     """Get information about a specific constructor metric."""
-    if metric_name not in CONSTRUCTOR_METRICS:
+    if not metric_registry.has(metric_name, "constructor"):
         raise HTTPException(
             status_code=404,
             detail=f"Metric '{metric_name}' not found"
         )
 
-    metric = CONSTRUCTOR_METRICS[metric_name]
+    metric = metric_registry.get(metric_name, "constructor")
     return {
         "name": metric.name,
         "description": metric.description,
@@ -0,0 +1,66 @@
+"""API routes for championship standings."""
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import List
+import pandas as pd
+import logging
+
+from backend.api.schemas import StandingsProgression, StandingsSeries
+from backend.data.loader import data_loader
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/standings", tags=["standings"])
+
+
+def _values(row: pd.Series, cast) -> List:
+    """Plain Python values of a row, with ``None`` for missing ones."""
+    return [None if pd.isna(value) else cast(value) for value in row.tolist()]
+
+
+@router.get("/{season}", response_model=StandingsProgression)
+async def get_standings_progression(
+    season: int,
+    entity: str = Query("constructor", pattern="^(constructor|driver)$")
+):
+    """Get a season's championship points and positions after every round, for charting."""
+    try:
+        progression = data_loader.get_standings_progression(entity, season)
+
+        if progression.empty:
+            raise HTTPException(status_code=404, detail=f"No {entity} standings for {season}")
+
+        id_column = "constructorId" if entity == "constructor" else "driverId"
+        rounds = progression.drop_duplicates("round")[["round", "raceId"]]
+
+        # One row per entity, one column per round
+        points = progression.pivot(index=id_column, columns="round", values="points")
+        positions = progression.pivot(index=id_column, columns="round", values="position")
+        final = data_loader.get_final_standings(entity, season).set_index(id_column)["position"]
+        order = final.sort_values().index
+
+        dimension = data_loader.entities.constructors if entity == "constructor" else data_loader.entities.drivers
+        names = dimension.name_map(order)
+        series = [
+            StandingsSeries(
+                entity_id=int(entity_id),
+                name=names.get(int(entity_id)),
+                points=_values(points.loc[entity_id], float),
+                positions=_values(positions.loc[entity_id], int),
+                final_position=_values(final.loc[[entity_id]], int)[0]
+            )
+            for entity_id in order
+        ]
+
+        return StandingsProgression(
+            season=season,
+            entity=entity,
+            rounds=rounds["round"].tolist(),
+            race_ids=rounds["raceId"].tolist(),
+            series=series
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching {entity} standings for {season}: {e}")
+        raise HTTPException(status_code=500, detail="Error fetching standings")
@@ -52,6 +52,24 @@ class RaceInfo(BaseModel):
     circuit_name: Optional[str] = None
 
 
+class StandingsSeries(BaseModel):
+    """One entity's championship points and position after each round."""
+    entity_id: int
+    name: Optional[str] = None
+    points: List[Optional[float]]
+    positions: List[Optional[int]]
+    final_position: Optional[int] = None
+
+
+class StandingsProgression(BaseModel):
+    """Round-by-round championship standings of a season."""
+    season: int
+    entity: str
+    rounds: List[int]
+    race_ids: List[int]
+    series: List[StandingsSeries]
+
+
 class AvailableMetrics(BaseModel):
     """Available metrics information."""
     driver_metrics: List[str]
@@ -59,6 +77,11 @@ class AvailableMetrics(BaseModel):
     comparison_metrics: List[str]
 
 
+class IngestRequest(BaseModel):
+    """New rows of one race weekend, keyed by dataset file (e.g. ``results.csv``)."""
+    tables: Dict[str, List[Dict[str, Any]]]
+
+
 class HealthCheck(BaseModel):
     """Health check response."""
     status: str
@@ -0,0 +1,86 @@
+"""Background warm-up of the data loader and the hottest metrics."""
+
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from backend.config import WARMUP_CONSTRUCTOR_METRICS, WARMUP_DRIVER_METRICS, WARMUP_SEASON
+from backend.data.loader import data_loader
+from backend.metrics.registry import metric_registry
+
+logger = logging.getLogger(__name__)
+
+
+class Warmup:
+    """Tracks the warm-up phase that gates the ``/ready`` endpoint."""
+
+    def __init__(self):
+        self.status = "pending"
+        self.ready = False
+        self.season: Optional[int] = None
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self.duration_s: Optional[float] = None
+        self.metrics_computed = 0
+        self.error: Optional[str] = None
+
+    def skip(self) -> None:
+        """Mark the service ready without warming (warm-up disabled)."""
+        self.status = "skipped"
+        self.ready = True
+
+    def run(self, season: Optional[int] = WARMUP_SEASON,
+            driver_metrics: List[str] = WARMUP_DRIVER_METRICS,
+            constructor_metrics: List[str] = WARMUP_CONSTRUCTOR_METRICS) -> None:
+        """Preload data and precompute metrics for ``season``; blocking, run it in a thread."""
+        self.status = "running"
+        self.started_at = datetime.now().isoformat()
+        start = time.perf_counter()
+        try:
+            data_loader.warm()
+            self.season = season or data_loader.latest_season()
+
+            results = data_loader.get_race_results(self.season)
+            for constructor_id in results["constructorId"].unique().tolist():
+                for name in constructor_metrics:
+                    metric = metric_registry.get(name, "constructor")
+                    if metric is not None:
+                        metric.calculate(constructor_id, self.season)
+                        self.metrics_computed += 1
+
+            for driver_id in results["driverId"].unique().tolist():
+                for name in driver_metrics:
+                    metric = metric_registry.get(name, "driver")
+                    if metric is not None:
+                        metric.calculate(driver_id=driver_id, season=self.season)
+                        self.metrics_computed += 1
+
+            self.status = "ready"
+        except Exception as e:
+            # A failed warm-up only costs latency; never keep the service out of rotation
+            logger.error(f"Warm-up failed: {e}")
+            self.status = "failed"
+            self.error = str(e)
+        finally:
+            self.duration_s = round(time.perf_counter() - start, 2)
+            self.finished_at = datetime.now().isoformat()
+            self.ready = True
+
+        logger.info(f"Warm-up {self.status} in {self.duration_s}s ({self.metrics_computed} metrics)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "ready": self.ready,
+            "season": self.season,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration_s": self.duration_s,
+            "metrics_computed": self.metrics_computed,
+            "error": self.error
+        }
+
+
+# Global warm-up tracker
+warmup = Warmup()
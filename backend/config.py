@@ -1,5 +1,6 @@
 """Configuration settings for F1 metrics system."""
 
+import os
 from pathlib import Path
 
 # Data paths
@@ -17,6 +18,66 @@ API_BASE_URL = f"http://localhost:{API_PORT}/api/v1"
 # Data filtering
 MIN_YEAR = 2011  # Complete data availability from 2011
 
+# Full-history mode serves every season since FIRST_SEASON instead of MIN_YEAR;
+# lap time and pit stop metrics report missing data for seasons before theirs
+FULL_HISTORY = os.getenv("FULL_HISTORY", "0") == "1"
+FIRST_SEASON = 1950
+
 # Cache settings
 ENABLE_CACHE = True
-CACHE_TTL = 3600  # 1 hour in seconds
\ No newline at end of file
+CACHE_TTL = 3600  # 1 hour in seconds
+# Persistent store of cached results: "files" (one JSON file per result) or
+# "sqlite" (one WAL database with indexed metric/entity/season columns)
+CACHE_STORE = os.getenv("CACHE_STORE", "files")
+CACHE_DB_PATH = CACHE_DIR / "metric_cache.sqlite"
+# Encoding of cached results: "json", "pickle" (protocol 5) or "msgpack" (optional),
+# compressed with "zlib", "zstd" or "lz4" (optional) from CACHE_COMPRESS_MIN_BYTES on
+CACHE_SERIALIZER = os.getenv("CACHE_SERIALIZER", "json")
+CACHE_COMPRESSION = os.getenv("CACHE_COMPRESSION", "none")
+CACHE_COMPRESS_MIN_BYTES = 1024
+# Cross-process single flight: seconds a worker waits for another one computing
+# the same missing result before computing it itself, and how often it checks
+METRIC_LOCK_TIMEOUT = 30
+METRIC_LOCK_POLL_INTERVAL = 0.05
+# Live results kept in memory in front of the cache files (0 disables the tier)
+METRIC_MEMORY_CACHE_SIZE = 4096
+
+# Columnar snapshot settings (Arrow IPC copies of dataset/*.csv)
+ENABLE_SNAPSHOTS = True
+SNAPSHOT_DIR = CACHE_DIR / "snapshots"
+
+# Share the large tables between worker processes as memory-mapped columns
+ENABLE_SHARED_TABLES = True
+
+# Season partitioning of the per-lap tables (rows read per streamed chunk)
+PARTITION_CHUNK_ROWS = 100_000
+
+# Load only the columns read by the loader and the served metrics
+ENABLE_COLUMN_PRUNING = True
+
+# Derived-frame cache of the data loader (joins and aggregations)
+FRAME_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+# Engine of the aggregating loader queries: "pandas", or an embedded SQL
+# engine ("duckdb" if installed, "sqlite") that pushes the grouping down
+QUERY_ENGINE = os.getenv("QUERY_ENGINE", "pandas")
+
+# Hot reload: seconds between checks of dataset/ for changes (0 disables)
+DATASET_RELOAD_INTERVAL = 60
+
+# Token required (X-Admin-Token header) by the dataset reload and ingest
+# endpoints; unset disables them (the watcher and the ingest command still work)
+DATASET_ADMIN_TOKEN = os.getenv("DATASET_ADMIN_TOKEN")
+
+# Background warm-up after the API starts; /ready reports 503 until it is done
+ENABLE_WARMUP = True
+WARMUP_SEASON = None  # None warms the latest season in the dataset
+WARMUP_DRIVER_METRICS = ["points_per_race", "average_finish_position", "qualifying_position_average"]
+WARMUP_CONSTRUCTOR_METRICS = [
+    "constructor_championship_position", "constructor_points_per_race", "constructor_win_rate",
+    "constructor_podium_rate", "constructor_dnf_rate", "constructor_average_pit_stop_time",
+    "constructor_average_lap_time",
+]
+
+# Metric families served by this worker; e.g. METRIC_FAMILIES=constructor for a slim worker
+METRIC_FAMILIES = os.getenv("METRIC_FAMILIES", "driver,constructor").split(",")
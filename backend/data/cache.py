@@ -1,24 +1,129 @@
 """Simple caching system for metric results."""
 
 import json
+import functools
 import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
-from datetime import datetime, timedelta
 import logging
-from backend.config import CACHE_DIR, ENABLE_CACHE, CACHE_TTL
+from backend.config import CACHE_DIR, CACHE_STORE, ENABLE_CACHE, CACHE_TTL, METRIC_MEMORY_CACHE_SIZE
+from backend.data.cache_store import create_store, entry_affected
+from backend.data.flight import FlightLocks
 
 logger = logging.getLogger(__name__)
 
 
-class MetricCache:
-    """Simple file-based cache for metric results."""
+def _dataset_version() -> Optional[str]:
+    """Version of the dataset being served, recorded with each stored result."""
+    from backend.data.loader import data_loader
+    return data_loader.dataset_version
+
 
-    def __init__(self):
-        self.cache_dir = CACHE_DIR
-        self.cache_dir.mkdir(exist_ok=True)
+class MetricCache:
+    """Persistent cache for metric results with an in-memory LRU tier in front.
+
+    The memory tier holds live results (no store access or JSON parsing on a
+    hit), bounded by ``memory_size`` entries and expired by the same TTL as
+    the store. Writes go to both tiers. Each worker process has its own
+    memory tier; the store (files or SQLite, see ``cache_store.py``) is shared.
+
+    Clears and invalidations also touch a shared generation file; a worker
+    seeing it change drops its whole memory tier, so results cleared by
+    another worker are not served from memory.
+    """
+
+    def __init__(self, store: str = CACHE_STORE, memory_size: int = METRIC_MEMORY_CACHE_SIZE,
+                 generation_path: Path = CACHE_DIR / "generation"):
+        self.store = create_store(store)
+        self.flights = FlightLocks()
         self.enabled = ENABLE_CACHE
         self.ttl = CACHE_TTL
+        self.memory_size = memory_size
+        # key -> (result, stored at (epoch seconds), metric name, parameters)
+        self._memory: OrderedDict[str, Tuple[Any, float, str, Dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.memory_misses = 0
+        self.memory_evictions = 0
+        self.generation_path = generation_path
+        self._generation = self._read_generation()
+
+    def _read_generation(self) -> int:
+        """Modification time (ns) of the generation file, 0 before the first clear."""
+        try:
+            return self.generation_path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def _bump_generation(self) -> None:
+        """Tell every worker that stored results were removed."""
+        try:
+            self.generation_path.parent.mkdir(parents=True, exist_ok=True)
+            generation = max(time.time_ns(), self._read_generation() + 1)
+            self.generation_path.touch()
+            os.utime(self.generation_path, ns=(generation, generation))
+            with self._lock:
+                self._generation = generation
+        except OSError as e:
+            logger.warning(f"Could not update the cache generation: {e}")
+
+    def _remember(self, key: str, result: Any, stored_at: float, metric_name: str,
+                  params: Dict[str, Any]) -> None:
+        """Put a result in the memory tier, evicting the least recently used beyond its size."""
+        if self.memory_size <= 0:
+            return
+
+        with self._lock:
+            self._memory.pop(key, None)
+            self._memory[key] = (result, stored_at, metric_name, params)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+                self.memory_evictions += 1
+
+    def _recall(self, key: str) -> Optional[Any]:
+        """Get a live, unexpired result from the memory tier."""
+        if self.memory_size <= 0:
+            return None
+
+        generation = self._read_generation()
+        with self._lock:
+            if generation != self._generation:
+                # Another worker cleared or invalidated results
+                self._memory.clear()
+                self._generation = generation
+
+            entry = self._memory.get(key)
+            if entry is None:
+                self.memory_misses += 1
+                return None
+
+            if time.time() - entry[1] > self.ttl:
+                del self._memory[key]
+                self.memory_misses += 1
+                return None
+
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return entry[0]
+
+    def _forget(self, metric_names: Optional[Set[str]] = None, seasons: Optional[Set[int]] = None,
+                race_ids: Optional[Set[int]] = None) -> None:
+        """Drop memory entries of ``metric_names`` (all if ``None``) affected by the changed races."""
+        with self._lock:
+            if metric_names is None:
+                self._memory.clear()
+                return
+
+            stale = [key for key, (_, _, name, params) in self._memory.items()
+                     if name in metric_names and entry_affected(params, seasons, race_ids)]
+            for key in stale:
+                del self._memory[key]
 
     def _generate_key(self, metric_name: str, **kwargs) -> str:
         """Generate a unique cache key from metric name and parameters."""
@@ -29,10 +134,6 @@ class MetricCache:
         # Generate hash
         return hashlib.sha256(combined.encode()).hexdigest()[:16]
 
-    def _get_cache_path(self, key: str) -> Path:
-        """Get the cache file path for a given key."""
-        return self.cache_dir / f"{key}.json"
-
     def get(self, metric_name: str, **kwargs) -> Optional[Any]:
         """Retrieve cached result if available and not expired."""
         if not self.enabled:
@@ -40,35 +141,53 @@ class MetricCache:
 
         try:
             key = self._generate_key(metric_name, **kwargs)
-            cache_path = self._get_cache_path(key)
+            result = self._recall(key)
+            if result is not None:
+                return result
 
-            if not cache_path.exists():
+            entry = self.store.read(key, _dataset_version())
+            if entry is None:
                 return None
 
             # Check if cache is expired
-            cache_time = datetime.fromtimestamp(cache_path.stat().st_mtime)
-            if datetime.now() - cache_time > timedelta(seconds=self.ttl):
-                cache_path.unlink()  # Remove expired cache
+            data, stored_at = entry
+            if time.time() - stored_at > self.ttl:
+                self.store.delete(key)  # Remove expired cache
                 return None
 
-            # Load and return cached data
-            with open(cache_path, 'r') as f:
-                data = json.load(f)
-
             logger.debug(f"Cache hit for {metric_name}")
 
             # Reconstruct MetricResult if needed
-            result_data = data['result']
+            result = data['result']
             if data.get('result_type') == 'MetricResult':
                 from backend.metrics.base import MetricResult
-                return MetricResult(**result_data)
+                result = MetricResult(**result)
 
-            return result_data
+            # Expires with the stored entry it was read from
+            self._remember(key, result, stored_at, metric_name, kwargs)
+            return result
 
         except Exception as e:
             logger.warning(f"Cache retrieval failed for {metric_name}: {e}")
             return None
 
+    @staticmethod
+    def document(metric_name: str, result: Any, **kwargs) -> Dict[str, Any]:
+        """The document a result is stored as."""
+        # Convert MetricResult to a plain dict for serialization
+        if hasattr(result, '__dict__'):
+            result_dict = result.__dict__
+        else:
+            result_dict = result
+
+        return {
+            'metric_name': metric_name,
+            'result': result_dict,
+            'result_type': type(result).__name__,
+            'cached_at': datetime.now().isoformat(),
+            'parameters': kwargs
+        }
+
     def set(self, metric_name: str, result: Any, **kwargs) -> None:
         """Store result in cache."""
         if not self.enabled:
@@ -76,73 +195,87 @@ class MetricCache:
 
         try:
             key = self._generate_key(metric_name, **kwargs)
-            cache_path = self._get_cache_path(key)
-
-            # Convert MetricResult to dict for JSON serialization
-            if hasattr(result, '__dict__'):
-                result_dict = result.__dict__
-            else:
-                result_dict = result
-
-            cache_data = {
-                'metric_name': metric_name,
-                'result': result_dict,
-                'result_type': type(result).__name__,
-                'cached_at': datetime.now().isoformat(),
-                'parameters': kwargs
-            }
-
-            with open(cache_path, 'w') as f:
-                json.dump(cache_data, f, default=str, indent=2)
+            self._remember(key, result, time.time(), metric_name, kwargs)
+            self.store.write(key, self.document(metric_name, result, **kwargs), _dataset_version())
 
             logger.debug(f"Cached result for {metric_name}")
 
         except Exception as e:
             logger.warning(f"Cache storage failed for {metric_name}: {e}")
 
+    @contextmanager
+    def single_flight(self, metric_name: str, **kwargs) -> Iterator[Optional[Any]]:
+        """Yield the cached result, or ``None`` while holding the right to compute it.
+
+        On a miss the key's lock is taken (see ``flight.py``), waiting while
+        another process computes the same result, and the cache is checked
+        again. If it still misses, the caller computes the result and stores it
+        with ``set`` before leaving the block; other processes wait until then.
+        """
+        result = self.get(metric_name, **kwargs)
+        if result is not None or not self.enabled:
+            yield result
+            return
+
+        with self.flights.hold(self._generate_key(metric_name, **kwargs)):
+            yield self.get(metric_name, **kwargs)
+
+    def get_or_compute(self, metric_name: str, compute: Callable[[], Any], **kwargs) -> Any:
+        """Get a cached result, computing and storing it once across processes on a miss."""
+        with self.single_flight(metric_name, **kwargs) as result:
+            if result is None:
+                result = compute()
+                self.set(metric_name, result, **kwargs)
+        return result
+
     def clear(self, metric_name: Optional[str] = None) -> None:
-        """Clear cache files. If metric_name provided, clear only that metric."""
+        """Clear cached results. If metric_name provided, clear only that metric."""
+        self._forget({metric_name} if metric_name else None)
         try:
-            if metric_name:
-                # Clear specific metric (would need to track by prefix)
-                for cache_file in self.cache_dir.glob("*.json"):
-                    try:
-                        with open(cache_file, 'r') as f:
-                            data = json.load(f)
-                        if data.get('metric_name') == metric_name:
-                            cache_file.unlink()
-                    except:
-                        continue
-            else:
-                # Clear all cache files
-                for cache_file in self.cache_dir.glob("*.json"):
-                    cache_file.unlink()
-
+            self.store.clear(metric_name)
+            self._bump_generation()
             logger.info(f"Cache cleared for {metric_name or 'all metrics'}")
 
         except Exception as e:
             logger.warning(f"Cache clearing failed: {e}")
 
+    def invalidate(self, metric_names: Iterable[str], seasons: Optional[Set[int]] = None,
+                   race_ids: Optional[Set[int]] = None) -> int:
+        """Remove cached results of ``metric_names`` that depend on changed races.
+
+        An entry is affected when it covers all seasons, one of ``seasons``, or
+        explicitly requested one of ``race_ids``. ``seasons=None`` means every
+        entry of the given metrics is affected. Returns the number removed.
+        """
+        metric_names = set(metric_names)
+        if not metric_names:
+            return 0
+
+        self._forget(metric_names, seasons, race_ids)
+        removed = self.store.invalidate(metric_names, seasons, race_ids)
+        self._bump_generation()
+
+        logger.info(f"Invalidated {removed} cached results for {len(metric_names)} metrics")
+        return removed
+
     def get_stats(self) -> dict:
         """Get cache statistics."""
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
-            total_files = len(cache_files)
-            total_size = sum(f.stat().st_size for f in cache_files)
-
-            # Count expired files
-            expired_count = 0
-            for cache_file in cache_files:
-                cache_time = datetime.fromtimestamp(cache_file.stat().st_mtime)
-                if datetime.now() - cache_time > timedelta(seconds=self.ttl):
-                    expired_count += 1
-
             return {
                 'enabled': self.enabled,
                 'ttl_seconds': self.ttl,
-                'total_files': total_files,
-                'total_size_bytes': total_size,
-                'expired_files': expired_count
+                'store': self.store.name,
+                'serializer': self.store.serializer.format,
+                'compression': self.store.serializer.compression,
+                **self.store.stats(self.ttl),
+                'memory': {
+                    'max_entries': self.memory_size,
+                    'entries': len(self._memory),
+                    'hits': self.memory_hits,
+                    'misses': self.memory_misses,
+                    'evictions': self.memory_evictions
+                },
+                'locks': self.flights.get_stats()
             }
 
         except Exception as e:
@@ -151,4 +284,22 @@ class MetricCache:
 
 
 # Global instance
-metric_cache = MetricCache()
\ No newline at end of file
+metric_cache = MetricCache()
+
+
+def single_flight_calculation(calculate: Callable) -> Callable:
+    """Decorate a driver metric's caching ``calculate`` so one process computes each miss.
+
+    The result is keyed like the metric's own ``cache_key``; when another
+    process already computed it, the metric's ``metric_cache.get`` returns it.
+    """
+    @functools.wraps(calculate)
+    def wrapper(self, driver_id: Optional[int] = None, constructor_id: Optional[int] = None,
+                season: Optional[int] = None, race_ids: Optional[List[int]] = None, **kwargs):
+        with metric_cache.single_flight(self.name, driver_id=driver_id, constructor_id=constructor_id,
+                                        season=season, race_ids=race_ids) as cached_result:
+            if cached_result is not None:
+                return cached_result
+            return calculate(self, driver_id, constructor_id, season, race_ids, **kwargs)
+
+    return wrapper
\ No newline at end of file
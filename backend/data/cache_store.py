@@ -0,0 +1,273 @@
+"""Persistent stores of the metric result cache.
+
+``MetricCache`` keeps its entries in one of two stores, chosen by
+``CACHE_STORE``:
+
+- ``files``: one file per entry in ``CACHE_DIR`` (``.json``, or ``.bin``
+  with a binary serializer), recording the dataset version in the entry.
+  Clearing one metric or collecting stats reads every file.
+- ``sqlite``: one SQLite database in WAL mode (``CACHE_DB_PATH``) with the
+  metric name, entity IDs, season, requested races, dataset version and
+  creation time as indexed columns next to the payload, so targeted clears,
+  invalidations and stats are single queries. Worker processes share it.
+
+In both stores entries written for another dataset version read as misses,
+so results of the previous dataset are not served after a restart on a new
+one.
+
+An entry is the document ``MetricCache`` builds (``metric_name``,
+``result``, ``result_type``, ``cached_at`` and ``parameters``), encoded by
+a ``PayloadSerializer`` (see ``serializer.py``).
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from backend.config import CACHE_DB_PATH, CACHE_DIR
+from backend.data.serializer import PayloadSerializer
+
+logger = logging.getLogger(__name__)
+
+CACHE_STORES = ["files", "sqlite"]
+
+
+def entry_affected(params: Dict[str, Any], seasons: Optional[Set[int]],
+                   race_ids: Optional[Set[int]]) -> bool:
+    """Whether an entry cached for ``params`` depends on the changed seasons or races."""
+    if seasons is None:
+        return True
+    entry_races = set(params.get('race_ids') or [])
+    all_seasons = params.get('season') is None and not entry_races
+    return bool(all_seasons or params.get('season') in seasons or entry_races & (race_ids or set()))
+
+
+class FileStore:
+    """Cache entries as one file each."""
+
+    name = "files"
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, serializer: Optional[PayloadSerializer] = None):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(exist_ok=True)
+        self.serializer = serializer or PayloadSerializer()
+        self.suffix = ".bin" if self.serializer.binary else ".json"
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def _files(self) -> Iterator[Path]:
+        """Entry files of every serializer setting."""
+        yield from self.cache_dir.glob("*.json")
+        yield from self.cache_dir.glob("*.bin")
+
+    def _load(self, cache_path: Path) -> Dict[str, Any]:
+        return self.serializer.loads(cache_path.read_bytes())
+
+    def read(self, key: str, dataset_version: Optional[str] = None) -> Optional[Tuple[Dict[str, Any], float]]:
+        """The entry stored under ``key`` for ``dataset_version`` and when it was written, or ``None``."""
+        cache_path = self._path(key)
+        if not cache_path.exists():
+            return None
+
+        stored_at = cache_path.stat().st_mtime
+        data = self._load(cache_path)
+        if data.pop('dataset_version', None) != dataset_version:
+            return None
+        return data, stored_at
+
+    def write(self, key: str, data: Dict[str, Any], dataset_version: Optional[str] = None) -> None:
+        """Store an entry under ``key``.
+
+        The file is written aside and renamed into place, so readers never
+        see a partial entry and concurrent writers of a key never interleave.
+        """
+        cache_path = self._path(key)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(self.serializer.dumps({**data, 'dataset_version': dataset_version}))
+            os.replace(tmp_path, cache_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under ``key``."""
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self, metric_name: Optional[str] = None) -> None:
+        """Remove every entry, or only those of ``metric_name``."""
+        for cache_file in self._files():
+            try:
+                if metric_name:
+                    data = self._load(cache_file)
+                    if data.get('metric_name') != metric_name:
+                        continue
+                cache_file.unlink()
+            except Exception:
+                continue
+
+    def invalidate(self, metric_names: Set[str], seasons: Optional[Set[int]],
+                   race_ids: Optional[Set[int]]) -> int:
+        """Remove the entries of ``metric_names`` affected by the changed races."""
+        removed = 0
+        for cache_file in self._files():
+            try:
+                data = self._load(cache_file)
+                if data.get('metric_name') not in metric_names:
+                    continue
+                if not entry_affected(data.get('parameters', {}), seasons, race_ids):
+                    continue
+
+                cache_file.unlink()
+                removed += 1
+            except Exception:
+                continue
+        return removed
+
+    def stats(self, ttl: int) -> Dict[str, Any]:
+        """Entry count, size and expired count."""
+        cache_files = list(self._files())
+        now = time.time()
+        file_stats = [f.stat() for f in cache_files]
+        return {
+            'total_files': len(cache_files),
+            'total_size_bytes': sum(stat.st_size for stat in file_stats),
+            'expired_files': sum(1 for stat in file_stats if now - stat.st_mtime > ttl)
+        }
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metric_cache (
+    key TEXT PRIMARY KEY,
+    metric_name TEXT NOT NULL,
+    driver_id INTEGER,
+    constructor_id INTEGER,
+    season INTEGER,
+    race_ids TEXT,
+    dataset_version TEXT,
+    created_at REAL NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_metric_cache_metric_season ON metric_cache (metric_name, season);
+CREATE INDEX IF NOT EXISTS idx_metric_cache_driver ON metric_cache (driver_id);
+CREATE INDEX IF NOT EXISTS idx_metric_cache_constructor ON metric_cache (constructor_id);
+CREATE INDEX IF NOT EXISTS idx_metric_cache_created_at ON metric_cache (created_at);
+"""
+
+
+def _placeholders(values: Iterable[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    return int(value) if value is not None else None
+
+
+class SqliteStore:
+    """Cache entries as rows of one SQLite database in WAL mode.
+
+    Each process opens its own connection on first use (also after a
+    fork); the connection is shared by the process's threads under a lock.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, db_path: Path = CACHE_DB_PATH, serializer: Optional[PayloadSerializer] = None):
+        self.db_path = db_path
+        self.serializer = serializer or PayloadSerializer()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def _execute(self, sql: str, params: Iterable[Any] = ()) -> int:
+        """Run a statement; returns the number of rows it changed."""
+        with self._lock:
+            return self._connection().execute(sql, tuple(params)).rowcount
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[Tuple]:
+        with self._lock:
+            return self._connection().execute(sql, tuple(params)).fetchall()
+
+    def read(self, key: str, dataset_version: Optional[str] = None) -> Optional[Tuple[Dict[str, Any], float]]:
+        """The entry stored under ``key`` for ``dataset_version`` and when it was written, or ``None``."""
+        rows = self._query("SELECT payload, created_at FROM metric_cache WHERE key = ? AND dataset_version IS ?",
+                           (key, dataset_version))
+        if not rows:
+            return None
+        return self.serializer.loads(rows[0][0]), rows[0][1]
+
+    def write(self, key: str, data: Dict[str, Any], dataset_version: Optional[str] = None) -> None:
+        """Store an entry under ``key``, replacing any previous one."""
+        params = data.get('parameters', {})
+        race_ids = sorted(int(race_id) for race_id in params.get('race_ids') or [])
+        self._execute(
+            "INSERT OR REPLACE INTO metric_cache (key, metric_name, driver_id, constructor_id, season, "
+            "race_ids, dataset_version, created_at, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, data['metric_name'], _optional_int(params.get('driver_id')),
+             _optional_int(params.get('constructor_id')), _optional_int(params.get('season')),
+             json.dumps(race_ids) if race_ids else None, dataset_version, time.time(),
+             self.serializer.dumps(data))
+        )
+
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under ``key``."""
+        self._execute("DELETE FROM metric_cache WHERE key = ?", (key,))
+
+    def clear(self, metric_name: Optional[str] = None) -> None:
+        """Remove every entry, or only those of ``metric_name``."""
+        if metric_name:
+            self._execute("DELETE FROM metric_cache WHERE metric_name = ?", (metric_name,))
+        else:
+            self._execute("DELETE FROM metric_cache")
+
+    def invalidate(self, metric_names: Set[str], seasons: Optional[Set[int]],
+                   race_ids: Optional[Set[int]]) -> int:
+        """Remove the entries of ``metric_names`` affected by the changed races (see ``entry_affected``)."""
+        names = sorted(metric_names)
+        sql = f"DELETE FROM metric_cache WHERE metric_name IN ({_placeholders(names)})"
+        params = list(names)
+        if seasons is not None:
+            races = sorted(int(race_id) for race_id in race_ids or ())
+            sql += (f" AND ((season IS NULL AND race_ids IS NULL)"
+                    f" OR season IN ({_placeholders(seasons)})"
+                    f" OR EXISTS (SELECT 1 FROM json_each(metric_cache.race_ids)"
+                    f" WHERE value IN ({_placeholders(races)})))")
+            params += sorted(seasons) + races
+        return self._execute(sql, params)
+
+    def stats(self, ttl: int) -> Dict[str, Any]:
+        """Entry count, size and expired count."""
+        count, size, expired = self._query(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(payload)), 0), COUNT(*) FILTER (WHERE created_at < ?) "
+            "FROM metric_cache", (time.time() - ttl,)
+        )[0]
+        return {
+            'database': str(self.db_path),
+            'total_entries': count,
+            'total_size_bytes': size,
+            'expired_entries': expired
+        }
+
+
+def create_store(name: str, serializer: Optional[PayloadSerializer] = None) -> Union[FileStore, SqliteStore]:
+    """The cache store called ``name`` (see ``CACHE_STORES``); unknown names fall back to files."""
+    if name == "sqlite":
+        return SqliteStore(serializer=serializer)
+    if name != "files":
+        logger.warning(f"Unknown cache store {name}, using files")
+    return FileStore(serializer=serializer)
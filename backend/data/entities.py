@@ -0,0 +1,60 @@
+"""In-memory registry of drivers, constructors, races and circuits.
+
+Resolving a name used to mean scanning (and copying) a dimension table per
+lookup. Each dimension is instead reduced once per dataset version to a
+sorted ID array and a parallel name array, so single lookups are a dict
+hit and batch lookups a single ``searchsorted``.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class EntityDimension:
+    """ID -> display name mapping of one dimension table."""
+
+    def __init__(self, ids: pd.Series, names: pd.Series):
+        order = np.argsort(ids.to_numpy(), kind="stable")
+        self.ids = ids.to_numpy()[order]
+        self._names = names.astype(object).where(names.notna(), None).to_numpy()[order]
+        self._lookup: Dict[int, Optional[str]] = dict(zip(self.ids.tolist(), self._names.tolist(), strict=True))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return int(entity_id) in self._lookup
+
+    def name(self, entity_id: Optional[int]) -> Optional[str]:
+        """Name of one entity, or ``None`` if it is unknown."""
+        if entity_id is None:
+            return None
+        return self._lookup.get(int(entity_id))
+
+    def names(self, entity_ids: Iterable[int]) -> List[Optional[str]]:
+        """Names of many entities at once, ``None`` for unknown IDs."""
+        entity_ids = np.asarray(list(entity_ids) if not isinstance(entity_ids, np.ndarray) else entity_ids)
+        if len(entity_ids) == 0 or len(self.ids) == 0:
+            return [None] * len(entity_ids)
+
+        slots = np.minimum(np.searchsorted(self.ids, entity_ids), len(self.ids) - 1)
+        found = self.ids[slots] == entity_ids
+        return np.where(found, self._names[slots], None).tolist()
+
+    def name_map(self, entity_ids: Iterable[int]) -> Dict[int, Optional[str]]:
+        """Batch lookup as an ``{id: name}`` dict."""
+        entity_ids = [int(entity_id) for entity_id in entity_ids]
+        return dict(zip(entity_ids, self.names(entity_ids), strict=True))
+
+
+class EntityRegistry:
+    """Name dimensions of one dataset version."""
+
+    def __init__(self, drivers: pd.DataFrame, constructors: pd.DataFrame,
+                 races: pd.DataFrame, circuits: pd.DataFrame):
+        self.drivers = EntityDimension(drivers["driverId"], drivers["forename"] + " " + drivers["surname"])
+        self.constructors = EntityDimension(constructors["constructorId"], constructors["name"])
+        self.races = EntityDimension(races["raceId"], races["name"])
+        self.circuits = EntityDimension(circuits["circuitId"], circuits["name"])
@@ -0,0 +1,100 @@
+"""Single-flight computation of cached metric results across worker processes.
+
+After a cache clear, a burst of identical requests spread over several
+uvicorn workers would have every worker compute the same result. On a
+cache miss ``MetricCache.single_flight`` takes a per-key lock file under
+``CACHE_DIR/locks/`` first, so one process computes and stores the result
+while the others wait for it (up to ``METRIC_LOCK_TIMEOUT`` seconds, after
+which they compute it themselves) and then read it from the cache.
+
+Locks are ``flock`` locks, released by the OS if the holder dies. Lock
+files are left in place: unlinking one could let two processes lock
+different files for the same key. Without ``fcntl`` (Windows) every
+process computes on a miss, as before.
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - no cross-process locks on Windows
+    fcntl = None
+
+from backend.config import CACHE_DIR, METRIC_LOCK_POLL_INTERVAL, METRIC_LOCK_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class FlightLocks:
+    """Per-key lock files held while a cache miss is being computed."""
+
+    def __init__(self, lock_dir: Path = CACHE_DIR / "locks", timeout: float = METRIC_LOCK_TIMEOUT,
+                 poll_interval: float = METRIC_LOCK_POLL_INTERVAL):
+        self.lock_dir = lock_dir
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.enabled = fcntl is not None
+        self._counter_lock = threading.Lock()
+        self.acquired = 0
+        self.waited = 0
+        self.timeouts = 0
+
+    def _count(self, counter: str) -> None:
+        with self._counter_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @contextmanager
+    def hold(self, key: str) -> Iterator[None]:
+        """Hold the lock of ``key``, waiting while another process or thread holds it.
+
+        Gives up waiting after ``timeout`` seconds and runs the block unlocked.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_dir / f"{key}.lock", os.O_CREAT | os.O_RDWR, 0o644)
+        locked = False
+        try:
+            deadline = time.monotonic() + self.timeout
+            waited = False
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    locked = True
+                    break
+                except BlockingIOError:
+                    waited = True
+                    if time.monotonic() >= deadline:
+                        break
+                    time.sleep(self.poll_interval)
+
+            if locked:
+                self._count("acquired")
+            else:
+                self._count("timeouts")
+                logger.warning(f"Gave up waiting {self.timeout}s for cache key {key}, computing it")
+            if waited:
+                self._count("waited")
+
+            yield
+        finally:
+            if locked:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Lock counters: acquired, had to wait for another holder, gave up waiting."""
+        return {
+            'enabled': self.enabled,
+            'acquired': self.acquired,
+            'waited': self.waited,
+            'timeouts': self.timeouts
+        }
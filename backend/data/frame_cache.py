@@ -0,0 +1,132 @@
+"""Bounded cache for frames derived by the data loader."""
+
+import functools
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+from backend.config import FRAME_CACHE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+FrameKey = Tuple[Hashable, ...]
+
+
+def _canonical(name: str, value: Any) -> Hashable:
+    """Normalize an argument so equivalent requests share a cache entry."""
+    if name == "race_ids":
+        # Order and duplicates of the requested races never change the frame
+        return frozenset(int(race_id) for race_id in value) if value else None
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    return int(value)
+
+
+def frame_key(kind: str, **params: Any) -> FrameKey:
+    """Build the canonical key of a derived frame, e.g. (kind, season, constructor)."""
+    return (kind,) + tuple((name, _canonical(name, value)) for name, value in sorted(params.items()))
+
+
+class FrameCache:
+    """LRU cache of derived frames bounded by their total in-memory size."""
+
+    def __init__(self, max_bytes: int = FRAME_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._frames: OrderedDict[FrameKey, Tuple[pd.DataFrame, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: FrameKey) -> Optional[pd.DataFrame]:
+        """Return a shallow copy of the cached frame, or ``None`` on a miss."""
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return entry[0].copy(deep=False)
+
+    def put(self, key: FrameKey, frame: pd.DataFrame) -> None:
+        """Store ``frame``, evicting least recently used frames beyond the budget."""
+        nbytes = int(frame.memory_usage(deep=True).sum())
+        if nbytes > self.max_bytes:
+            logger.debug(f"Frame {key[0]} ({nbytes} bytes) exceeds the cache budget")
+            return
+
+        with self._lock:
+            previous = self._frames.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= previous[1]
+
+            self._frames[key] = (frame, nbytes)
+            self.size_bytes += nbytes
+
+            while self.size_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._frames.popitem(last=False)
+                self.size_bytes -= evicted_bytes
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached frame (counters are kept)."""
+        with self._lock:
+            self._frames.clear()
+            self.size_bytes = 0
+
+    def retained(self, keep: Callable[[FrameKey], bool]) -> "FrameCache":
+        """New cache holding the frames whose key satisfies ``keep``, in LRU order."""
+        cache = FrameCache(self.max_bytes)
+        with self._lock:
+            for key, (frame, nbytes) in self._frames.items():
+                if keep(key):
+                    cache._frames[key] = (frame, nbytes)
+                    cache.size_bytes += nbytes
+        return cache
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._frames),
+                "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None
+            }
+
+
+def cached_frame(kind: str) -> Callable:
+    """Cache a loader method's frame in ``self.frame_cache`` keyed by its arguments."""
+    def decorator(method: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs) -> pd.DataFrame:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = {name: value for name, value in bound.arguments.items() if name != "self"}
+            key = frame_key(kind, **params)
+
+            # Bind the cache first: a frame computed while the loader swaps
+            # datasets must not be stored under the new version
+            cache = self.frame_cache
+            frame = cache.get(key)
+            if frame is None:
+                frame = method(self, *args, **kwargs)
+                cache.put(key, frame)
+                frame = frame.copy(deep=False)
+            return frame
+
+        return wrapper
+    return decorator
@@ -0,0 +1,134 @@
+"""Group-offset indexes over loaded dataset tables."""
+
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+Keys = Union[int, Iterable[int], slice, None]
+
+
+class GroupIndex:
+    """Maps each distinct value of a column to the row positions holding it.
+
+    Rows are stably argsorted by the column once; each key then owns the
+    contiguous ``[start, end)`` slice of that ordering. Because the sort is
+    stable, every slice lists its row positions in ascending order.
+    """
+
+    def __init__(self, values: np.ndarray):
+        # int32 positions halve the private per-worker cost of every index
+        order = np.argsort(values, kind="stable")
+        self._order = order.astype(np.int32) if len(values) < 2**31 else order
+        self.keys, starts = np.unique(values[self._order], return_index=True)
+        self._starts = starts
+        self._ends = np.append(starts[1:], len(values))
+        self._slots: Dict[int, int] = {int(key): slot for slot, key in enumerate(self.keys)}
+
+    def extended(self, values: np.ndarray, offset: int) -> "GroupIndex":
+        """Index of the column with ``values`` appended at row ``offset`` onwards.
+
+        The existing ordering is spliced instead of re-sorted: appended rows
+        come after every existing row, so each one goes to the end of its
+        key's slice and every slice stays in ascending row order.
+        """
+        order = np.argsort(values, kind="stable")
+        sorted_values = values[order]
+        bounds = np.append(self._starts, len(self._order))
+        insert_at = bounds[np.searchsorted(self.keys, sorted_values, side="right")]
+
+        index = GroupIndex.__new__(GroupIndex)
+        index._order = np.insert(self._order, insert_at, (order + offset).astype(self._order.dtype))
+        index.keys = np.union1d(self.keys, sorted_values)
+
+        counts = np.zeros(len(index.keys), dtype=np.intp)
+        counts[np.searchsorted(index.keys, self.keys)] += self._ends - self._starts
+        np.add.at(counts, np.searchsorted(index.keys, sorted_values), 1)
+        index._ends = np.cumsum(counts)
+        index._starts = index._ends - counts
+        index._slots = {int(key): slot for slot, key in enumerate(index.keys)}
+        return index
+
+    def positions(self, key: int) -> np.ndarray:
+        """Row positions for a single key."""
+        slot = self._slots.get(int(key))
+        if slot is None:
+            return np.empty(0, dtype=np.intp)
+        return self._order[self._starts[slot]:self._ends[slot]]
+
+    def positions_for(self, keys: Iterable[int]) -> np.ndarray:
+        """Row positions for any of ``keys``, in ascending row order."""
+        slots = sorted({self._slots[int(k)] for k in keys if int(k) in self._slots})
+        if not slots:
+            return np.empty(0, dtype=np.intp)
+        if len(slots) == 1:
+            return self.positions(int(self.keys[slots[0]]))
+
+        parts = [self._order[self._starts[s]:self._ends[s]] for s in slots]
+        return np.sort(np.concatenate(parts))
+
+    def positions_between(self, low: Optional[int] = None, high: Optional[int] = None) -> np.ndarray:
+        """Row positions whose key lies in the inclusive range ``[low, high]``."""
+        first = 0 if low is None else int(np.searchsorted(self.keys, low, side="left"))
+        last = len(self.keys) if high is None else int(np.searchsorted(self.keys, high, side="right"))
+        if first >= last:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(self._order[self._starts[first]:self._ends[last - 1]])
+
+
+class TableIndex:
+    """Group indexes on the key columns of one table."""
+
+    def __init__(self, df: pd.DataFrame, columns: List[str]):
+        self.size = len(df)
+        self.columns: Dict[str, GroupIndex] = {
+            column: GroupIndex(df[column].to_numpy())
+            for column in columns if column in df.columns
+        }
+
+    def extended(self, rows: pd.DataFrame) -> "TableIndex":
+        """Index of the table with ``rows`` appended, without re-sorting the existing rows."""
+        index = TableIndex.__new__(TableIndex)
+        index.size = self.size + len(rows)
+        index.columns = {column: group.extended(rows[column].to_numpy(), self.size)
+                         for column, group in self.columns.items()}
+        return index
+
+    def lookup(self, **criteria: Keys) -> Optional[np.ndarray]:
+        """Row positions matching every given criterion.
+
+        Each criterion is a column name mapped to a single key, a collection
+        of keys or a ``slice(low, high)`` of keys (inclusive, either end open);
+        ``None`` means "no filter". Returns ``None`` when no criterion applies,
+        so callers can skip the row selection entirely.
+        """
+        result: Optional[np.ndarray] = None
+
+        for column, keys in criteria.items():
+            if keys is None:
+                continue
+
+            index = self.columns[column]
+            if isinstance(keys, (int, np.integer)):
+                positions = index.positions(keys)
+            elif isinstance(keys, slice):
+                positions = index.positions_between(keys.start, keys.stop)
+            else:
+                positions = index.positions_for(keys)
+
+            if result is None:
+                result = positions
+            else:
+                result = np.intersect1d(result, positions, assume_unique=True)
+
+            if len(result) == 0:
+                break
+
+        return result
+
+    @staticmethod
+    def select(df: pd.DataFrame, positions: Optional[np.ndarray]) -> pd.DataFrame:
+        """Apply the result of :meth:`lookup` to ``df``."""
+        if positions is None:
+            return df
+        return df.take(positions)
@@ -0,0 +1,49 @@
+"""Ingest a new race weekend without rebuilding the dataset.
+
+Run ``python -m backend.data.ingest <directory>`` where the directory holds
+dataset-format CSVs (``results.csv``, ``qualifying.csv``, ``lap_times.csv``,
+...) with only the new race's rows. They are appended as a segment next to
+the base snapshots (see ``backend/data/segments.py``); running API workers
+apply it at their next reload poll, or right away on
+``POST /api/v1/dataset/reload``. ``POST /api/v1/dataset/ingest`` ingests
+rows posted as JSON instead.
+"""
+
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+from backend.data.schema import read_table
+from backend.data.segments import INGEST_TABLES
+
+logger = logging.getLogger(__name__)
+
+
+def read_race_tables(directory: Path) -> Dict[str, pd.DataFrame]:
+    """Parse the per-race CSVs of a race weekend directory."""
+    tables = {}
+    for csv_path in sorted(directory.glob("*.csv")):
+        if csv_path.name not in INGEST_TABLES:
+            raise ValueError(f"{csv_path.name} cannot be ingested; expected one of {INGEST_TABLES}")
+        tables[csv_path.name] = read_table(csv_path)
+    return tables
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+
+    if len(sys.argv) != 2:
+        raise SystemExit("Usage: python -m backend.data.ingest <directory>")
+
+    from backend.data.loader import data_loader
+
+    start = time.perf_counter()
+    try:
+        change = data_loader.ingest(read_race_tables(Path(sys.argv[1])))
+    except ValueError as e:
+        raise SystemExit(f"Ingest failed: {e}") from e
+    logger.info(f"Ingested {change.to_dict()} in {(time.perf_counter() - start) * 1000:.0f} ms")
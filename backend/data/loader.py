@@ -1,90 +1,479 @@
 """F1 data loading utilities."""
 
+import functools
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List, Tuple
 import logging
-from backend.config import DATASET_DIR, MIN_YEAR
+import threading
+from backend.config import (
+    DATASET_DIR, ENABLE_COLUMN_PRUNING, FIRST_SEASON, FULL_HISTORY, MIN_YEAR, QUERY_ENGINE
+)
+from backend.data.snapshot import SnapshotStore
+from backend.data.shared import SharedTableStore
+from backend.data.index import GroupIndex, TableIndex
+from backend.data.entities import EntityRegistry
+from backend.data.schema import read_header, read_table
+from backend.data.partitions import PARTITION_COLUMNS, SeasonPartitionStore
+from backend.data.frame_cache import FrameCache, FrameKey, cached_frame
+from backend.data.segments import INGEST_TABLES, SegmentStore, append_rows
+from backend.data.season import SeasonView
+from backend.data.sql import SQL_RELATIONS, SqlQueryEngine, engine_available
+from backend.data.reload import (
+    DatasetChange, DatasetWatcher, Fingerprint, changed_files, changed_race_ids,
+    dataset_fingerprint, fingerprint_version
+)
+from backend.metrics.registry import metric_registry
 
 logger = logging.getLogger(__name__)
 
+# Loaded tables are shared between callers instead of defensively copied.
+# Copy-on-write guarantees that a caller modifying a frame it received gets
+# its own copy and can never corrupt the loader's cached tables. pandas 3
+# always copies on write and pandas 4 removes the option.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# Key columns indexed on every loaded table that carries them
+INDEX_COLUMNS = ["raceId", "driverId", "constructorId", "year"]
+
+# Tables streamed into per-season partitions instead of a single snapshot
+PARTITIONED_TABLES = ["lap_times.csv"]
+
+# Championship standings files and the ID column of their entity
+STANDINGS_TABLES = {
+    "constructor": ("constructor_standings.csv", "constructorId"),
+    "driver": ("driver_standings.csv", "driverId"),
+}
+
+# Tables only recorded for part of the history; see first_season()
+COVERAGE_TABLES = ["lap_times.csv", "pit_stops.csv", "qualifying.csv"]
+
+# Columns the loader itself and the API routes read from each table. The
+# columns declared by the served metrics (see backend/metrics/registry.py)
+# are added to these; tables listed in neither are loaded whole.
+LOADER_COLUMNS: Dict[str, List[str]] = {
+    "circuits.csv": ["circuitId", "name"],
+    "constructors.csv": ["constructorId", "name", "nationality", "url"],
+    "drivers.csv": ["driverId", "forename", "surname", "nationality", "dob", "url"],
+    "races.csv": ["raceId", "year", "round", "circuitId", "name", "date"],
+    "results.csv": ["raceId", "driverId", "constructorId", "position", "points", "statusId"],
+    "status.csv": ["statusId", "status"],
+    "qualifying.csv": ["raceId", "driverId", "constructorId"],
+    "pit_stops.csv": ["raceId", "driverId"],
+    "lap_times.csv": ["raceId", "driverId", "milliseconds"],
+    "constructor_standings.csv": ["raceId", "constructorId", "points", "position", "wins"],
+    "driver_standings.csv": ["raceId", "driverId", "points", "position", "wins"],
+}
+
+# Large tables mapped from shared column files so worker processes share their pages
+SHARED_TABLES = [
+    "results.csv", "qualifying.csv", "pit_stops.csv", "lap_times.csv",
+    "constructor_results.csv", "constructor_standings.csv", "driver_standings.csv",
+]
+
+
+class DatasetState:
+    """Tables and derived structures built from one version of dataset/.
+
+    The loader replaces its state as a whole, so a reload never exposes a
+    half-built mix of old and new tables to a request.
+    """
+
+    def __init__(self, fingerprint: Fingerprint, segments: Tuple[int, ...] = ()):
+        self.fingerprint = fingerprint
+        self.segments = segments
+        self.version = fingerprint_version(fingerprint, segments)
+        self.tables: Dict[str, pd.DataFrame] = {}
+        self.columns: Dict[str, Optional[List[str]]] = {}
+        self.indexes: Dict[str, TableIndex] = {}
+        self.calendar: Optional[Tuple[pd.DataFrame, GroupIndex]] = None
+        self.entries: Optional[Tuple[pd.DataFrame, TableIndex]] = None
+        self.race_results: Optional[Tuple[pd.DataFrame, TableIndex]] = None
+        self.teammates: Optional[Tuple[pd.DataFrame, TableIndex]] = None
+        self.entities: Optional[EntityRegistry] = None
+        self.standings: Dict[str, Tuple[pd.DataFrame, TableIndex, pd.DataFrame, TableIndex]] = {}
+        self.season_views: Dict[Optional[int], SeasonView] = {}
+        self.sql: Optional[SqlQueryEngine] = None
+        self.race_seasons: Optional[Dict[int, int]] = None
+        self.coverage: Dict[str, Optional[int]] = {}
+        self.partition_seasons: Dict[str, List[int]] = {}
+        self.partition_cache: Dict[Tuple[str, int], Tuple[pd.DataFrame, TableIndex]] = {}
+        self.frame_cache = FrameCache()
+
 
 class F1DataLoader:
     """Handles loading and caching of F1 CSV data."""
 
-    def __init__(self):
-        self._data_cache: Dict[str, pd.DataFrame] = {}
-        self._joined_cache: Dict[str, pd.DataFrame] = {}
-
-    def load_csv(self, filename: str, use_cache: bool = True) -> pd.DataFrame:
-        """Load a CSV file from the dataset directory."""
-        if use_cache and filename in self._data_cache:
-            return self._data_cache[filename].copy()
+    def __init__(self, query_engine: str = QUERY_ENGINE, prune_columns: bool = ENABLE_COLUMN_PRUNING,
+                 full_history: bool = FULL_HISTORY):
+        if query_engine != "pandas" and not engine_available(query_engine):
+            logger.warning(f"Query engine {query_engine} is not available, using pandas")
+            query_engine = "pandas"
+        self.query_engine = query_engine
+        self.full_history = full_history
+        self.min_year = FIRST_SEASON if full_history else MIN_YEAR
+        self.required_columns = self._required_columns() if prune_columns else {}
+        self.snapshots = SnapshotStore()
+        self.shared = SharedTableStore()
+        self.partitions = SeasonPartitionStore()
+        self.segments = SegmentStore()
+        self._state = self._new_state(dataset_fingerprint())
+        self._reload_lock = threading.Lock()
+        self._listeners: List[Callable[[DatasetChange], None]] = []
+        self._watcher: Optional[DatasetWatcher] = None
+
+    def _new_state(self, fingerprint: Fingerprint) -> DatasetState:
+        """Empty state of a dataset version, with the ingested segments extending it."""
+        return DatasetState(fingerprint, self.segments.ids(fingerprint))
+
+    @property
+    def frame_cache(self) -> FrameCache:
+        """Derived-frame cache of the current dataset version."""
+        return self._state.frame_cache
+
+    @property
+    def dataset_version(self) -> str:
+        """Identifier of the dataset version currently being served."""
+        return self._state.version
+
+    @property
+    def entities(self) -> EntityRegistry:
+        """ID -> name registry of drivers, constructors, races and circuits."""
+        return self._entity_registry(self._state)
+
+    def _entity_registry(self, state: DatasetState) -> EntityRegistry:
+        if state.entities is None:
+            state.entities = EntityRegistry(
+                drivers=self._load(state, "drivers.csv"),
+                constructors=self._load(state, "constructors.csv"),
+                races=self._load(state, "races.csv"),
+                circuits=self._load(state, "circuits.csv")
+            )
+        return state.entities
+
+    @property
+    def sql(self) -> Optional[SqlQueryEngine]:
+        """Embedded SQL engine of the current dataset version, ``None`` on the pandas path."""
+        if self.query_engine == "pandas":
+            return None
+        state = self._state
+        if state.sql is None:
+            state.sql = SqlQueryEngine(self.query_engine, self._sql_relation)
+        return state.sql
+
+    def _sql_relation(self, name: str) -> pd.DataFrame:
+        """Loader frame backing a relation of the SQL engine."""
+        if name == "race_results":
+            return self._race_result_table()[0]
+        if name == "lap_times":
+            return self.get_lap_times(self.get_season_race_ids())
+        if name == "entries":
+            return self._entry_table()[0]
+        return self.load_csv(f"{name}.csv")
+
+    @staticmethod
+    def _required_columns() -> Dict[str, List[str]]:
+        """Union of the loader's and the served metrics' columns, per table."""
+        required = {table: set(columns) for table, columns in LOADER_COLUMNS.items()}
+        for table, columns in metric_registry.columns_for().items():
+            required.setdefault(table, set()).update(columns)
+        return {table: sorted(columns) for table, columns in required.items()}
+
+    def table_columns(self, filename: str) -> Optional[List[str]]:
+        """Columns of ``filename`` kept in memory, in file order, or ``None`` for all of them."""
+        return self._table_columns(self._state, filename)
+
+    def _table_columns(self, state: DatasetState, filename: str) -> Optional[List[str]]:
+        if filename not in state.columns:
+            required = self.required_columns.get(filename)
+            filepath = DATASET_DIR / filename
+            if required is None or not filepath.exists():
+                state.columns[filename] = None
+            else:
+                state.columns[filename] = [column for column in read_header(filepath) if column in required]
+        return state.columns[filename]
+
+    @staticmethod
+    def _read_csv(filepath: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Parse a dataset CSV file (or some of its columns) into its normalized dtypes."""
+        return read_table(filepath, columns)
+
+    def build_snapshots(self) -> List[str]:
+        """Build columnar snapshots and season partitions for every stale dataset CSV."""
+        shared = SHARED_TABLES if self.shared.enabled else []
+        rebuilt = self.snapshots.build_all(self._read_csv, exclude=PARTITIONED_TABLES + shared)
+
+        for filename in shared:
+            filepath = DATASET_DIR / filename
+            if filename not in PARTITIONED_TABLES and filepath.exists() and not self.shared.is_fresh(filepath):
+                self.shared.build(filepath, self._read_csv)
+                rebuilt.append(filename)
+
+        for filename in PARTITIONED_TABLES:
+            filepath = DATASET_DIR / filename
+            if self.partitions.enabled and filepath.exists() and not self.partitions.is_fresh(filepath):
+                self.partitions.build(filepath, self._race_season_map(self._state))
+                rebuilt.append(filename)
+
+        return rebuilt
+
+    def _load(self, state: DatasetState, filename: str, use_cache: bool = True) -> pd.DataFrame:
+        """Load a dataset table into ``state``."""
+        if use_cache and filename in state.tables:
+            return state.tables[filename].copy(deep=False)
 
         filepath = DATASET_DIR / filename
         if not filepath.exists():
             raise FileNotFoundError(f"Dataset file not found: {filepath}")
 
         try:
-            df = pd.read_csv(filepath)
-            logger.info(f"Loaded {filename}: {len(df)} rows")
+            store = self.shared if self.shared.enabled and filename in SHARED_TABLES else self.snapshots
+            columns = self._table_columns(state, filename)
+            df = self._with_segments(state, filename, store.load(filepath, self._read_csv, columns), columns)
+            logger.info(f"Loaded {filename}: {len(df)} rows, {len(df.columns)} columns")
 
             if use_cache:
-                self._data_cache[filename] = df.copy()
+                state.indexes[filename] = TableIndex(df, INDEX_COLUMNS)
+                state.tables[filename] = df
 
-            return df
+            return df.copy(deep=False)
 
         except Exception as e:
             logger.error(f"Failed to load {filename}: {e}")
             raise
 
-    def get_races(self, season: Optional[int] = None) -> pd.DataFrame:
-        """Get races data, optionally filtered by season."""
-        races = self.load_csv("races.csv")
-
-        # Filter by minimum year
-        races = races[races["year"] >= MIN_YEAR]
+    def _with_segments(self, state: DatasetState, filename: str, df: Optional[pd.DataFrame],
+                       columns: Optional[List[str]], season: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """``df`` followed by the rows of ``filename`` ingested as segments of ``state``."""
+        if not state.segments:
+            return df
+        frames = self.segments.frames(filename, state.fingerprint, state.segments, columns, season)
+        parts = ([df] if df is not None else []) + frames
+        return functools.reduce(append_rows, parts) if parts else None
 
+    def load_csv(self, filename: str, use_cache: bool = True) -> pd.DataFrame:
+        """Load a CSV file from the dataset directory."""
+        return self._load(self._state, filename, use_cache)
+
+    def _table(self, filename: str) -> Tuple[pd.DataFrame, TableIndex]:
+        """Get a cached table together with its key-column index."""
+        state = self._state
+        df = self._load(state, filename)
+        return df, state.indexes[filename]
+
+    def _race_calendar(self) -> Tuple[pd.DataFrame, GroupIndex]:
+        """Get races sorted by year and round, with a year index over that order."""
+        state = self._state
+        if state.calendar is None:
+            races = self._load(state, "races.csv").sort_values(["year", "round"])
+            state.calendar = (races, GroupIndex(races["year"].to_numpy()))
+        return state.calendar
+
+    def _season_range(self, season: Optional[int] = None) -> slice:
+        """Inclusive range of years for a season, or every served season.
+
+        Seasons before ``min_year`` (MIN_YEAR, or FIRST_SEASON in full-history
+        mode) select nothing.
+        """
         if season:
-            races = races[races["year"] == season]
-
-        return races.sort_values(["year", "round"])
-
-    def get_results(self, race_ids: Optional[List[int]] = None) -> pd.DataFrame:
-        """Get race results, optionally filtered by race IDs."""
-        results = self.load_csv("results.csv")
-
-        if race_ids is not None:
-            results = results[results["raceId"].isin(race_ids)]
-
-        return results
-
-    def get_qualifying(self, race_ids: Optional[List[int]] = None) -> pd.DataFrame:
-        """Get qualifying results, optionally filtered by race IDs."""
-        qualifying = self.load_csv("qualifying.csv")
-
-        if race_ids is not None:
-            qualifying = qualifying[qualifying["raceId"].isin(race_ids)]
-
-        return qualifying
-
-    def get_lap_times(self, race_ids: Optional[List[int]] = None) -> pd.DataFrame:
-        """Get lap times, optionally filtered by race IDs."""
-        lap_times = self.load_csv("lap_times.csv")
-
-        if race_ids is not None:
-            lap_times = lap_times[lap_times["raceId"].isin(race_ids)]
+            return slice(max(season, self.min_year), season)
+        return slice(self.min_year, None)
 
-        return lap_times
-
-    def get_pit_stops(self, race_ids: Optional[List[int]] = None) -> pd.DataFrame:
-        """Get pit stop data, optionally filtered by race IDs."""
-        pit_stops = self.load_csv("pit_stops.csv")
+    def get_races(self, season: Optional[int] = None) -> pd.DataFrame:
+        """Get races data, optionally filtered by season."""
+        races, years = self._race_calendar()
+        years_range = self._season_range(season)
+        return races.take(years.positions_between(years_range.start, years_range.stop))
+
+    def get_season_race_ids(self, season: Optional[int] = None) -> List[int]:
+        """Get the race IDs of a season (or of every served season)."""
+        return self.get_races(season)["raceId"].tolist()
+
+    def season_view(self, season: Optional[int] = None) -> SeasonView:
+        """Get the immutable slices and race baselines of a season, built once per dataset version.
+
+        Each table is sliced when a metric first reads it from the view.
+        """
+        state = self._state
+        season = season or None
+        if season not in state.season_views:
+            races = self.get_races(season)
+            race_ids = races["raceId"].tolist()
+            getters = {"results": self.get_results, "qualifying": self.get_qualifying,
+                       "pit_stops": self.get_pit_stops, "lap_times": self.get_lap_times,
+                       "entries": self.get_entries}
+            state.season_views[season] = SeasonView(season, races, {
+                name: functools.partial(self._view_slice, getter, race_ids) for name, getter in getters.items()
+            })
+        return state.season_views[season]
+
+    @staticmethod
+    def _view_slice(getter: Callable[[List[int]], pd.DataFrame], race_ids: List[int]) -> pd.DataFrame:
+        """A season view's rows of one table; empty if the table's file is missing."""
+        try:
+            return getter(race_ids)
+        except FileNotFoundError:
+            # Metrics reading a missing table still report it when they load their own rows
+            return pd.DataFrame()
 
+    def get_results(self, race_ids: Optional[List[int]] = None,
+                    driver_id: Optional[int] = None,
+                    constructor_id: Optional[int] = None) -> pd.DataFrame:
+        """Get race results, optionally filtered by race, driver and constructor IDs."""
+        results, index = self._table("results.csv")
+        positions = index.lookup(raceId=race_ids, driverId=driver_id, constructorId=constructor_id)
+        return TableIndex.select(results, positions)
+
+    def get_qualifying(self, race_ids: Optional[List[int]] = None,
+                       driver_id: Optional[int] = None,
+                       constructor_id: Optional[int] = None) -> pd.DataFrame:
+        """Get qualifying results, optionally filtered by race, driver and constructor IDs."""
+        qualifying, index = self._table("qualifying.csv")
+        positions = index.lookup(raceId=race_ids, driverId=driver_id, constructorId=constructor_id)
+        return TableIndex.select(qualifying, positions)
+
+    def _race_season_map(self, state: DatasetState) -> Dict[int, int]:
+        """Map every raceId in races.csv to its season."""
+        if state.race_seasons is None:
+            races = self._load(state, "races.csv")
+            state.race_seasons = dict(zip(races["raceId"].tolist(), races["year"].tolist(), strict=True))
+        return state.race_seasons
+
+    def _partitioned_seasons(self, state: DatasetState, filename: str) -> List[int]:
+        """Seasons available for a partitioned table, building partitions on first use."""
+        if filename not in state.partition_seasons:
+            filepath = DATASET_DIR / filename
+            if not filepath.exists():
+                raise FileNotFoundError(f"Dataset file not found: {filepath}")
+
+            self.partitions.ensure(filepath, self._race_season_map(state))
+            seasons = set(self.partitions.seasons(filepath))
+            seasons.update(segment["season"] for segment in self.segments.segments(state.fingerprint)
+                           if segment["id"] in state.segments and filename in segment["tables"])
+            state.partition_seasons[filename] = sorted(seasons)
+
+        return state.partition_seasons[filename]
+
+    def _season_partition(self, state: DatasetState, filename: str,
+                          season: int) -> Optional[Tuple[pd.DataFrame, TableIndex]]:
+        """Get one season of a partitioned table together with its index."""
+        key = (filename, season)
+        if key not in state.partition_cache:
+            columns = self._table_columns(state, filename)
+            df = self.partitions.load_season(DATASET_DIR / filename, season, columns)
+            if df is not None:
+                columns = list(df.columns)
+            else:
+                columns = [column for column in PARTITION_COLUMNS[filename] if columns is None or column in columns]
+            df = self._with_segments(state, filename, df, columns, season)
+            if df is None:
+                return None
+            logger.info(f"Loaded {filename} season {season}: {len(df)} rows")
+            state.partition_cache[key] = (df, TableIndex(df, INDEX_COLUMNS))
+        return state.partition_cache[key]
+
+    def get_lap_times(self, race_ids: Optional[List[int]] = None,
+                      driver_id: Optional[int] = None) -> pd.DataFrame:
+        """Get lap times, optionally filtered by race and driver IDs.
+
+        Only the season partitions covering ``race_ids`` are loaded.
+        """
+        if not self.partitions.enabled:
+            lap_times, index = self._table("lap_times.csv")
+            return TableIndex.select(lap_times, index.lookup(raceId=race_ids, driverId=driver_id))
+
+        state = self._state
+        seasons = self._partitioned_seasons(state, "lap_times.csv")
         if race_ids is not None:
-            pit_stops = pit_stops[pit_stops["raceId"].isin(race_ids)]
-
-        return pit_stops
+            race_seasons = self._race_season_map(state)
+            requested = {race_seasons.get(int(race_id)) for race_id in race_ids}
+            seasons = [season for season in seasons if season in requested]
+
+        frames = []
+        for season in seasons:
+            partition = self._season_partition(state, "lap_times.csv", season)
+            if partition is not None:
+                lap_times, index = partition
+                frames.append(TableIndex.select(lap_times, index.lookup(raceId=race_ids, driverId=driver_id)))
+
+        if not frames:
+            return pd.DataFrame(columns=self.table_columns("lap_times.csv") or PARTITION_COLUMNS["lap_times.csv"])
+
+        return pd.concat(frames, ignore_index=True)
+
+    def get_pit_stops(self, race_ids: Optional[List[int]] = None,
+                      driver_id: Optional[int] = None) -> pd.DataFrame:
+        """Get pit stop data, optionally filtered by race and driver IDs."""
+        pit_stops, index = self._table("pit_stops.csv")
+        return TableIndex.select(pit_stops, index.lookup(raceId=race_ids, driverId=driver_id))
+
+    def _entry_table(self) -> Tuple[pd.DataFrame, TableIndex]:
+        """Get the (raceId, driverId) -> constructorId entry table built from results."""
+        state = self._state
+        if state.entries is None:
+            results = self._load(state, "results.csv")
+            entries = (results[["raceId", "driverId", "constructorId"]]
+                       .drop_duplicates(["raceId", "driverId"])
+                       .reset_index(drop=True))
+            state.entries = (entries, TableIndex(entries, INDEX_COLUMNS))
+        return state.entries
+
+    def get_entries(self, race_ids: Optional[List[int]] = None,
+                    constructor_id: Optional[int] = None) -> pd.DataFrame:
+        """Get race entries (which constructor each driver drove for in each race)."""
+        entries, index = self._entry_table()
+        return TableIndex.select(entries, index.lookup(raceId=race_ids, constructorId=constructor_id))
+
+    def _attach_constructor(self, df: pd.DataFrame, race_ids: List[int],
+                            constructor_id: Optional[int] = None) -> pd.DataFrame:
+        """Attach the per-race constructorId to rows keyed by (raceId, driverId).
+
+        When ``constructor_id`` is given only that constructor's rows are kept.
+        """
+        entries = self.get_entries(race_ids, constructor_id)
+        how = "inner" if constructor_id else "left"
+        return df.merge(entries, on=["raceId", "driverId"], how=how)
+
+    def _race_result_table(self) -> Tuple[pd.DataFrame, TableIndex]:
+        """Get the race-result fact table built once per dataset version.
+
+        Every results row carries its race context (year, round, circuit, race
+        name and date), the constructor name, the status text and
+        ``finished``/``dnf`` flags, so per-constructor accessors are plain
+        index slices instead of repeated merges.
+        """
+        state = self._state
+        if state.race_results is None:
+            facts = self._race_fact_rows(state, self._load(state, "results.csv"))
+            state.race_results = (facts, TableIndex(facts, INDEX_COLUMNS))
+        return state.race_results
+
+    def _race_fact_rows(self, state: DatasetState, results: pd.DataFrame) -> pd.DataFrame:
+        """Fact table rows of ``results`` with their race, constructor and status context."""
+        races = self._load(state, "races.csv")[["raceId", "year", "round", "circuitId", "name", "date"]]
+        constructors = (self._load(state, "constructors.csv")[["constructorId", "name"]]
+                        .rename(columns={"name": "constructor_name"}))
+        status = self._load(state, "status.csv")[["statusId", "status"]]
+
+        facts = (results
+                 .merge(races, on="raceId", how="inner")
+                 .merge(constructors, on="constructorId", how="left")
+                 .merge(status, on="statusId", how="left"))
+
+        # A classified finish has a position; retirements have none
+        finished = facts["position"].fillna(0).gt(0).to_numpy(dtype=bool)
+        return facts.assign(finished=finished, dnf=~finished)
+
+    def get_race_results(self, season: Optional[int] = None,
+                         constructor_id: Optional[int] = None,
+                         driver_id: Optional[int] = None) -> pd.DataFrame:
+        """Get rows of the race-result fact table by season, constructor and driver."""
+        facts, index = self._race_result_table()
+        positions = index.lookup(year=self._season_range(season),
+                                 constructorId=constructor_id or None,
+                                 driverId=driver_id or None)
+        return TableIndex.select(facts, positions)
 
     def get_drivers(self) -> pd.DataFrame:
         """Get drivers data."""
@@ -94,6 +483,7 @@ class F1DataLoader:
         """Get constructors data."""
         return self.load_csv("constructors.csv")
 
+    @cached_frame("driver_results")
     def get_driver_results_with_names(
         self,
         driver_id: Optional[int] = None,
@@ -101,20 +491,12 @@ class F1DataLoader:
         race_ids: Optional[List[int]] = None
     ) -> pd.DataFrame:
         """Get results joined with driver and race information."""
-        cache_key = f"driver_results_{driver_id}_{season}_{hash(tuple(race_ids or []))}"
-
-        if cache_key in self._joined_cache:
-            return self._joined_cache[cache_key].copy()
-
         # Get races
         races = self.get_races(season)
         race_ids_filtered = race_ids or races["raceId"].tolist()
 
         # Get results
-        results = self.get_results(race_ids_filtered)
-
-        if driver_id:
-            results = results[results["driverId"] == driver_id]
+        results = self.get_results(race_ids_filtered, driver_id=driver_id or None)
 
         # Join with races and drivers
         drivers = self.get_drivers()
@@ -124,95 +506,126 @@ class F1DataLoader:
                  .merge(drivers, on="driverId", how="left"))
 
         # Add computed columns
-        joined["driver_name"] = joined["forename"] + " " + joined["surname"]
-
-        self._joined_cache[cache_key] = joined.copy()
-        return joined
-
-    def get_teammate_pairs(self, season: Optional[int] = None) -> pd.DataFrame:
-        """Get all teammate pairs for comparison metrics."""
-        races = self.get_races(season)
-        results = self.get_results(races["raceId"].tolist())
-
-        # Get teammates (same constructor in same race)
-        teammate_pairs = []
-        for _, race in races.iterrows():
-            race_results = results[results["raceId"] == race["raceId"]]
-
-            for constructor_id in race_results["constructorId"].unique():
-                constructor_drivers = race_results[
-                    race_results["constructorId"] == constructor_id
-                ]
-
-                if len(constructor_drivers) == 2:
-                    drivers = constructor_drivers["driverId"].tolist()
-                    teammate_pairs.append({
-                        "raceId": race["raceId"],
-                        "year": race["year"],
-                        "constructorId": constructor_id,
-                        "driver1_id": drivers[0],
-                        "driver2_id": drivers[1]
-                    })
-
-        return pd.DataFrame(teammate_pairs)
+        return joined.assign(driver_name=joined["forename"] + " " + joined["surname"])
+
+    def _teammate_table(self) -> Tuple[pd.DataFrame, TableIndex]:
+        """Get every ordered teammate pair of the whole history, built once.
+
+        Results are self-joined on (raceId, constructorId), so a team running
+        three cars yields all six ordered pairs rather than being skipped.
+        """
+        state = self._state
+        if state.teammates is None:
+            pairs = self._teammate_rows(state, self._load(state, "results.csv"))
+            state.teammates = (pairs, TableIndex(pairs, ["raceId", "year", "constructorId", "driver1_id"]))
+        return state.teammates
+
+    def _teammate_rows(self, state: DatasetState, results: pd.DataFrame) -> pd.DataFrame:
+        """Ordered teammate pairs of the races in ``results``."""
+        races = self._load(state, "races.csv")[["raceId", "year"]]
+
+        entries = (results[["raceId", "constructorId", "driverId"]]
+                   .drop_duplicates()
+                   .merge(races, on="raceId", how="inner"))
+        pairs = entries.merge(entries[["raceId", "constructorId", "driverId"]],
+                              on=["raceId", "constructorId"], suffixes=("", "_teammate"))
+        pairs = pairs[pairs["driverId"].ne(pairs["driverId_teammate"])]
+
+        return pd.DataFrame({
+            "raceId": pairs["raceId"].to_numpy(dtype="int32"),
+            "year": pairs["year"].to_numpy(dtype="int32"),
+            "constructorId": pairs["constructorId"].to_numpy(dtype="int32"),
+            "driver1_id": pairs["driverId"].to_numpy(dtype="int32"),
+            "driver2_id": pairs["driverId_teammate"].to_numpy(dtype="int32"),
+        })
+
+    def get_teammate_pairs(self, season: Optional[int] = None,
+                           driver_id: Optional[int] = None,
+                           constructor_id: Optional[int] = None) -> pd.DataFrame:
+        """Get ordered teammate pairs (driver1_id, driver2_id) per race.
+
+        Each pair appears in both orders; filtering by ``driver_id`` keeps the
+        rows where that driver is ``driver1_id``.
+        """
+        pairs, index = self._teammate_table()
+        positions = index.lookup(year=self._season_range(season),
+                                 driver1_id=driver_id or None,
+                                 constructorId=constructor_id or None)
+        return TableIndex.select(pairs, positions)
 
     def get_constructor_standings(self, season: Optional[int] = None) -> pd.DataFrame:
         """Get constructor standings data, optionally filtered by season."""
-        standings = self.load_csv("constructor_standings.csv")
+        standings, index = self._table("constructor_standings.csv")
 
-        if season:
-            # Get race IDs for the season
-            races = self.get_races(season)
-            standings = standings[standings["raceId"].isin(races["raceId"])]
-        else:
-            # Filter by minimum year
-            races = self.get_races()  # Already filtered by MIN_YEAR
-            standings = standings[standings["raceId"].isin(races["raceId"])]
+        # Race IDs for the season, or for every served season
+        race_ids = self.get_season_race_ids(season)
 
-        return standings
+        return TableIndex.select(standings, index.lookup(raceId=race_ids))
 
     def get_constructor_results(self, season: Optional[int] = None,
                                constructor_id: Optional[int] = None) -> pd.DataFrame:
-        """Get constructor results by aggregating driver results."""
-        races = self.get_races(season)
-        results = self.get_results(races["raceId"].tolist())
-
-        if constructor_id:
-            results = results[results["constructorId"] == constructor_id]
-
-        # Join with race data for context
-        constructor_results = (results
-                              .merge(races, on="raceId", how="left")
-                              .merge(self.get_constructors(), on="constructorId", how="left"))
-
-        # Ensure numeric columns
-        constructor_results["position"] = pd.to_numeric(constructor_results["position"], errors="coerce")
-        constructor_results["points"] = pd.to_numeric(constructor_results["points"], errors="coerce").fillna(0)
-
-        return constructor_results
+        """Get constructor race results with race, status and finish context."""
+        return self.get_race_results(season, constructor_id)
+
+    def _standings_tables(self, entity: str) -> Tuple[pd.DataFrame, TableIndex, pd.DataFrame, TableIndex]:
+        """Get the round-by-round and season-final standings of ``entity``.
+
+        Both tables carry the race year and round and are indexed by season,
+        race and entity. The final standing of an entity is its row at the
+        last round of the season it was classified in.
+        """
+        state = self._state
+        if entity not in state.standings:
+            filename, id_column = STANDINGS_TABLES[entity]
+            progression = self._standings_rows(state, self._load(state, filename))
+            final = (progression
+                     .drop_duplicates(["year", id_column], keep="last")
+                     .sort_values(["year", id_column])
+                     .reset_index(drop=True))
+
+            state.standings[entity] = (progression, TableIndex(progression, INDEX_COLUMNS),
+                                       final, TableIndex(final, INDEX_COLUMNS))
+        return state.standings[entity]
+
+    def _standings_rows(self, state: DatasetState, standings: pd.DataFrame) -> pd.DataFrame:
+        """Standings rows with their race year and round, ordered by round and position."""
+        races = self._load(state, "races.csv")[["raceId", "year", "round"]]
+        return (standings
+                .merge(races, on="raceId", how="inner")
+                .sort_values(["year", "round", "position"], kind="stable")
+                .reset_index(drop=True))
+
+    def get_standings_progression(self, entity: str, season: Optional[int] = None,
+                                  entity_id: Optional[int] = None) -> pd.DataFrame:
+        """Get round-by-round ``"constructor"`` or ``"driver"`` standings, ordered by round."""
+        progression, index, _, _ = self._standings_tables(entity)
+        id_column = STANDINGS_TABLES[entity][1]
+        positions = index.lookup(year=self._season_range(season), **{id_column: entity_id or None})
+        return TableIndex.select(progression, positions)
+
+    def get_final_standings(self, entity: str, season: Optional[int] = None,
+                            entity_id: Optional[int] = None) -> pd.DataFrame:
+        """Get season-final ``"constructor"`` or ``"driver"`` standings."""
+        _, _, final, index = self._standings_tables(entity)
+        id_column = STANDINGS_TABLES[entity][1]
+        positions = index.lookup(year=self._season_range(season), **{id_column: entity_id or None})
+        return TableIndex.select(final, positions)
 
     def get_constructor_championship_positions(self, season: Optional[int] = None) -> pd.DataFrame:
         """Get final constructor championship positions by season."""
-        standings = self.get_constructor_standings(season)
+        return self.get_final_standings("constructor", season)
 
-        if standings.empty:
-            return pd.DataFrame()
-
-        # Join with races to get year information
-        races = self.get_races()
-        standings_with_year = standings.merge(races[["raceId", "year", "round"]], on="raceId", how="left")
-
-        # Get final standings (last race of each season)
-        final_standings = (standings_with_year
-                          .groupby(["year", "constructorId"])
-                          .last()
-                          .reset_index())
-
-        return final_standings
+    def get_driver_championship_positions(self, season: Optional[int] = None) -> pd.DataFrame:
+        """Get final driver championship positions by season."""
+        return self.get_final_standings("driver", season)
 
+    @cached_frame("race_wins")
     def get_constructor_race_wins(self, season: Optional[int] = None,
                                  constructor_id: Optional[int] = None) -> pd.DataFrame:
         """Get races won by constructors (1st and 2nd place)."""
+        if self.sql is not None:
+            return self.sql.race_wins(self._season_range(season), constructor_id)
+
         results = self.get_constructor_results(season, constructor_id)
 
         # Group by race and constructor to count positions
@@ -237,6 +650,7 @@ class F1DataLoader:
 
         return constructor_wins
 
+    @cached_frame("podium_lockouts")
     def get_constructor_podium_lockouts(self, season: Optional[int] = None,
                                        constructor_id: Optional[int] = None) -> pd.DataFrame:
         """Get races where constructor achieved podium lockouts (1-2 or 1-2-3)."""
@@ -266,20 +680,14 @@ class F1DataLoader:
 
         return lockouts_12
 
+    @cached_frame("qualifying_performance")
     def get_constructor_qualifying_performance(self, season: Optional[int] = None,
                                               constructor_id: Optional[int] = None) -> pd.DataFrame:
         """Get constructor qualifying performance data."""
         races = self.get_races(season)
-        qualifying = self.get_qualifying(races["raceId"].tolist())
-
-        if constructor_id:
-            # Get results to find constructor info
-            results = self.get_results(races["raceId"].tolist())
-            driver_constructor_map = results.groupby("driverId")["constructorId"].first().to_dict()
 
-            # Filter qualifying by constructor
-            qualifying["constructorId"] = qualifying["driverId"].map(driver_constructor_map)
-            qualifying = qualifying[qualifying["constructorId"] == constructor_id]
+        # Qualifying rows already record the constructor entered for that race
+        qualifying = self.get_qualifying(races["raceId"].tolist(), constructor_id=constructor_id or None)
 
         # Join with race and constructor data
         qual_performance = (qualifying
@@ -290,46 +698,31 @@ class F1DataLoader:
     def get_constructor_reliability_data(self, season: Optional[int] = None,
                                         constructor_id: Optional[int] = None) -> pd.DataFrame:
         """Get constructor reliability data (DNFs, mechanical failures)."""
-        results = self.get_constructor_results(season, constructor_id)
-
-        # Get status data for failure analysis
-        status_data = self.load_csv("status.csv")
-
-        # Join results with status information
-        reliability_data = (results
-                           .merge(status_data, left_on="statusId", right_on="statusId", how="left"))
-
-        return reliability_data
+        # The fact table already carries the status text and DNF flags
+        return self.get_race_results(season, constructor_id)
 
+    @cached_frame("pit_stop_performance")
     def get_constructor_pit_stop_performance(self, season: Optional[int] = None,
                                            constructor_id: Optional[int] = None) -> pd.DataFrame:
         """Get constructor pit stop performance data."""
-        races = self.get_races(season)
-        pit_stops = self.get_pit_stops(races["raceId"].tolist())
-
-        if constructor_id:
-            # Get results to map drivers to constructors
-            results = self.get_results(races["raceId"].tolist())
-            driver_constructor_map = results.groupby("driverId")["constructorId"].first().to_dict()
+        race_ids = self.get_season_race_ids(season)
+        pit_stops = self.get_pit_stops(race_ids)
 
-            # Filter pit stops by constructor
-            pit_stops["constructorId"] = pit_stops["driverId"].map(driver_constructor_map)
-            pit_stops = pit_stops[pit_stops["constructorId"] == constructor_id]
-
-        return pit_stops
+        return self._attach_constructor(pit_stops, race_ids, constructor_id)
 
+    @cached_frame("points_data")
     def get_constructor_points_data(self, season: Optional[int] = None,
                                    constructor_id: Optional[int] = None) -> pd.DataFrame:
         """Get detailed constructor points data by race."""
+        if self.sql is not None:
+            points_data = self.sql.points_data(self._season_range(season), constructor_id)
+            return points_data if not points_data.empty else pd.DataFrame()
+
         results = self.get_constructor_results(season, constructor_id)
 
         if results.empty:
             return pd.DataFrame()
 
-        # Ensure numeric columns
-        results["points"] = pd.to_numeric(results["points"], errors="coerce").fillna(0)
-        results["position"] = pd.to_numeric(results["position"], errors="coerce")
-
         # Aggregate points by constructor and race
         points_data = (results
                       .groupby(["raceId", "constructorId", "year", "round"])
@@ -345,35 +738,24 @@ class F1DataLoader:
 
         return points_data
 
+    @cached_frame("lap_times")
     def get_constructor_lap_times(self, season: Optional[int] = None,
                                   constructor_id: Optional[int] = None) -> pd.DataFrame:
         """Get constructor lap times with race and constructor context."""
         races = self.get_races(season)
-        lap_times = self.get_lap_times(races["raceId"].tolist())
+        race_ids = races["raceId"].tolist()
+        lap_times = self.get_lap_times(race_ids)
 
         if lap_times.empty:
             return pd.DataFrame()
 
-        if constructor_id:
-            # Get results to map drivers to constructors
-            results = self.get_results(races["raceId"].tolist())
-            driver_constructor_map = results.groupby("driverId")["constructorId"].first().to_dict()
-
-            # Filter lap times by constructor
-            lap_times["constructorId"] = lap_times["driverId"].map(driver_constructor_map)
-            lap_times = lap_times[lap_times["constructorId"] == constructor_id]
+        lap_times = self._attach_constructor(lap_times, race_ids, constructor_id)
 
         # Join with race data for context
-        lap_times_with_context = (lap_times
-                                .merge(races[["raceId", "year", "round", "name", "date"]],
-                                       on="raceId", how="left"))
-
-        # Ensure numeric columns
-        lap_times_with_context["milliseconds"] = pd.to_numeric(
-            lap_times_with_context["milliseconds"], errors="coerce")
-
-        return lap_times_with_context
+        return lap_times.merge(races[["raceId", "year", "round", "name", "date"]],
+                               on="raceId", how="left")
 
+    @cached_frame("pit_stop_stats")
     def get_constructor_pit_stop_stats(self, season: Optional[int] = None,
                                      constructor_id: Optional[int] = None) -> pd.DataFrame:
         """Get constructor pit stop statistics with aggregated data."""
@@ -382,23 +764,23 @@ class F1DataLoader:
         if pit_stops.empty:
             return pd.DataFrame()
 
-        # Ensure numeric columns
-        pit_stops["milliseconds"] = pd.to_numeric(pit_stops["milliseconds"], errors="coerce")
-        pit_stops["lap"] = pd.to_numeric(pit_stops["lap"], errors="coerce")
-        pit_stops["stop"] = pd.to_numeric(pit_stops["stop"], errors="coerce")
-
         return pit_stops
 
+    @cached_frame("lap_performance")
     def get_constructor_lap_performance(self, season: Optional[int] = None,
                                       constructor_id: Optional[int] = None) -> pd.DataFrame:
         """Get constructor lap performance with statistical analysis."""
+        if self.sql is not None:
+            race_stats = self.sql.lap_performance(self._season_range(season), constructor_id)
+            return race_stats if not race_stats.empty else pd.DataFrame()
+
         lap_times = self.get_constructor_lap_times(season, constructor_id)
 
         if lap_times.empty:
             return pd.DataFrame()
 
         # Add derived columns for analysis
-        lap_times["seconds"] = lap_times["milliseconds"] / 1000
+        lap_times = lap_times.assign(seconds=lap_times["milliseconds"] / 1000)
 
         # Group by race and constructor for race-level statistics
         race_stats = (lap_times
@@ -419,20 +801,359 @@ class F1DataLoader:
 
     def get_constructor_name(self, constructor_id: int) -> Optional[str]:
         """Get constructor name by ID."""
-        constructors = self.get_constructors()
-        constructor_row = constructors[constructors["constructorId"] == constructor_id]
-
-        if constructor_row.empty:
-            return None
-
-        return constructor_row.iloc[0]["name"]
+        return self.entities.constructors.name(constructor_id)
+
+    def get_driver_name(self, driver_id: int) -> Optional[str]:
+        """Get driver full name by ID."""
+        return self.entities.drivers.name(driver_id)
+
+    def latest_season(self) -> Optional[int]:
+        """Most recent season with race results."""
+        results = self.get_race_results()
+        return int(results["year"].max()) if not results.empty else None
+
+    def first_season(self, filename: str) -> Optional[int]:
+        """First season with rows in ``filename``, or ``None`` if it has none.
+
+        Partitioned tables answer from their manifest without loading rows.
+        """
+        state = self._state
+        if filename not in state.coverage:
+            if not (DATASET_DIR / filename).exists():
+                seasons = []
+            elif filename in PARTITIONED_TABLES and self.partitions.enabled:
+                seasons = self._partitioned_seasons(state, filename)
+            else:
+                race_seasons = self._race_season_map(state)
+                race_ids = self._load(state, filename)["raceId"].unique().tolist()
+                seasons = [race_seasons[race_id] for race_id in race_ids if race_id in race_seasons]
+            state.coverage[filename] = min(seasons) if seasons else None
+        return state.coverage[filename]
+
+    def data_coverage(self) -> Dict[str, Optional[int]]:
+        """First season of every table only recorded for part of the history."""
+        return {filename: self.first_season(filename) for filename in COVERAGE_TABLES}
+
+    def warm(self) -> None:
+        """Load every table and build indexes and derived tables ahead of requests."""
+        for csv_path in sorted(DATASET_DIR.glob("*.csv")):
+            if csv_path.name not in PARTITIONED_TABLES:
+                self.load_csv(csv_path.name)
+
+        # Optional per-lap tables are absent from smaller dataset exports
+        has_lap_times = (DATASET_DIR / "lap_times.csv").exists()
+        if has_lap_times:
+            self.get_lap_times(self.get_season_race_ids())
+        self._entry_table()
+        self._race_result_table()
+        self._teammate_table()
+        for entity in STANDINGS_TABLES:
+            self._standings_tables(entity)
+        self._entity_registry(self._state)
+        if self.sql is not None:
+            self.sql.warm([name for name in SQL_RELATIONS if name != "lap_times" or has_lap_times])
 
     def clear_cache(self):
         """Clear all cached data."""
-        self._data_cache.clear()
-        self._joined_cache.clear()
+        with self._reload_lock:
+            self._state = self._new_state(dataset_fingerprint())
         logger.info("Data cache cleared")
 
+    def add_reload_listener(self, listener: Callable[[DatasetChange], None]) -> None:
+        """Call ``listener`` with the change after every successful hot reload."""
+        self._listeners.append(listener)
+
+    def reload(self) -> Optional[DatasetChange]:
+        """Hot-reload dataset/ if its fingerprint changed.
+
+        The new version's tables, indexes and season partitions are built next
+        to the ones being served and swapped in with a single assignment, so
+        in-flight requests finish on the version they started with. Segments
+        ingested by another process are applied incrementally.
+        """
+        with self._reload_lock:
+            old = self._state
+            fingerprint = dataset_fingerprint()
+            files = changed_files(old.fingerprint, fingerprint)
+            if not files:
+                pending = [segment for segment in self.segments.segments(fingerprint)
+                           if segment["id"] not in old.segments]
+                if not pending:
+                    return None
+                new, change = self._apply_segments(old, pending)
+            else:
+                logger.info(f"Dataset changed ({', '.join(sorted(files))}), rebuilding")
+                new = self._new_state(fingerprint)
+
+                # Warm everything the old version had loaded before swapping
+                for filename in list(old.tables):
+                    if (DATASET_DIR / filename).exists():
+                        self._load(new, filename)
+                for filename, season in list(old.partition_cache):
+                    if (DATASET_DIR / filename).exists():
+                        self._partitioned_seasons(new, filename)
+                        self._season_partition(new, filename, season)
+
+                change = self._describe_change(old, new, files)
+            self._state = new
+
+        logger.info(f"Dataset reloaded: {change.old_version} -> {change.new_version}")
+        self._notify(change)
+        return change
+
+    def _notify(self, change: DatasetChange) -> None:
+        """Pass a dataset change to every reload listener."""
+        for listener in self._listeners:
+            try:
+                listener(change)
+            except Exception as e:
+                logger.error(f"Dataset reload listener failed: {e}")
+
+    def ingest(self, tables: Dict[str, pd.DataFrame]) -> DatasetChange:
+        """Append one race weekend's new rows without rebuilding the dataset.
+
+        ``tables`` maps per-race dataset files (``INGEST_TABLES``) to the new
+        rows of a single race, parsed as by ``read_table``. The rows are
+        persisted as a segment, the loaded tables, indexes and derived tables
+        are extended with them, and listeners are told which race and season
+        changed. Raises ``ValueError`` if the rows are not those of one race
+        new to every given table.
+        """
+        with self._reload_lock:
+            old = self._state
+            race_id, season, tables = self._validate_ingest(old, tables)
+            segment_id = self.segments.append(race_id, season, tables, old.fingerprint)
+            new = self._extend_state(old, segment_id, tables, race_id, season)
+            change = DatasetChange(old.version, new.version, files=set(tables),
+                                   race_ids={race_id}, seasons={season})
+            self._state = new
+
+        logger.info(f"Ingested race {race_id} ({season}): {change.old_version} -> {change.new_version}")
+        self._notify(change)
+        return change
+
+    def _validate_ingest(self, state: DatasetState,
+                         tables: Dict[str, pd.DataFrame]) -> Tuple[int, int, Dict[str, pd.DataFrame]]:
+        """Check ingested rows; returns their race, its season and the rows in file column order."""
+        if not tables:
+            raise ValueError("No rows to ingest")
+
+        ordered = {filename: self._ingest_rows(filename, df) for filename, df in tables.items()}
+        race_ids = {int(race_id) for df in ordered.values() for race_id in df["raceId"].unique()}
+        if len(race_ids) != 1:
+            raise ValueError(f"Rows must belong to exactly one race, got {sorted(race_ids)}")
+        race_id = race_ids.pop()
+
+        if "races.csv" in ordered:
+            season = int(ordered["races.csv"]["year"].iloc[0])
+        else:
+            season = self._race_season_map(state).get(race_id)
+            if season is None:
+                raise ValueError(f"Race {race_id} is not in races.csv; include its races.csv row")
+
+        for filename, rows in ordered.items():
+            target = self._ingest_target(state, filename, season)
+            if target is None:
+                continue
+            df, index = target
+            if len(index.columns["raceId"].positions(race_id)):
+                raise ValueError(f"{filename} already has rows for race {race_id}")
+            # Align dtypes now so a mismatch fails before the segment is persisted
+            append_rows(df.iloc[:0], rows)
+
+        return race_id, season, ordered
+
+    @staticmethod
+    def _ingest_rows(filename: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Check the rows ingested into one file; returns them in file column order."""
+        if filename not in INGEST_TABLES:
+            raise ValueError(f"{filename} cannot be ingested; expected one of {INGEST_TABLES}")
+        filepath = DATASET_DIR / filename
+        if not filepath.exists():
+            raise ValueError(f"Dataset file not found: {filepath}")
+
+        header = read_header(filepath)
+        if sorted(df.columns) != sorted(header):
+            raise ValueError(f"{filename} rows must have exactly the columns {header}")
+        if df.empty:
+            raise ValueError(f"{filename} has no rows")
+        return df[header].reset_index(drop=True)
+
+    def _ingest_target(self, state: DatasetState, filename: str,
+                       season: int) -> Optional[Tuple[pd.DataFrame, TableIndex]]:
+        """The loaded table or season partition that rows of ``season`` are appended to, if any."""
+        if filename in PARTITIONED_TABLES and self.partitions.enabled:
+            if season not in self._partitioned_seasons(state, filename):
+                return None
+            return self._season_partition(state, filename, season)
+        self._load(state, filename)
+        return state.tables[filename], state.indexes[filename]
+
+    @staticmethod
+    def _appended(table: Tuple[pd.DataFrame, TableIndex],
+                  rows: pd.DataFrame) -> Tuple[pd.DataFrame, TableIndex]:
+        """A table and its index with ``rows`` appended."""
+        df, index = table
+        combined = append_rows(df, rows)
+        return combined, index.extended(combined.iloc[len(df):])
+
+    def _extend_state(self, old: DatasetState, segment_id: int, tables: Dict[str, pd.DataFrame],
+                      race_id: int, season: int) -> DatasetState:
+        """New state serving ``old`` plus one ingested race, built without re-reading tables.
+
+        Loaded tables and season partitions get the rows appended and their
+        indexes spliced; the entry, fact, teammate and standings tables get
+        the race's derived rows appended. Small tables built from races.csv
+        are rebuilt lazily, and only the cached frames that may cover the
+        race are dropped.
+        """
+        new = DatasetState(old.fingerprint, old.segments + (segment_id,))
+        new.columns = dict(old.columns)
+
+        appended = self._extend_tables(old, new, tables, season)
+        if old.race_seasons is not None:
+            new.race_seasons = {**old.race_seasons, race_id: season}
+        if "races.csv" not in tables:
+            new.calendar, new.entities = old.calendar, old.entities
+        new.coverage = {filename: first for filename, first in old.coverage.items() if filename not in tables}
+
+        self._extend_derived(old, new, appended.get("results.csv"))
+        self._extend_all_standings(old, new, tables, appended, season)
+
+        new.season_views = {view_season: view for view_season, view in old.season_views.items()
+                            if view_season is not None and view_season != season}
+        new.frame_cache = old.frame_cache.retained(
+            lambda key: self._frame_unaffected(key, race_id, season))
+        return new
+
+    def _extend_tables(self, old: DatasetState, new: DatasetState, tables: Dict[str, pd.DataFrame],
+                       season: int) -> Dict[str, pd.DataFrame]:
+        """Append ingested rows to the loaded tables and partitions; returns the aligned new rows."""
+        appended: Dict[str, pd.DataFrame] = {}
+        for filename, df in old.tables.items():
+            if filename in tables:
+                new.tables[filename], new.indexes[filename] = self._appended((df, old.indexes[filename]),
+                                                                            tables[filename])
+                appended[filename] = new.tables[filename].iloc[len(df):]
+            else:
+                new.tables[filename], new.indexes[filename] = df, old.indexes[filename]
+
+        for filename, seasons in old.partition_seasons.items():
+            new.partition_seasons[filename] = sorted(set(seasons) | {season}) if filename in tables else seasons
+        for (filename, partition_season), partition in old.partition_cache.items():
+            if filename in tables and partition_season == season:
+                partition = self._appended(partition, tables[filename])
+            new.partition_cache[(filename, partition_season)] = partition
+        return appended
+
+    def _extend_derived(self, old: DatasetState, new: DatasetState, results: Optional[pd.DataFrame]) -> None:
+        """Append the derived rows of ingested results to the entry, fact and teammate tables."""
+        new.entries, new.race_results, new.teammates = old.entries, old.race_results, old.teammates
+        if results is None:
+            return
+        if old.entries is not None:
+            entries = results[["raceId", "driverId", "constructorId"]].drop_duplicates(["raceId", "driverId"])
+            new.entries = self._appended(old.entries, entries)
+        if old.race_results is not None:
+            new.race_results = self._appended(old.race_results, self._race_fact_rows(new, results))
+        if old.teammates is not None:
+            new.teammates = self._appended(old.teammates, self._teammate_rows(new, results))
+
+    def _extend_all_standings(self, old: DatasetState, new: DatasetState, tables: Dict[str, pd.DataFrame],
+                              appended: Dict[str, pd.DataFrame], season: int) -> None:
+        """Carry over or extend the standings tables; those that must be rebuilt are dropped."""
+        for entity, standings in old.standings.items():
+            filename = STANDINGS_TABLES[entity][0]
+            if filename not in tables:
+                new.standings[entity] = standings
+            elif filename in appended:
+                extended = self._extend_standings(new, entity, standings, appended[filename], season)
+                if extended is not None:
+                    new.standings[entity] = extended
+
+    def _extend_standings(self, state: DatasetState, entity: str,
+                          standings: Tuple[pd.DataFrame, TableIndex, pd.DataFrame, TableIndex],
+                          rows: pd.DataFrame, season: int
+                          ) -> Optional[Tuple[pd.DataFrame, TableIndex, pd.DataFrame, TableIndex]]:
+        """Standings tables with the rows of a new latest round, or ``None`` to rebuild them.
+
+        A race before the last recorded round would have to be sorted into
+        the middle of the progression, so those are rebuilt from scratch.
+        """
+        progression, index, final, _ = standings
+        id_column = STANDINGS_TABLES[entity][1]
+        rows = self._standings_rows(state, rows)
+        if rows.empty:
+            return standings
+
+        if not progression.empty:
+            last = progression.iloc[-1]
+            if (int(rows["year"].iloc[0]), int(rows["round"].iloc[0])) <= (int(last["year"]), int(last["round"])):
+                return None
+
+        progression, index = self._appended((progression, index), rows)
+        season_final = (TableIndex.select(progression, index.lookup(year=season))
+                        .drop_duplicates([id_column], keep="last")
+                        .sort_values(id_column))
+        final = pd.concat([final[final["year"].lt(season)], season_final], ignore_index=True)
+        return progression, index, final, TableIndex(final, INDEX_COLUMNS)
+
+    @staticmethod
+    def _frame_unaffected(key: FrameKey, race_id: int, season: int) -> bool:
+        """Whether a cached derived frame cannot include rows of ``race_id``."""
+        params = dict(key[1:])
+        if params.get("race_ids"):
+            return race_id not in params["race_ids"]
+        return params.get("season") is not None and params["season"] != season
+
+    def _apply_segments(self, old: DatasetState,
+                        segments: List[Dict]) -> Tuple[DatasetState, DatasetChange]:
+        """Extend ``old`` with segments another process ingested."""
+        new = old
+        for segment in segments:
+            tables = {filename: self.segments.read(segment["id"], filename) for filename in segment["tables"]}
+            new = self._extend_state(new, segment["id"], tables, segment["race_id"], segment["season"])
+            logger.info(f"Applied segment {segment['id']} (race {segment['race_id']})")
+
+        change = DatasetChange(old.version, new.version,
+                               files=set().union(*(segment["tables"] for segment in segments)),
+                               race_ids={segment["race_id"] for segment in segments},
+                               seasons={segment["season"] for segment in segments})
+        return new, change
+
+    def _describe_change(self, old: DatasetState, new: DatasetState, files) -> DatasetChange:
+        """Narrow a dataset change down to the races and seasons it touches."""
+        change = DatasetChange(old.version, new.version, files=set(files), race_ids=set())
+
+        for filename in files:
+            if filename in old.tables and filename in new.tables:
+                race_ids = changed_race_ids(old.tables[filename], new.tables[filename])
+            else:
+                race_ids = None
+
+            if race_ids is None:
+                change.race_ids = None
+                break
+            change.race_ids |= race_ids
+
+        if change.race_ids is not None:
+            seasons = {**self._race_season_map(old), **self._race_season_map(new)}
+            change.seasons = {seasons[race_id] for race_id in change.race_ids if race_id in seasons}
+
+        return change
+
+    def start_watching(self, interval: float) -> None:
+        """Poll dataset/ every ``interval`` seconds and hot-reload on change."""
+        if self._watcher is None:
+            self._watcher = DatasetWatcher(self, interval)
+            self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop the background dataset watcher."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
 
 # Global instance
 data_loader = F1DataLoader()
\ No newline at end of file
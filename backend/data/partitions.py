@@ -0,0 +1,176 @@
+"""Season-partitioned Arrow copies of the large per-lap tables.
+
+``lap_times.csv`` is far larger than every other table, yet a metric
+rarely needs more than one season of it. Instead of one snapshot, the CSV
+is streamed in chunks and each chunk's rows are appended to the Arrow file
+of their season, so ingest memory stays bounded by the chunk size::
+
+    SNAPSHOT_DIR/partitions/lap_times.json        # manifest (source and races.csv hashes)
+    SNAPSHOT_DIR/partitions/lap_times/2021.arrow  # compact columns for one season
+
+Rows are assigned to seasons through races.csv, so the partitions are
+also rebuilt when races.csv changes. Only the partitions of the requested
+seasons are ever loaded.
+"""
+
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional
+
+import pandas as pd
+
+from backend.config import ENABLE_SHARED_TABLES, ENABLE_SNAPSHOTS, PARTITION_CHUNK_ROWS, SNAPSHOT_DIR
+from backend.data.schema import NULL_VALUES, TABLE_SCHEMAS
+from backend.data.snapshot import SNAPSHOT_FORMAT_VERSION, SnapshotStore, feather, replace_dir, tmp_path_for
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:  # pragma: no cover - pyarrow ships with the deployment
+    pa = ipc = None
+
+logger = logging.getLogger(__name__)
+
+# Columns kept per partitioned table; lap time strings duplicate milliseconds
+PARTITION_COLUMNS: Dict[str, List[str]] = {
+    "lap_times.csv": ["raceId", "driverId", "lap", "position", "milliseconds"],
+}
+
+
+class SeasonPartitionStore(SnapshotStore):
+    """Streams a dataset CSV into one Arrow file per season."""
+
+    def __init__(self, snapshot_dir: Path = SNAPSHOT_DIR / "partitions",
+                 enabled: bool = ENABLE_SNAPSHOTS, chunk_rows: int = PARTITION_CHUNK_ROWS,
+                 zero_copy: bool = ENABLE_SHARED_TABLES):
+        super().__init__(snapshot_dir, enabled)
+        self.chunk_rows = chunk_rows
+        self.zero_copy = zero_copy
+
+    def _snapshot_path(self, csv_path: Path) -> Path:
+        return self.snapshot_dir / csv_path.stem
+
+    def _partition_path(self, csv_path: Path, season: int) -> Path:
+        return self._snapshot_path(csv_path) / f"{season}.arrow"
+
+    @classmethod
+    def _races_hash(cls, csv_path: Path) -> Optional[str]:
+        """Hash of the races.csv next to ``csv_path``, which decides each row's season."""
+        races_path = csv_path.with_name("races.csv")
+        return cls._file_hash(races_path) if races_path.exists() else None
+
+    def is_fresh(self, csv_path: Path) -> bool:
+        """Check whether the partitions match both ``csv_path`` and races.csv on disk."""
+        if not super().is_fresh(csv_path):
+            return False
+        return self._read_manifest(csv_path).get("races_sha256") == self._races_hash(csv_path)
+
+    def build(self, csv_path: Path, season_of: Mapping[int, int]) -> Dict[int, int]:
+        """Stream ``csv_path`` into per-season partitions.
+
+        ``season_of`` maps raceId to season; rows of unknown races are dropped.
+        Returns the number of rows written per season.
+        """
+        with self._build_lock(csv_path) as stale:
+            if not stale:
+                manifest = self._read_manifest(csv_path)
+                return {int(season): count for season, count in manifest["seasons"].items()}
+            return self._write_partitions(csv_path, season_of)
+
+    def _write_partitions(self, csv_path: Path, season_of: Mapping[int, int]) -> Dict[int, int]:
+        stat = csv_path.stat()
+        races_hash = self._races_hash(csv_path)
+        columns = PARTITION_COLUMNS[csv_path.name]
+        schema = TABLE_SCHEMAS.get(csv_path.name, {})
+        dtypes = {column: dtype for column, dtype in schema.items() if column in columns}
+
+        partition_dir = self._snapshot_path(csv_path)
+        tmp_dir = tmp_path_for(partition_dir)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        writers: Dict[int, ipc.RecordBatchFileWriter] = {}
+        rows: Dict[int, int] = {}
+        dropped = 0
+        try:
+            chunks = pd.read_csv(csv_path, usecols=columns, dtype=dtypes,
+                                 na_values=NULL_VALUES, chunksize=self.chunk_rows)
+            for chunk in chunks:
+                seasons = chunk["raceId"].map(season_of)
+                dropped += int(seasons.isna().sum())
+
+                for season, part in chunk[columns].groupby(seasons, sort=False):
+                    season = int(season)
+                    batch = pa.RecordBatch.from_pandas(part, preserve_index=False)
+                    if season not in writers:
+                        sink = str(tmp_dir / f"{season}.arrow")
+                        writers[season] = ipc.new_file(sink, batch.schema)
+                        rows[season] = 0
+                    writers[season].write_batch(batch)
+                    rows[season] += len(part)
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+        # One contiguous batch per season lets readers map columns without copying
+        for season in rows:
+            chunked = tmp_dir / f"{season}.parts.arrow"
+            os.replace(tmp_dir / f"{season}.arrow", chunked)
+            with pa.memory_map(str(chunked)) as source:
+                table = ipc.open_file(source).read_all().combine_chunks()
+            with ipc.new_file(str(tmp_dir / f"{season}.arrow"), table.schema) as writer:
+                writer.write_table(table)
+            chunked.unlink()
+
+        replace_dir(tmp_dir, partition_dir)
+
+        self._write_manifest(csv_path, {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "source": csv_path.name,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": self._file_hash(csv_path),
+            "races_sha256": races_hash,
+            "seasons": {str(season): count for season, count in sorted(rows.items())},
+            "built_at": datetime.now().isoformat()
+        })
+
+        if dropped:
+            logger.warning(f"Dropped {dropped} {csv_path.name} rows of races missing from races.csv")
+        logger.info(f"Partitioned {csv_path.name}: {sum(rows.values())} rows in {len(rows)} seasons")
+        return rows
+
+    def ensure(self, csv_path: Path, season_of: Mapping[int, int]) -> None:
+        """Rebuild the partitions of ``csv_path`` if the CSV or races.csv changed."""
+        if not self.is_fresh(csv_path):
+            self.build(csv_path, season_of)
+
+    def seasons(self, csv_path: Path) -> List[int]:
+        """Seasons that have a partition for ``csv_path``."""
+        manifest = self._read_manifest(csv_path)
+        if manifest is None:
+            return []
+        return sorted(int(season) for season in manifest["seasons"])
+
+    def load_season(self, csv_path: Path, season: int,
+                    columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """Memory-map one season partition (only ``columns`` if given), or ``None`` if it has no rows.
+
+        With ``zero_copy`` the null-free numeric columns stay backed by the
+        mapped file, so every worker process shares the same pages.
+        """
+        path = self._partition_path(csv_path, season)
+        if not path.exists():
+            return None
+        if columns is not None:
+            columns = [column for column in PARTITION_COLUMNS[csv_path.name] if column in columns]
+        if not self.zero_copy:
+            return feather.read_feather(path, columns=columns, memory_map=True)
+
+        table = ipc.open_file(pa.memory_map(str(path))).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        return table.to_pandas(split_blocks=True)
@@ -0,0 +1,113 @@
+"""Dataset fingerprinting and change detection for hot reloads."""
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import pandas as pd
+
+from backend.config import DATASET_DIR
+
+logger = logging.getLogger(__name__)
+
+# filename -> (size, mtime_ns) of every CSV in dataset/
+Fingerprint = Dict[str, Tuple[int, int]]
+
+
+def dataset_fingerprint(dataset_dir: Path = DATASET_DIR) -> Fingerprint:
+    """Fingerprint dataset/ from file sizes and modification times."""
+    fingerprint = {}
+    for csv_path in sorted(dataset_dir.glob("*.csv")):
+        stat = csv_path.stat()
+        fingerprint[csv_path.name] = (stat.st_size, stat.st_mtime_ns)
+    return fingerprint
+
+
+def fingerprint_version(fingerprint: Fingerprint, segments: Iterable[int] = ()) -> str:
+    """Short, stable identifier of a dataset fingerprint and its ingested segments."""
+    segments = list(segments)
+    payload = {"files": fingerprint, "segments": segments} if segments else fingerprint
+    encoded = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:12]
+
+
+def changed_files(old: Fingerprint, new: Fingerprint) -> Set[str]:
+    """Files added, removed or modified between two fingerprints."""
+    return {name for name in old.keys() | new.keys() if old.get(name) != new.get(name)}
+
+
+def changed_race_ids(old: pd.DataFrame, new: pd.DataFrame) -> Optional[Set[int]]:
+    """Race IDs whose rows differ between two versions of a table.
+
+    Rows are hashed and the hashes summed per race, so appended, removed and
+    edited rows are all detected. Returns ``None`` when the table has no
+    ``raceId`` column or its columns changed, meaning every race may be affected.
+    """
+    if "raceId" not in old.columns or list(old.columns) != list(new.columns):
+        return None
+
+    def race_digests(df: pd.DataFrame) -> pd.Series:
+        hashes = pd.util.hash_pandas_object(df, index=False)
+        return hashes.groupby(df["raceId"].to_numpy()).sum()
+
+    before, after = race_digests(old), race_digests(new)
+    before, after = before.align(after, fill_value=0)
+    return {int(race_id) for race_id in before.index[before.ne(after)]}
+
+
+@dataclass
+class DatasetChange:
+    """What changed in dataset/ between two loaded versions.
+
+    ``race_ids`` and ``seasons`` are ``None`` when the affected races could not
+    be narrowed down, in which case every race must be considered changed.
+    """
+    old_version: str
+    new_version: str
+    files: Set[str] = field(default_factory=set)
+    race_ids: Optional[Set[int]] = None
+    seasons: Optional[Set[int]] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "old_version": self.old_version,
+            "new_version": self.new_version,
+            "files": sorted(self.files),
+            "race_ids": sorted(self.race_ids) if self.race_ids is not None else None,
+            "seasons": sorted(self.seasons) if self.seasons is not None else None
+        }
+
+
+class DatasetWatcher:
+    """Background thread that periodically hot-reloads the data loader."""
+
+    def __init__(self, loader, interval: float):
+        self.loader = loader
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="dataset-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"Watching {DATASET_DIR} for changes every {self.interval}s")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.loader.reload()
+            except Exception as e:
+                # Keep serving the current tables; the next poll retries
+                logger.error(f"Dataset reload failed: {e}")
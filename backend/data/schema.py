@@ -0,0 +1,154 @@
+"""Per-file schemas applied when parsing the dataset CSVs.
+
+The Ergast export writes ``\\N`` for missing values, which otherwise leaves
+numeric columns such as ``results.position`` as object dtype. Each CSV is
+parsed once into its final dtypes instead: int32 keys, nullable ``Int32``
+for columns that may be missing, categoricals for low-cardinality labels,
+and lap/duration strings (lap ``time``, ``q1``-``q3``, pit ``duration``,
+``fastestLapTime``) converted to integer milliseconds.
+"""
+
+import csv
+import io
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+# Null marker used throughout the Ergast CSV export
+NULL_VALUES = ["\\N"]
+
+# Column dtypes per dataset file. Columns not listed keep pandas' inference.
+TABLE_SCHEMAS: Dict[str, Dict[str, str]] = {
+    "circuits.csv": {
+        "circuitId": "int32", "alt": "Int32",
+    },
+    "constructor_results.csv": {
+        "constructorResultsId": "int32", "raceId": "int32", "constructorId": "int32",
+        "points": "float64", "status": "category",
+    },
+    "constructor_standings.csv": {
+        "constructorStandingsId": "int32", "raceId": "int32", "constructorId": "int32",
+        "points": "float64", "position": "Int32", "positionText": "category", "wins": "int32",
+    },
+    "constructors.csv": {
+        "constructorId": "int32", "nationality": "category",
+    },
+    "driver_standings.csv": {
+        "driverStandingsId": "int32", "raceId": "int32", "driverId": "int32",
+        "points": "float64", "position": "Int32", "positionText": "category", "wins": "int32",
+    },
+    "drivers.csv": {
+        "driverId": "int32", "number": "Int32", "nationality": "category",
+    },
+    "lap_times.csv": {
+        "raceId": "int32", "driverId": "int32", "lap": "int32", "position": "int32",
+        "milliseconds": "int32",
+    },
+    "pit_stops.csv": {
+        "raceId": "int32", "driverId": "int32", "stop": "int32", "lap": "int32",
+        "milliseconds": "int32",
+    },
+    "qualifying.csv": {
+        "qualifyId": "int32", "raceId": "int32", "driverId": "int32", "constructorId": "int32",
+        "number": "int32", "position": "Int32",
+    },
+    "races.csv": {
+        "raceId": "int32", "year": "int32", "round": "int32", "circuitId": "int32",
+    },
+    "results.csv": {
+        "resultId": "int32", "raceId": "int32", "driverId": "int32", "constructorId": "int32",
+        "number": "Int32", "grid": "int32", "position": "Int32", "positionText": "category",
+        "positionOrder": "int32", "points": "float64", "laps": "int32", "milliseconds": "Int32",
+        "fastestLap": "Int32", "rank": "Int32", "fastestLapSpeed": "float32", "statusId": "int32",
+    },
+    "seasons.csv": {
+        "year": "int32",
+    },
+    "sprint_results.csv": {
+        "resultId": "int32", "raceId": "int32", "driverId": "int32", "constructorId": "int32",
+        "number": "int32", "grid": "int32", "position": "Int32", "positionText": "category",
+        "positionOrder": "int32", "points": "float64", "laps": "int32", "milliseconds": "Int32",
+        "fastestLap": "Int32", "statusId": "int32",
+    },
+    "status.csv": {
+        "statusId": "int32", "status": "category",
+    },
+}
+
+# Lap and duration strings ("1:26.572", "26.898") stored as milliseconds
+DURATION_COLUMNS: Dict[str, List[str]] = {
+    "lap_times.csv": ["time"],
+    "pit_stops.csv": ["duration"],
+    "qualifying.csv": ["q1", "q2", "q3"],
+    "results.csv": ["fastestLapTime"],
+    "sprint_results.csv": ["fastestLapTime"],
+}
+
+_DURATION_PATTERN = r"^(?:(?:(?P<h>\d+):)?(?P<m>\d+):)?(?P<s>\d+(?:\.\d+)?)$"
+
+
+def parse_duration_ms(values: pd.Series) -> pd.Series:
+    """Parse ``[[h:]m:]s.fff`` strings into nullable int32 milliseconds."""
+    parts = values.astype("string").str.strip().str.extract(_DURATION_PATTERN)
+    hours = pd.to_numeric(parts["h"]).fillna(0)
+    minutes = pd.to_numeric(parts["m"]).fillna(0)
+    seconds = pd.to_numeric(parts["s"])
+
+    total_ms = ((hours * 60 + minutes) * 60 + seconds) * 1000
+    return total_ms.round().astype("Int32")
+
+
+def read_header(filepath: Path) -> List[str]:
+    """Column names of a dataset CSV, in file order."""
+    with open(filepath, newline="") as f:
+        return next(csv.reader(f), [])
+
+
+def _parse_table(source: Union[Path, io.StringIO], filename: str,
+                 columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Parse CSV text of dataset file ``filename`` into its final dtypes."""
+    schema = TABLE_SCHEMAS.get(filename, {})
+    durations = DURATION_COLUMNS.get(filename, [])
+    if columns is not None:
+        schema = {column: dtype for column, dtype in schema.items() if column in columns}
+        durations = [column for column in durations if column in columns]
+
+    # Duration columns are read as text and converted below
+    dtypes = dict(schema)
+    dtypes.update(dict.fromkeys(durations, "object"))
+
+    df = pd.read_csv(source, na_values=NULL_VALUES, dtype=dtypes, usecols=columns)
+
+    if durations:
+        df = df.assign(**{column: parse_duration_ms(df[column]) for column in durations if column in df.columns})
+
+    return df
+
+
+def read_table(filepath: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Parse a dataset CSV into its final dtypes, optionally only ``columns``."""
+    return _parse_table(filepath, filepath.name, columns)
+
+
+def parse_rows(rows: List[Dict[str, Any]], filename: str) -> pd.DataFrame:
+    """Parse JSON-style rows of dataset file ``filename`` exactly like its CSV.
+
+    Rows are written back as CSV text (``None`` and absent keys as ``\\N``)
+    so nulls, dtypes and duration strings go through the same parser.
+    """
+    columns = list(dict.fromkeys(column for row in rows for column in row))
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, restval=NULL_VALUES[0])
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({column: NULL_VALUES[0] if value is None else value for column, value in row.items()})
+    buffer.seek(0)
+    return _parse_table(buffer, filename)
+
+
+def memory_breakdown(df: pd.DataFrame) -> Dict[str, int]:
+    """Resident bytes per column, including string payloads."""
+    usage = df.memory_usage(deep=True, index=False)
+    return {column: int(nbytes) for column, nbytes in usage.items()}
+
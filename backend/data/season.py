@@ -0,0 +1,102 @@
+"""Immutable per-season bundle of the dataset tables.
+
+Most metrics start from one season: its races, then that season's results,
+qualifying, pit stops or lap times, often compared against the whole field
+of each race. A ``SeasonView`` slices those tables once per season and
+dataset version, indexes the slices and computes the race-level baselines
+(field averages, fastest laps, grid averages). A bulk request passes the
+same view to every calculator it runs, so the base tables are sliced once
+instead of once per metric.
+
+Slices and baselines are built on first access, so a view only ever loads
+the tables its metrics read (a results-only metric never touches the lap
+time partitions).
+"""
+
+import threading
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+import pandas as pd
+from pandas.core.groupby import SeriesGroupBy
+
+from backend.data.index import Keys, TableIndex
+
+# Key columns indexed on every table of a view
+VIEW_INDEX_COLUMNS = ["raceId", "driverId", "constructorId"]
+
+
+def _by_race(df: pd.DataFrame, column: str, divisor: int = 1) -> SeriesGroupBy:
+    """``column`` (divided by ``divisor``) grouped by race; empty if the table does not carry it."""
+    if column not in df.columns:
+        df = pd.DataFrame({"raceId": pd.Series(dtype="int32"), column: pd.Series(dtype="float64")})
+    values = df[column].astype("float64") / divisor
+    return values.groupby(df["raceId"].to_numpy())
+
+
+class SeasonView:
+    """One season's races, table slices and race baselines (``season=None``: every served season).
+
+    ``loaders`` maps each table name to a function returning the season's
+    rows of it. ``lap_baselines`` holds, per raceId, the field's average and
+    fastest lap in seconds; ``pit_stop_baselines`` the field's average stop
+    in seconds; ``qualifying_baselines`` the average classified grid position.
+    """
+
+    def __init__(self, season: Optional[int], races: pd.DataFrame,
+                 loaders: Mapping[str, Callable[[], pd.DataFrame]]):
+        self.season = season
+        self.races = races
+        self.race_ids: Tuple[int, ...] = tuple(races["raceId"].tolist())
+        self.loaders = MappingProxyType(dict(loaders))
+        self._tables: Dict[str, Tuple[pd.DataFrame, TableIndex]] = {}
+        self._baselines: Dict[str, pd.DataFrame] = {}
+        self._locks = {name: threading.Lock() for name in ("tables", "baselines")}
+
+    def _slice(self, name: str) -> Tuple[pd.DataFrame, TableIndex]:
+        """The season's ``name`` table and its index, loaded on first use."""
+        sliced = self._tables.get(name)
+        if sliced is None:
+            with self._locks["tables"]:
+                sliced = self._tables.get(name)
+                if sliced is None:
+                    df = self.loaders[name]()
+                    sliced = self._tables[name] = (df, TableIndex(df, VIEW_INDEX_COLUMNS))
+        return sliced
+
+    def table(self, name: str, **criteria: Keys) -> pd.DataFrame:
+        """Rows of the season's ``name`` table matching ``criteria`` (see ``TableIndex.lookup``)."""
+        df, index = self._slice(name)
+        return TableIndex.select(df, index.lookup(**criteria))
+
+    def _baseline(self, name: str, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        baseline = self._baselines.get(name)
+        if baseline is None:
+            with self._locks["baselines"]:
+                baseline = self._baselines.get(name)
+                if baseline is None:
+                    baseline = self._baselines[name] = build()
+        return baseline
+
+    @property
+    def lap_baselines(self) -> pd.DataFrame:
+        def build() -> pd.DataFrame:
+            lap_seconds = _by_race(self._slice("lap_times")[0], "milliseconds", 1000)
+            return pd.DataFrame({"field_avg_s": lap_seconds.mean(), "fastest_lap_s": lap_seconds.min()})
+        return self._baseline("lap_times", build)
+
+    @property
+    def pit_stop_baselines(self) -> pd.DataFrame:
+        def build() -> pd.DataFrame:
+            stop_seconds = _by_race(self._slice("pit_stops")[0], "milliseconds", 1000)
+            return pd.DataFrame({"field_avg_s": stop_seconds.mean()})
+        return self._baseline("pit_stops", build)
+
+    @property
+    def qualifying_baselines(self) -> pd.DataFrame:
+        def build() -> pd.DataFrame:
+            grid = self._slice("qualifying")[0]
+            if "position" in grid.columns:
+                grid = grid[grid["position"].notna() & (grid["position"] > 0)]
+            return pd.DataFrame({"grid_average": _by_race(grid, "position").mean()})
+        return self._baseline("qualifying", build)
@@ -0,0 +1,180 @@
+"""Append-only segments of race weekends ingested after the base dataset.
+
+A new race weekend used to mean replacing the CSVs and rebuilding every
+snapshot, index and derived table. Instead, the new rows of one race are
+written as a segment next to the base snapshots::
+
+    SNAPSHOT_DIR/segments/manifest.json            # segments in ingest order
+    SNAPSHOT_DIR/segments/000001/results.arrow     # the race's new results rows
+    SNAPSHOT_DIR/segments/000001/lap_times.arrow   # ... and its laps, stops, standings
+
+and the loader serves each table as its base rows followed by the rows of
+its segments. A segment extends the CSV as it was when the race was
+ingested; once that CSV changes size (e.g. it was replaced by a newer
+export that already holds the race) the segment is no longer applied.
+
+Appends from several worker processes serialize on an ``flock`` of
+``manifest.lock``, so each gets its own segment ID.
+"""
+
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from backend.config import ENABLE_SNAPSHOTS, SNAPSHOT_DIR
+from backend.data.reload import Fingerprint
+from backend.data.snapshot import SNAPSHOT_FORMAT_VERSION, exclusive_lock, feather, replace_dir, tmp_path_for
+
+logger = logging.getLogger(__name__)
+
+# Per-race tables a race weekend adds rows to
+INGEST_TABLES = [
+    "races.csv", "results.csv", "sprint_results.csv", "qualifying.csv", "pit_stops.csv",
+    "lap_times.csv", "constructor_results.csv", "constructor_standings.csv", "driver_standings.csv",
+]
+
+MANIFEST_FILE = "manifest.json"
+
+
+def append_rows(base: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+    """Append ``rows`` below ``base``, keeping the dtypes of ``base``.
+
+    New categorical labels are added after the existing categories, so the
+    codes of the base rows are unchanged.
+    """
+    aligned = {}
+    for column in base.columns:
+        dtype = base[column].dtype
+        values = rows[column]
+        if isinstance(dtype, pd.CategoricalDtype):
+            labels = pd.Index(values.dropna().astype(object).unique())
+            new_labels = labels.difference(dtype.categories)
+            if len(new_labels):
+                dtype = pd.CategoricalDtype(dtype.categories.append(new_labels), ordered=dtype.ordered)
+                base = base.assign(**{column: base[column].cat.set_categories(dtype.categories)})
+        try:
+            aligned[column] = values.astype(dtype)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Column {column} does not fit {dtype}: {e}") from e
+
+    return pd.concat([base, pd.DataFrame(aligned)], ignore_index=True)
+
+
+class SegmentStore:
+    """Writes and reads the per-race segments appended to the dataset tables."""
+
+    def __init__(self, segment_dir: Path = SNAPSHOT_DIR / "segments", enabled: bool = ENABLE_SNAPSHOTS):
+        self.segment_dir = segment_dir
+        self.enabled = enabled and feather is not None
+
+    def _manifest_path(self) -> Path:
+        return self.segment_dir / MANIFEST_FILE
+
+    def _segment_path(self, segment_id: int, filename: str) -> Path:
+        return self.segment_dir / f"{segment_id:06d}" / f"{Path(filename).stem}.arrow"
+
+    def _read_manifest(self) -> List[Dict]:
+        path = self._manifest_path()
+        if not self.enabled or not path.exists():
+            return []
+
+        try:
+            with open(path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable segment manifest, ignoring segments: {e}")
+            return []
+
+        if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            return []
+        return manifest["segments"]
+
+    def _write_manifest(self, segments: List[Dict]) -> None:
+        path = self._manifest_path()
+        tmp_path = tmp_path_for(path)
+        with open(tmp_path, "w") as f:
+            json.dump({"format_version": SNAPSHOT_FORMAT_VERSION, "segments": segments}, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def segments(self, fingerprint: Fingerprint) -> List[Dict]:
+        """Segments in ingest order, each with only the tables still extending their CSV."""
+        valid = []
+        for segment in self._read_manifest():
+            tables = {filename: rows for filename, rows in segment["tables"].items()
+                      if filename in fingerprint and fingerprint[filename][0] == segment["base"][filename]}
+            if len(tables) < len(segment["tables"]):
+                stale = sorted(set(segment["tables"]) - set(tables))
+                logger.info(f"Segment {segment['id']} no longer applies to {', '.join(stale)}")
+            if tables:
+                valid.append({**segment, "tables": tables})
+        return valid
+
+    def ids(self, fingerprint: Fingerprint) -> Tuple[int, ...]:
+        """IDs of the segments applying to a dataset fingerprint."""
+        return tuple(segment["id"] for segment in self.segments(fingerprint))
+
+    def frames(self, filename: str, fingerprint: Fingerprint, segment_ids: Tuple[int, ...],
+               columns: Optional[List[str]] = None, season: Optional[int] = None) -> List[pd.DataFrame]:
+        """Rows of ``filename`` in the given segments (optionally of one season), in ingest order."""
+        frames = []
+        for segment in self.segments(fingerprint):
+            if segment["id"] not in segment_ids or filename not in segment["tables"]:
+                continue
+            if season is not None and segment["season"] != season:
+                continue
+            frames.append(self.read(segment["id"], filename, columns))
+        return frames
+
+    def read(self, segment_id: int, filename: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Rows of ``filename`` in one segment."""
+        return feather.read_feather(self._segment_path(segment_id, filename), columns=columns)
+
+    def append(self, race_id: int, season: int, tables: Dict[str, pd.DataFrame],
+               fingerprint: Fingerprint) -> int:
+        """Write one race's new rows per table as a segment and return its ID.
+
+        The segment directory is built aside and renamed into place before the
+        manifest lists it, so readers never see a partial segment.
+        """
+        if not self.enabled:
+            raise RuntimeError("Segments need snapshots enabled (ENABLE_SNAPSHOTS and pyarrow)")
+
+        base = {filename: fingerprint[filename][0] for filename in tables}
+
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        with exclusive_lock(self.segment_dir / "manifest.lock"):
+            # Another worker may have appended since this one loaded its state
+            segments = self._read_manifest()
+            for segment in segments:
+                if segment["race_id"] == race_id and any(segment["base"].get(filename) == size
+                                                         for filename, size in base.items()):
+                    raise ValueError(f"Race {race_id} was already ingested as segment {segment['id']}")
+            segment_id = max((segment["id"] for segment in segments), default=0) + 1
+
+            segment_dir = self._segment_path(segment_id, "_").parent
+            tmp_dir = tmp_path_for(segment_dir)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir(parents=True)
+            for filename, df in tables.items():
+                feather.write_feather(df, tmp_dir / f"{Path(filename).stem}.arrow", compression="uncompressed")
+            replace_dir(tmp_dir, segment_dir)
+
+            segments.append({
+                "id": segment_id,
+                "race_id": race_id,
+                "season": season,
+                "tables": {filename: len(df) for filename, df in tables.items()},
+                "base": base,
+                "created_at": datetime.now().isoformat()
+            })
+            self._write_manifest(segments)
+
+        logger.info(f"Wrote segment {segment_id} for race {race_id}: "
+                    f"{sum(len(df) for df in tables.values())} rows in {len(tables)} tables")
+        return segment_id
@@ -0,0 +1,162 @@
+"""Encoding of cached metric payloads.
+
+The metric cache stores each result as a document (see ``MetricCache.set``).
+``CACHE_SERIALIZER`` picks how it is encoded and ``CACHE_COMPRESSION`` how
+payloads of at least ``CACHE_COMPRESS_MIN_BYTES`` are compressed::
+
+    CACHE_SERIALIZER = "json"      # compact text (default)
+    CACHE_SERIALIZER = "pickle"    # protocol 5, round-trips every Python value
+    CACHE_SERIALIZER = "msgpack"   # compact binary (optional dependency)
+    CACHE_COMPRESSION = "zstd"     # or "lz4" (optional), "zlib", "none"
+
+Every encoded payload except uncompressed JSON starts with a header (two
+magic bytes, a format byte and a compression byte), so entries written with another setting,
+including the older indented JSON files, still decode. Only use pickle
+when the cache directory is writable by the API alone, since decoding a
+pickle can run code.
+"""
+
+import json
+import logging
+import pickle
+import zlib
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Tuple
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is an optional serializer
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is an optional compression
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - lz4 is an optional compression
+    lz4_frame = None
+
+from backend.config import CACHE_COMPRESS_MIN_BYTES, CACHE_COMPRESSION, CACHE_SERIALIZER
+
+logger = logging.getLogger(__name__)
+
+CACHE_SERIALIZERS = ["json", "pickle", "msgpack"]
+CACHE_COMPRESSIONS = ["none", "zlib", "zstd", "lz4"]
+
+MAGIC = b"\x00M"
+
+
+def _msgpack_default(value: Any) -> Any:
+    """Encode the values msgpack has no type for, rejecting the unknown ones."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if hasattr(value, "item"):  # numpy scalars
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _json_dumps(data: Any) -> bytes:
+    return json.dumps(data, default=str, separators=(",", ":")).encode()
+
+
+def _pickle_dumps(data: Any) -> bytes:
+    return pickle.dumps(data, protocol=5)
+
+
+def _msgpack_dumps(data: Any) -> bytes:
+    return msgpack.packb(data, default=_msgpack_default)
+
+
+def _msgpack_loads(payload: bytes) -> Any:
+    return msgpack.unpackb(payload, strict_map_key=False)
+
+
+# format -> (header byte, encode, decode)
+_FORMATS: Dict[str, Tuple[int, Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "json": (1, _json_dumps, json.loads),
+    "pickle": (2, _pickle_dumps, pickle.loads),
+    "msgpack": (3, _msgpack_dumps, _msgpack_loads),
+}
+
+
+def _zstd_compress(payload: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=3).compress(payload)
+
+
+def _zstd_decompress(payload: bytes) -> bytes:
+    return zstandard.ZstdDecompressor().decompress(payload)
+
+
+# compression -> (header byte, compress, decompress)
+_COMPRESSIONS: Dict[str, Tuple[int, Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "none": (0, lambda payload: payload, lambda payload: payload),
+    "zlib": (1, zlib.compress, zlib.decompress),
+    "zstd": (2, _zstd_compress, _zstd_decompress),
+    "lz4": (3, lambda payload: lz4_frame.compress(payload), lambda payload: lz4_frame.decompress(payload)),
+}
+
+
+def serializer_available(name: str) -> bool:
+    """Whether serializer ``name`` can be used in this environment."""
+    if name == "msgpack":
+        return msgpack is not None
+    return name in _FORMATS
+
+
+def compression_available(name: str) -> bool:
+    """Whether compression ``name`` can be used in this environment."""
+    if name == "zstd":
+        return zstandard is not None
+    if name == "lz4":
+        return lz4_frame is not None
+    return name in _COMPRESSIONS
+
+
+class PayloadSerializer:
+    """Encodes cache documents to bytes and decodes payloads of any format."""
+
+    def __init__(self, serializer: str = CACHE_SERIALIZER, compression: str = CACHE_COMPRESSION,
+                 compress_min_bytes: int = CACHE_COMPRESS_MIN_BYTES):
+        if not serializer_available(serializer):
+            logger.warning(f"Cache serializer {serializer} is not available, using json")
+            serializer = "json"
+        if not compression_available(compression):
+            logger.warning(f"Cache compression {compression} is not available, using none")
+            compression = "none"
+
+        self.format = serializer
+        self.compression = compression
+        self.compress_min_bytes = compress_min_bytes
+
+    @property
+    def binary(self) -> bool:
+        """Whether payloads may be something other than plain JSON text."""
+        return self.format != "json" or self.compression != "none"
+
+    def dumps(self, data: Any) -> bytes:
+        """Encode ``data``, compressing it when it reaches the size threshold."""
+        format_id, encode, _ = _FORMATS[self.format]
+        payload = encode(data)
+
+        compression = self.compression
+        if len(payload) < self.compress_min_bytes:
+            compression = "none"
+        if self.format == "json" and compression == "none":
+            return payload
+
+        compression_id, compress, _ = _COMPRESSIONS[compression]
+        return MAGIC + bytes([format_id, compression_id]) + compress(payload)
+
+    def loads(self, payload: bytes) -> Any:
+        """Decode a payload written with any format and compression."""
+        if not payload.startswith(MAGIC):
+            return json.loads(payload)
+
+        format_id, compression_id = payload[2], payload[3]
+        decode = next(decode for fid, _, decode in _FORMATS.values() if fid == format_id)
+        decompress = next(decompress for cid, _, decompress in _COMPRESSIONS.values() if cid == compression_id)
+        return decode(decompress(payload[4:]))
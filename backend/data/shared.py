@@ -0,0 +1,159 @@
+"""Memory-mapped column files shared by every worker process.
+
+Frames read from Arrow snapshots are copied onto each process' heap, so N
+API workers hold N private copies of the large tables. Here a table is
+stored as one raw ``.npy`` file per column instead::
+
+    SNAPSHOT_DIR/shared/results.json                  # manifest + column specs
+    SNAPSHOT_DIR/shared/results/raceId.npy            # plain numeric column
+    SNAPSHOT_DIR/shared/results/position.npy          # nullable column values...
+    SNAPSHOT_DIR/shared/results/position.mask.npy     # ...and its missing mask
+    SNAPSHOT_DIR/shared/results/positionText.npy      # categorical codes
+    SNAPSHOT_DIR/shared/results/_text.arrow           # remaining text columns
+
+Numeric, nullable and categorical columns are mapped read-only with
+``np.load(mmap_mode="r")`` and wrapped without copying, so their pages live
+in the OS page cache once and are shared by all processes mapping them.
+Only the (small) text columns are materialized per process, and only the
+columns a caller asks for are mapped at all.
+"""
+
+import logging
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from backend.config import ENABLE_SHARED_TABLES, ENABLE_SNAPSHOTS, SNAPSHOT_DIR
+from backend.data.snapshot import SNAPSHOT_FORMAT_VERSION, SnapshotStore, feather, replace_dir, tmp_path_for
+
+logger = logging.getLogger(__name__)
+
+TEXT_FILE = "_text.arrow"
+
+
+def _column_spec(name: str, series: pd.Series) -> Dict:
+    """Describe how a column is stored; ``kind`` is numeric, masked, category or text."""
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return {"name": name, "kind": "category",
+                "categories": dtype.categories.tolist(), "ordered": bool(dtype.ordered)}
+    if isinstance(dtype, (pd.Int8Dtype, pd.Int16Dtype, pd.Int32Dtype, pd.Int64Dtype,
+                          pd.Float32Dtype, pd.Float64Dtype)):
+        return {"name": name, "kind": "masked", "dtype": dtype.name}
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        return {"name": name, "kind": "numeric"}
+    return {"name": name, "kind": "text"}
+
+
+class SharedTableStore(SnapshotStore):
+    """Stores dataset tables as per-column files that load as shared memory maps."""
+
+    def __init__(self, snapshot_dir: Path = SNAPSHOT_DIR / "shared",
+                 enabled: bool = ENABLE_SNAPSHOTS and ENABLE_SHARED_TABLES):
+        super().__init__(snapshot_dir, enabled)
+
+    def _snapshot_path(self, csv_path: Path) -> Path:
+        return self.snapshot_dir / csv_path.stem
+
+    def build(self, csv_path: Path, reader: Callable[..., pd.DataFrame],
+              columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Parse ``csv_path`` with ``reader`` and write its column files."""
+        with self._build_lock(csv_path) as stale:
+            if stale:
+                self._write_columns(csv_path, reader)
+            return self._map(csv_path, columns)
+
+    def _write_columns(self, csv_path: Path, reader: Callable[..., pd.DataFrame]) -> None:
+        stat = csv_path.stat()
+        df = reader(csv_path)
+
+        table_dir = self._snapshot_path(csv_path)
+        tmp_dir = tmp_path_for(table_dir)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        specs: List[Dict] = []
+        text_columns = []
+        for name in df.columns:
+            series = df[name]
+            spec = _column_spec(name, series)
+            if spec["kind"] == "numeric":
+                np.save(tmp_dir / f"{name}.npy", series.to_numpy())
+            elif spec["kind"] == "masked":
+                mask = series.isna().to_numpy()
+                values = series.to_numpy(dtype=series.dtype.numpy_dtype, na_value=0)
+                np.save(tmp_dir / f"{name}.npy", values)
+                np.save(tmp_dir / f"{name}.mask.npy", mask)
+            elif spec["kind"] == "category":
+                np.save(tmp_dir / f"{name}.npy", series.cat.codes.to_numpy())
+            else:
+                text_columns.append(name)
+            specs.append(spec)
+
+        if text_columns:
+            feather.write_feather(df[text_columns], tmp_dir / TEXT_FILE, compression="uncompressed")
+
+        replace_dir(tmp_dir, table_dir)
+
+        self._write_manifest(csv_path, {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "source": csv_path.name,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": self._file_hash(csv_path),
+            "rows": len(df),
+            "columns": specs,
+            "built_at": datetime.now().isoformat()
+        })
+
+        logger.info(f"Built shared columns for {csv_path.name}: {len(df)} rows")
+
+    def _map(self, csv_path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Assemble a frame over the memory-mapped column files of ``csv_path``."""
+        manifest = self._read_manifest(csv_path)
+        if manifest is None:
+            raise OSError(f"Shared columns for {csv_path.name} are missing")
+
+        table_dir = self._snapshot_path(csv_path)
+        specs = [spec for spec in manifest["columns"] if columns is None or spec["name"] in columns]
+        text_columns = [spec["name"] for spec in specs if spec["kind"] == "text"]
+        text = feather.read_feather(table_dir / TEXT_FILE, columns=text_columns) if text_columns else None
+
+        frame = {}
+        for spec in specs:
+            name, kind = spec["name"], spec["kind"]
+            if kind == "text":
+                frame[name] = text[name]
+                continue
+
+            values = np.load(table_dir / f"{name}.npy", mmap_mode="r")
+            if kind == "numeric":
+                frame[name] = values
+            elif kind == "masked":
+                mask = np.load(table_dir / f"{name}.mask.npy", mmap_mode="r")
+                array_type = pd.arrays.FloatingArray if values.dtype.kind == "f" else pd.arrays.IntegerArray
+                frame[name] = array_type(values, mask, copy=False)
+            else:
+                dtype = pd.CategoricalDtype(spec["categories"], ordered=spec["ordered"])
+                frame[name] = pd.Categorical.from_codes(values, dtype=dtype)
+
+        # copy=False keeps one block per column, each backed by its mapping
+        return pd.DataFrame(frame, copy=False)
+
+    def load(self, csv_path: Path, reader: Callable[..., pd.DataFrame],
+             columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Map ``csv_path``'s shared columns (only ``columns`` if given), rebuilding them first if stale."""
+        if not self.enabled:
+            return reader(csv_path, columns)
+
+        try:
+            if self.is_fresh(csv_path):
+                return self._map(csv_path, columns)
+            return self.build(csv_path, reader, columns)
+        except OSError as e:
+            logger.warning(f"Shared columns unavailable for {csv_path.name}, reading CSV: {e}")
+            return reader(csv_path, columns)
@@ -0,0 +1,243 @@
+"""Columnar snapshots of the CSV dataset for fast cold starts.
+
+Each ``dataset/<name>.csv`` is mirrored by an uncompressed Arrow IPC (Feather v2)
+file in ``SNAPSHOT_DIR`` plus a small JSON manifest recording the size, mtime and
+SHA-256 of the CSV it was built from. A snapshot is reused while the CSV is
+unchanged and rebuilt transparently as soon as it changes.
+
+Run ``python -m backend.data.snapshot`` to prebuild every snapshot, e.g. as part
+of a deployment build step.
+
+Worker processes rebuilding the same stale table serialize on a per-table
+``flock`` lock file (``<name>.lock``) and write to per-process temp paths;
+a worker that had to wait reuses the snapshot its predecessor built.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - no cross-process locks on Windows
+    fcntl = None
+
+from backend.config import DATASET_DIR, ENABLE_SNAPSHOTS, SNAPSHOT_DIR
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - pyarrow ships with the deployment
+    feather = None
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the way frames are produced from CSVs changes, so that stale
+# snapshots built by an older release are never served.
+SNAPSHOT_FORMAT_VERSION = 3
+
+
+def replace_dir(tmp_dir: Path, target: Path) -> None:
+    """Swap a freshly built directory in place of ``target``.
+
+    Frames already memory-mapped from the old files stay valid, because the
+    mapped inodes outlive the rename.
+    """
+    old_dir = target.with_name(f"{target.name}.old")
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if target.exists():
+        os.replace(target, old_dir)
+    os.replace(tmp_dir, target)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def tmp_path_for(target: Path) -> Path:
+    """A temp path next to ``target`` private to this process."""
+    return target.with_name(f"{target.name}.{os.getpid()}.tmp")
+
+
+@contextmanager
+def exclusive_lock(lock_path: Path) -> Iterator[bool]:
+    """Hold an exclusive ``flock`` on ``lock_path``; yields whether another holder had to be waited for.
+
+    Without ``fcntl`` (Windows) nothing is locked.
+    """
+    if fcntl is None:
+        yield False
+        return
+
+    fd = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            waited = False
+        except BlockingIOError:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            waited = True
+        yield waited
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+class SnapshotStore:
+    """Builds, validates and loads Arrow snapshots of dataset CSV files."""
+
+    def __init__(self, snapshot_dir: Path = SNAPSHOT_DIR, enabled: bool = ENABLE_SNAPSHOTS):
+        self.snapshot_dir = snapshot_dir
+        self.enabled = enabled and feather is not None
+
+        if enabled and feather is None:
+            logger.warning("pyarrow is not installed; dataset snapshots disabled")
+
+    def _snapshot_path(self, csv_path: Path) -> Path:
+        return self.snapshot_dir / f"{csv_path.stem}.arrow"
+
+    def _manifest_path(self, csv_path: Path) -> Path:
+        return self.snapshot_dir / f"{csv_path.stem}.json"
+
+    @staticmethod
+    def _file_hash(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _read_manifest(self, csv_path: Path) -> Optional[Dict]:
+        manifest_path = self._manifest_path(csv_path)
+        if not manifest_path.exists() or not self._snapshot_path(csv_path).exists():
+            return None
+
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            return None
+
+        return manifest
+
+    def _write_manifest(self, csv_path: Path, manifest: Dict) -> None:
+        manifest_path = self._manifest_path(csv_path)
+        tmp_path = tmp_path_for(manifest_path)
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, manifest_path)
+
+    def is_fresh(self, csv_path: Path) -> bool:
+        """Check whether the snapshot for ``csv_path`` matches the CSV on disk.
+
+        Size and mtime are compared first; the content hash is only computed when
+        they differ, so that a touched-but-identical file does not force a rebuild.
+        """
+        manifest = self._read_manifest(csv_path)
+        if manifest is None:
+            return False
+
+        stat = csv_path.stat()
+        if manifest["size"] == stat.st_size and manifest["mtime_ns"] == stat.st_mtime_ns:
+            return True
+
+        if manifest["size"] != stat.st_size or manifest["sha256"] != self._file_hash(csv_path):
+            return False
+
+        # Same content, new mtime (e.g. fresh checkout): refresh the manifest
+        manifest["mtime_ns"] = stat.st_mtime_ns
+        self._write_manifest(csv_path, manifest)
+        return True
+
+    @contextmanager
+    def _build_lock(self, csv_path: Path) -> Iterator[bool]:
+        """Hold the exclusive build lock of ``csv_path``; yields whether it still needs building.
+
+        A process that had to wait for another builder re-checks the
+        manifest, which that builder usually left fresh.
+        """
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        with exclusive_lock(self.snapshot_dir / f"{csv_path.stem}.lock") as waited:
+            yield not (waited and self.is_fresh(csv_path))
+
+    def build(self, csv_path: Path, reader: Callable[[Path], pd.DataFrame]) -> pd.DataFrame:
+        """Parse ``csv_path`` with ``reader`` and persist it as a snapshot."""
+        with self._build_lock(csv_path) as stale:
+            if not stale:
+                return feather.read_feather(self._snapshot_path(csv_path), memory_map=True)
+            return self._build(csv_path, reader)
+
+    def _build(self, csv_path: Path, reader: Callable[[Path], pd.DataFrame]) -> pd.DataFrame:
+        stat = csv_path.stat()
+        df = reader(csv_path)
+
+        snapshot_path = self._snapshot_path(csv_path)
+        tmp_path = tmp_path_for(snapshot_path)
+        try:
+            feather.write_feather(df, tmp_path, compression="uncompressed")
+            os.replace(tmp_path, snapshot_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        self._write_manifest(csv_path, {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "source": csv_path.name,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": self._file_hash(csv_path),
+            "rows": len(df),
+            "built_at": datetime.now().isoformat()
+        })
+
+        logger.info(f"Built snapshot for {csv_path.name}: {len(df)} rows")
+        return df
+
+    def load(self, csv_path: Path, reader: Callable[..., pd.DataFrame],
+             columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load ``csv_path`` from its snapshot, rebuilding it first if stale.
+
+        Snapshots always hold every column; ``columns`` selects the ones
+        read (``reader(csv_path, columns)`` when parsing the CSV directly).
+        """
+        if not self.enabled:
+            return reader(csv_path, columns)
+
+        try:
+            if self.is_fresh(csv_path):
+                return feather.read_feather(self._snapshot_path(csv_path), columns=columns, memory_map=True)
+            df = self.build(csv_path, reader)
+            return df[columns] if columns is not None else df
+        except OSError as e:
+            # A read-only or full disk must never take data loading down with it
+            logger.warning(f"Snapshot unavailable for {csv_path.name}, reading CSV: {e}")
+            return reader(csv_path, columns)
+
+    def build_all(self, reader: Callable[[Path], pd.DataFrame],
+                  dataset_dir: Path = DATASET_DIR, exclude: Iterable[str] = ()) -> List[str]:
+        """Ensure every CSV in ``dataset_dir`` (except ``exclude``) has a fresh snapshot."""
+        rebuilt = []
+        for csv_path in sorted(dataset_dir.glob("*.csv")):
+            if csv_path.name in exclude:
+                continue
+            if not self.is_fresh(csv_path):
+                self.build(csv_path, reader)
+                rebuilt.append(csv_path.name)
+        return rebuilt
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+
+    from backend.data.loader import data_loader
+
+    if not data_loader.snapshots.enabled:
+        raise SystemExit("Snapshots are disabled (ENABLE_SNAPSHOTS or missing pyarrow)")
+    rebuilt = data_loader.build_snapshots()
+    logger.info(f"Snapshots up to date ({len(rebuilt)} rebuilt)")
@@ -0,0 +1,220 @@
+"""Embedded SQL engine for the per-race constructor aggregations.
+
+The pandas path of the aggregating loader methods slices the fact tables,
+materializes every matching row and then groups them. With an embedded,
+in-process engine the grouping is pushed down instead and only the
+aggregated rows come back::
+
+    QUERY_ENGINE = "duckdb"   # columnar, vectorized (optional dependency)
+    QUERY_ENGINE = "sqlite"   # stdlib, row store with B-tree indexes
+
+Relations are copied from the loader's tables into an in-memory database
+the first time a query needs them, once per dataset version, keeping only
+the columns the queries read. DuckDB is only imported when an engine uses
+it, so workers on the default pandas path never load it.
+"""
+
+import importlib.util
+import logging
+import math
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+QUERY_ENGINES = ["pandas", "duckdb", "sqlite"]
+
+# Columns registered per relation; the queries below never need more
+SQL_RELATIONS: Dict[str, List[str]] = {
+    "race_results": ["raceId", "driverId", "constructorId", "year", "round", "position", "points"],
+    "lap_times": ["raceId", "driverId", "milliseconds"],
+    "entries": ["raceId", "driverId", "constructorId"],
+    "races": ["raceId", "year", "round"],
+}
+
+# SQLite indexes per relation (DuckDB scans its columns instead)
+SQLITE_INDEXES: Dict[str, List[str]] = {
+    "race_results": ["year, constructorId"],
+    "lap_times": ["raceId, driverId"],
+    "entries": ["raceId, driverId"],
+    "races": ["raceId", "year"],
+}
+
+# Upper season bound used for open-ended ranges
+_LAST_SEASON = 9999
+
+POINTS_DATA_SQL = """
+SELECT raceId, constructorId, year, round,
+       SUM(points) AS total_points,
+       MIN(position) AS best_finish,
+       AVG(position) AS avg_finish,
+       COUNT(position) AS cars_finished
+FROM race_results
+WHERE year BETWEEN ? AND ? {constructor_filter}
+GROUP BY raceId, constructorId, year, round
+ORDER BY raceId, constructorId, year, round
+"""
+
+RACE_WINS_SQL = """
+SELECT raceId, constructorId, year, round,
+       MIN(position) AS best_position,
+       MAX(position) AS worst_position,
+       COUNT(position) AS drivers_count,
+       SUM(points) AS total_points
+FROM race_results
+WHERE year BETWEEN ? AND ? {constructor_filter}
+GROUP BY raceId, constructorId, year, round
+HAVING MIN(position) = 1 AND MAX(position) = 2 AND COUNT(position) = 2
+ORDER BY raceId, constructorId, year, round
+"""
+
+LAP_PERFORMANCE_SQL = """
+SELECT l.raceId, e.constructorId, r.year, r.round,
+       AVG(l.milliseconds) AS avg_lap_time_ms,
+       MIN(l.milliseconds) AS fastest_lap_ms,
+       MAX(l.milliseconds) AS slowest_lap_ms,
+       STDDEV_SAMP(l.milliseconds) AS lap_time_std_ms,
+       COUNT(l.milliseconds) AS total_laps,
+       AVG(l.milliseconds / 1000.0) AS avg_lap_time_s,
+       MIN(l.milliseconds) / 1000.0 AS fastest_lap_s,
+       MAX(l.milliseconds) / 1000.0 AS slowest_lap_s,
+       STDDEV_SAMP(l.milliseconds / 1000.0) AS lap_time_std_s
+FROM lap_times l
+JOIN entries e ON e.raceId = l.raceId AND e.driverId = l.driverId
+JOIN races r ON r.raceId = l.raceId
+WHERE r.year BETWEEN ? AND ? {constructor_filter}
+GROUP BY l.raceId, e.constructorId, r.year, r.round
+ORDER BY l.raceId, e.constructorId, r.year, r.round
+"""
+
+# Result dtypes matching the pandas groupby output of the same aggregation
+_KEY_DTYPES = {"raceId": "int32", "constructorId": "int32", "year": "int32", "round": "int32"}
+POINTS_DATA_DTYPES = {**_KEY_DTYPES, "total_points": "float64", "best_finish": "Int32",
+                      "avg_finish": "Float64", "cars_finished": "Int64"}
+RACE_WINS_DTYPES = {**_KEY_DTYPES, "best_position": "Int32", "worst_position": "Int32",
+                    "drivers_count": "Int64", "total_points": "float64"}
+LAP_PERFORMANCE_DTYPES = {**_KEY_DTYPES, "avg_lap_time_ms": "float64", "fastest_lap_ms": "int32",
+                          "slowest_lap_ms": "int32", "lap_time_std_ms": "float64", "total_laps": "int64",
+                          "avg_lap_time_s": "float64", "fastest_lap_s": "float64",
+                          "slowest_lap_s": "float64", "lap_time_std_s": "float64"}
+
+
+class _StddevSamp:
+    """Sample standard deviation aggregate for SQLite, which has none built in."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def step(self, value):
+        if value is None:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def finalize(self):
+        if self.count < 2:
+            return None
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+def engine_available(engine: str) -> bool:
+    """Whether ``engine`` can be used in this environment."""
+    if engine == "duckdb":
+        return importlib.util.find_spec("duckdb") is not None
+    return engine == "sqlite"
+
+
+class SqlQueryEngine:
+    """Runs the pushed-down aggregations on one dataset version.
+
+    ``provider`` returns the loader frame backing a relation name of
+    ``SQL_RELATIONS``.
+    """
+
+    def __init__(self, engine: str, provider: Callable[[str], pd.DataFrame]):
+        if not engine_available(engine):
+            raise ValueError(f"Query engine not available: {engine}")
+
+        self.engine = engine
+        self._provider = provider
+        self._registered = set()
+        self._lock = threading.Lock()
+
+        if engine == "duckdb":
+            import duckdb  # optional engine, imported on first use
+            self._conn = duckdb.connect(":memory:")
+        else:
+            self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._conn.create_aggregate("STDDEV_SAMP", 1, _StddevSamp)
+
+    def _register(self, relations: Sequence[str]) -> None:
+        """Copy the loader frames of ``relations`` into the engine."""
+        for name in relations:
+            if name in self._registered:
+                continue
+
+            df = self._provider(name)[SQL_RELATIONS[name]]
+            if self.engine == "duckdb":
+                self._conn.register("_source", df)
+                self._conn.execute(f"CREATE TABLE {name} AS SELECT * FROM _source")
+                self._conn.unregister("_source")
+            else:
+                df.to_sql(name, self._conn, index=False)
+                for i, columns in enumerate(SQLITE_INDEXES.get(name, [])):
+                    self._conn.execute(f"CREATE INDEX idx_{name}_{i} ON {name} ({columns})")
+
+            self._registered.add(name)
+            logger.info(f"Registered {name} with {self.engine}: {len(df)} rows")
+
+    def warm(self, relations: Optional[Sequence[str]] = None) -> None:
+        """Register ``relations`` (default: every relation) ahead of the first query."""
+        with self._lock:
+            self._register(list(SQL_RELATIONS) if relations is None else relations)
+
+    def query(self, sql: str, params: Sequence, relations: Sequence[str],
+              dtypes: Dict[str, str]) -> pd.DataFrame:
+        """Run ``sql`` over ``relations`` and cast the result to ``dtypes``."""
+        with self._lock:
+            self._register(relations)
+            if self.engine == "duckdb":
+                df = self._conn.execute(sql, list(params)).df()
+            else:
+                df = pd.read_sql_query(sql, self._conn, params=list(params))
+        return df.astype(dtypes)
+
+    def _aggregate(self, template: str, column: str, years: slice, constructor_id: Optional[int],
+                   relations: Sequence[str], dtypes: Dict[str, str]) -> pd.DataFrame:
+        """Run an aggregation template filtered by season range and constructor."""
+        params = [years.start, years.stop if years.stop is not None else _LAST_SEASON]
+        constructor_filter = ""
+        if constructor_id:
+            constructor_filter = f"AND {column} = ?"
+            params.append(int(constructor_id))
+        return self.query(template.format(constructor_filter=constructor_filter), params, relations, dtypes)
+
+    def points_data(self, years: slice, constructor_id: Optional[int] = None) -> pd.DataFrame:
+        """Points, best/average finish and finishers per constructor and race."""
+        return self._aggregate(POINTS_DATA_SQL, "constructorId", years, constructor_id,
+                               ["race_results"], POINTS_DATA_DTYPES)
+
+    def race_wins(self, years: slice, constructor_id: Optional[int] = None) -> pd.DataFrame:
+        """Races a constructor finished 1st and 2nd with its only two classified cars."""
+        return self._aggregate(RACE_WINS_SQL, "constructorId", years, constructor_id,
+                               ["race_results"], RACE_WINS_DTYPES)
+
+    def lap_performance(self, years: slice, constructor_id: Optional[int] = None) -> pd.DataFrame:
+        """Lap time statistics per constructor and race."""
+        return self._aggregate(LAP_PERFORMANCE_SQL, "e.constructorId", years, constructor_id,
+                               ["lap_times", "entries", "races"], LAP_PERFORMANCE_DTYPES)
+
+    def close(self) -> None:
+        """Release the engine connection."""
+        with self._lock:
+            self._conn.close()
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 import pandas as pd
 import numpy as np
 
+from backend.metrics.registry import metric_registry
+
 
 @dataclass
 class MetricResult:
@@ -34,6 +36,8 @@ class MetricResult:
             return float(value)
         elif isinstance(value, np.bool_):
             return bool(value)
+        elif value is pd.NA:
+            return None
         elif isinstance(value, dict):
             return MetricResult._serialize_dict(value)
         elif isinstance(value, list):
@@ -65,10 +69,10 @@ class BaseMetric(ABC):
         """Calculate the metric for given parameters."""
         pass
 
-    @abstractmethod
     def get_required_data(self) -> List[str]:
-        """Return list of required CSV files for this metric."""
-        pass
+        """Return list of required CSV files for this metric, as declared in the metric registry."""
+        spec = metric_registry.spec(self.name)
+        return list(spec.tables) if spec is not None else []
 
 
 class DriverMetric(BaseMetric):
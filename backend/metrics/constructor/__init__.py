@@ -1,49 +1,44 @@
-"""Constructor metrics package."""
+"""Constructor metrics package.
 
-from .championship import (
-    ConstructorChampionshipPosition,
-    ConstructorChampionshipWins,
-    ConstructorPointsPerSeason,
-    ConstructorPointsPerRace,
-    ConstructorTopThreeFinishes,
-)
+Metric modules are imported lazily on first attribute access, so importing
+one of them (e.g. through the metric registry) does not load the others.
+"""
 
-from .race_performance import (
-    ConstructorWinRate,
-    ConstructorPodiumRate,
-    ConstructorRaceWins,
-    ConstructorPodiumLockouts,
-    ConstructorAverageFinishPosition,
-    ConstructorPointsScoringRate,
-    ConstructorFrontRowLockouts,
-    ConstructorDoublePodiums,
-)
+import importlib
 
-from .qualifying import (
-    ConstructorPolePositionRate,
-    ConstructorAverageQualifyingPosition,
-    ConstructorQualifyingConsistency,
-    ConstructorFrontRowStartRate,
-    ConstructorTopTenQualifyingRate,
-    ConstructorQualifyingAdvantage,
-)
-
-from .reliability import (
-    ConstructorDNFRate,
-    ConstructorMechanicalFailureRate,
-    ConstructorFinishRate,
-    ConstructorReliabilityIndex,
-    ConstructorAverageReliability,
-)
-
-from .competitiveness import (
-    ConstructorSeasonDominance,
-    ConstructorConsistencyIndex,
-    ConstructorCompetitivenessRating,
-    ConstructorPerformanceConsistency,
-    ConstructorRaceWinStreak,
-    ConstructorSeasonalImprovement,
-)
+# Class name -> submodule defining it
+_MODULES = {
+    "ConstructorChampionshipPosition": "championship",
+    "ConstructorChampionshipWins": "championship",
+    "ConstructorPointsPerSeason": "championship",
+    "ConstructorPointsPerRace": "championship",
+    "ConstructorTopThreeFinishes": "championship",
+    "ConstructorWinRate": "race_performance",
+    "ConstructorPodiumRate": "race_performance",
+    "ConstructorRaceWins": "race_performance",
+    "ConstructorPodiumLockouts": "race_performance",
+    "ConstructorAverageFinishPosition": "race_performance",
+    "ConstructorPointsScoringRate": "race_performance",
+    "ConstructorFrontRowLockouts": "race_performance",
+    "ConstructorDoublePodiums": "race_performance",
+    "ConstructorPolePositionRate": "qualifying",
+    "ConstructorAverageQualifyingPosition": "qualifying",
+    "ConstructorQualifyingConsistency": "qualifying",
+    "ConstructorFrontRowStartRate": "qualifying",
+    "ConstructorTopTenQualifyingRate": "qualifying",
+    "ConstructorQualifyingAdvantage": "qualifying",
+    "ConstructorDNFRate": "reliability",
+    "ConstructorMechanicalFailureRate": "reliability",
+    "ConstructorFinishRate": "reliability",
+    "ConstructorReliabilityIndex": "reliability",
+    "ConstructorAverageReliability": "reliability",
+    "ConstructorSeasonDominance": "competitiveness",
+    "ConstructorConsistencyIndex": "competitiveness",
+    "ConstructorCompetitivenessRating": "competitiveness",
+    "ConstructorPerformanceConsistency": "competitiveness",
+    "ConstructorRaceWinStreak": "competitiveness",
+    "ConstructorSeasonalImprovement": "competitiveness",
+}
 
 __all__ = [
     # Championship metrics
@@ -85,4 +80,11 @@ __all__ = [
     "ConstructorPerformanceConsistency",
     "ConstructorRaceWinStreak",
     "ConstructorSeasonalImprovement",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    if name in _MODULES:
+        module = importlib.import_module(f".{_MODULES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -302,7 +302,7 @@ class ConstructorRaceWinStreak(BaseConstructorMetric):
                            .agg({"position": "min"})
                            .reset_index())
 
-            race_results["is_win"] = (race_results["position"] == 1).astype(int)
+            race_results["is_win"] = race_results["position"].eq(1).fillna(False).astype(int)
 
             # Calculate consecutive wins
             win_streaks = []
@@ -24,7 +24,7 @@ class ConstructorAverageLapTime(BaseConstructorMetric):
                                   metadata={"error": "No lap time data found"})
 
             # Convert milliseconds to seconds
-            lap_times["seconds"] = lap_times["milliseconds"] / 1000
+            lap_times = lap_times.assign(seconds=lap_times["milliseconds"] / 1000)
             avg_time = lap_times["seconds"].mean()
 
             return MetricResult(
@@ -57,7 +57,7 @@ class ConstructorFastestLap(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No lap time data found"})
 
-            lap_times["seconds"] = lap_times["milliseconds"] / 1000
+            lap_times = lap_times.assign(seconds=lap_times["milliseconds"] / 1000)
             fastest_time = lap_times["seconds"].min()
 
             # Find the specific lap
@@ -93,7 +93,7 @@ class ConstructorLapTimeConsistency(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "Insufficient lap time data for consistency analysis"})
 
-            lap_times["seconds"] = lap_times["milliseconds"] / 1000
+            lap_times = lap_times.assign(seconds=lap_times["milliseconds"] / 1000)
 
             # Remove outliers (laps more than 3 standard deviations from mean)
             mean_time = lap_times["seconds"].mean()
@@ -137,26 +137,24 @@ class ConstructorRacePace(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No lap time data found"})
 
-            # Get all lap times for comparison
-            all_laps = data_loader.get_constructor_lap_times(season)
+            # Field average lap per race, computed once per season
+            field_laps = (kwargs.get("view") or data_loader.season_view(season)).lap_baselines
 
-            if all_laps.empty:
+            if field_laps.empty:
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No comparison data available"})
 
-            constructor_laps["seconds"] = constructor_laps["milliseconds"] / 1000
-            all_laps["seconds"] = all_laps["milliseconds"] / 1000
+            constructor_laps = constructor_laps.assign(seconds=constructor_laps["milliseconds"] / 1000)
 
             # Calculate pace by race
             race_pace_analysis = []
 
             for race_id in constructor_laps["raceId"].unique():
                 constructor_race_laps = constructor_laps[constructor_laps["raceId"] == race_id]
-                all_race_laps = all_laps[all_laps["raceId"] == race_id]
 
-                if len(constructor_race_laps) > 0 and len(all_race_laps) > 0:
+                if len(constructor_race_laps) > 0 and race_id in field_laps.index:
                     constructor_avg = constructor_race_laps["seconds"].mean()
-                    field_avg = all_race_laps["seconds"].mean()
+                    field_avg = field_laps.at[race_id, "field_avg_s"]
 
                     pace_diff = ((constructor_avg - field_avg) / field_avg) * 100
                     race_pace_analysis.append(pace_diff)
@@ -197,7 +195,7 @@ class ConstructorLapTimeImprovement(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No lap time data found"})
 
-            lap_times["seconds"] = lap_times["milliseconds"] / 1000
+            lap_times = lap_times.assign(seconds=lap_times["milliseconds"] / 1000)
 
             # Analyze improvement per race
             race_improvements = []
@@ -249,7 +247,7 @@ class ConstructorTireManagement(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No lap time data found"})
 
-            lap_times["seconds"] = lap_times["milliseconds"] / 1000
+            lap_times = lap_times.assign(seconds=lap_times["milliseconds"] / 1000)
 
             # Analyze degradation per race stint
             degradation_rates = []
@@ -305,21 +303,19 @@ class ConstructorCompetitiveLapRate(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No lap time data found"})
 
-            lap_times["seconds"] = lap_times["milliseconds"] / 1000
+            lap_times = lap_times.assign(seconds=lap_times["milliseconds"] / 1000)
 
             competitive_laps = 0
             total_laps = 0
 
-            # Get all lap times to find fastest lap per race
-            all_lap_times = data_loader.get_constructor_lap_times(season)
-            all_lap_times["seconds"] = all_lap_times["milliseconds"] / 1000
+            # Fastest lap per race, computed once per season
+            field_laps = (kwargs.get("view") or data_loader.season_view(season)).lap_baselines
 
             for race_id in lap_times["raceId"].unique():
                 race_constructor_laps = lap_times[lap_times["raceId"] == race_id]
-                race_all_laps = all_lap_times[all_lap_times["raceId"] == race_id]
 
-                if not race_all_laps.empty:
-                    fastest_lap_time = race_all_laps["seconds"].min()
+                if race_id in field_laps.index:
+                    fastest_lap_time = field_laps.at[race_id, "fastest_lap_s"]
                     competitive_threshold = fastest_lap_time * 1.03  # 103% of fastest
 
                     race_competitive = len(race_constructor_laps[
@@ -361,7 +357,7 @@ class ConstructorLapTimeVariability(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No lap time data found"})
 
-            lap_times["seconds"] = lap_times["milliseconds"] / 1000
+            lap_times = lap_times.assign(seconds=lap_times["milliseconds"] / 1000)
 
             # Calculate variability per race
             race_variabilities = []
@@ -466,7 +462,7 @@ class ConstructorFuelAdjustedPace(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No lap time data found"})
 
-            lap_times["seconds"] = lap_times["milliseconds"] / 1000
+            lap_times = lap_times.assign(seconds=lap_times["milliseconds"] / 1000)
 
             # Estimate fuel-adjusted pace
             # Assumption: ~0.03-0.04s per lap per kg of fuel, ~1.5kg per lap consumption
@@ -479,11 +475,10 @@ class ConstructorFuelAdjustedPace(BaseConstructorMetric):
 
                 if len(race_laps) >= 10:
                     # Adjust for fuel load - subtract fuel effect from early laps
-                    race_laps_copy = race_laps.copy()
-                    race_laps_copy["fuel_adjustment"] = (len(race_laps) - race_laps_copy["lap"] + 1) * fuel_effect_per_lap
-                    race_laps_copy["adjusted_time"] = race_laps_copy["seconds"] - race_laps_copy["fuel_adjustment"]
+                    fuel_adjustment = (len(race_laps) - race_laps["lap"] + 1) * fuel_effect_per_lap
+                    adjusted_time = race_laps["seconds"] - fuel_adjustment
 
-                    adjusted_times.extend(race_laps_copy["adjusted_time"].tolist())
+                    adjusted_times.extend(adjusted_time.tolist())
 
             if adjusted_times:
                 avg_adjusted_pace = np.mean(adjusted_times)
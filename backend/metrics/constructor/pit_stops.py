@@ -24,7 +24,7 @@ class ConstructorAveragePitStopTime(BaseConstructorMetric):
                                   metadata={"error": "No pit stop data found"})
 
             # Convert milliseconds to seconds
-            pit_stops["duration_seconds"] = pit_stops["milliseconds"] / 1000
+            pit_stops = pit_stops.assign(duration_seconds=pit_stops["milliseconds"] / 1000)
 
             # Filter out outliers (stops > 60 seconds are likely repairs/retirements, not racing pit stops)
             total_stops_before_filter = len(pit_stops)
@@ -68,7 +68,7 @@ class ConstructorFastestPitStop(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No pit stop data found"})
 
-            pit_stops["duration_seconds"] = pit_stops["milliseconds"] / 1000
+            pit_stops = pit_stops.assign(duration_seconds=pit_stops["milliseconds"] / 1000)
 
             # Filter out outliers (stops > 60 seconds)
             total_stops_before_filter = len(pit_stops)
@@ -113,7 +113,7 @@ class ConstructorPitStopConsistency(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "Insufficient pit stop data for consistency analysis"})
 
-            pit_stops["duration_seconds"] = pit_stops["milliseconds"] / 1000
+            pit_stops = pit_stops.assign(duration_seconds=pit_stops["milliseconds"] / 1000)
 
             # Filter out outliers (stops > 60 seconds)
             total_stops_before_filter = len(pit_stops)
@@ -159,7 +159,7 @@ class ConstructorSubThreeSecondStops(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No pit stop data found"})
 
-            pit_stops["duration_seconds"] = pit_stops["milliseconds"] / 1000
+            pit_stops = pit_stops.assign(duration_seconds=pit_stops["milliseconds"] / 1000)
             sub_three_stops = len(pit_stops[pit_stops["duration_seconds"] < 3.0])
             total_stops = len(pit_stops)
 
@@ -195,34 +195,31 @@ class ConstructorPitStopEfficiency(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No pit stop data found"})
 
-            # Get all pit stops for comparison
-            all_stops = data_loader.get_constructor_pit_stop_stats(season)
+            # Field pit stops and their average time per race, computed once per season
+            view = kwargs.get("view") or data_loader.season_view(season)
+            all_stops = view.table("pit_stops")
 
             if all_stops.empty:
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No comparison data available"})
 
-            constructor_stops["duration_seconds"] = constructor_stops["milliseconds"] / 1000
-            all_stops["duration_seconds"] = all_stops["milliseconds"] / 1000
-
-            # Calculate average times by race
-            race_averages = all_stops.groupby("raceId")["duration_seconds"].mean()
+            constructor_stops = constructor_stops.assign(duration_seconds=constructor_stops["milliseconds"] / 1000)
+            race_averages = view.pit_stop_baselines["field_avg_s"]
 
             # Map race averages to constructor stops
-            constructor_stops["race_average"] = constructor_stops["raceId"].map(race_averages)
+            race_average = constructor_stops["raceId"].map(race_averages)
 
             # Calculate efficiency (negative means faster than average)
-            constructor_stops["efficiency"] = ((constructor_stops["duration_seconds"] - constructor_stops["race_average"])
-                                             / constructor_stops["race_average"]) * 100
+            efficiency = ((constructor_stops["duration_seconds"] - race_average) / race_average) * 100
 
-            avg_efficiency = constructor_stops["efficiency"].mean()
+            avg_efficiency = efficiency.mean()
 
             return MetricResult(
                 self.name, round(-avg_efficiency, 1), constructor_id=constructor_id,  # Negative so positive = better
                 metadata={
                     "interpretation": "Positive values indicate faster than average",
                     "constructor_avg": round(constructor_stops["duration_seconds"].mean(), 3),
-                    "field_avg": round(all_stops["duration_seconds"].mean(), 3),
+                    "field_avg": round((all_stops["milliseconds"] / 1000).mean(), 3),
                     "races_analyzed": int(len(constructor_stops["raceId"].unique()))
                 }
             )
@@ -283,7 +280,7 @@ class ConstructorPitStopTimeImprovement(BaseConstructorMetric):
 
             if season:
                 # Single season trend analysis
-                pit_stops["duration_seconds"] = pit_stops["milliseconds"] / 1000
+                pit_stops = pit_stops.assign(duration_seconds=pit_stops["milliseconds"] / 1000)
 
                 # Calculate average pit stop time per race
                 race_averages = pit_stops.groupby(["raceId", "round"])["duration_seconds"].mean().reset_index()
@@ -332,7 +329,7 @@ class ConstructorPitStopReliability(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No pit stop data found"})
 
-            pit_stops["duration_seconds"] = pit_stops["milliseconds"] / 1000
+            pit_stops = pit_stops.assign(duration_seconds=pit_stops["milliseconds"] / 1000)
 
             # Filter out outliers (stops > 60 seconds are likely repairs/retirements, not racing pit stops)
             total_stops_before_filter = len(pit_stops)
@@ -247,20 +247,18 @@ class ConstructorQualifyingAdvantage(BaseConstructorMetric):
                 return MetricResult(self.name, None, constructor_id=constructor_id,
                                   metadata={"error": "No qualifying data found"})
 
+            # Grid average per race (excluding DNQs), computed once per season
+            grid_averages = (kwargs.get("view") or data_loader.season_view(season)).qualifying_baselines
+
             # Get race-by-race qualifying performance
             race_performance = []
 
             for race_id in qual_data["raceId"].unique():
                 race_quals = qual_data[qual_data["raceId"] == race_id]
 
-                # Get all qualifying data for this race to calculate grid average
-                all_race_quals = data_loader.get_qualifying([race_id])
-
-                if not all_race_quals.empty and not race_quals.empty:
-                    # Calculate grid average (excluding DNQs)
-                    valid_grid = all_race_quals[all_race_quals["position"].notna() & (all_race_quals["position"] > 0)]
-                    if not valid_grid.empty:
-                        grid_average = valid_grid["position"].mean()
+                if not race_quals.empty:
+                    if race_id in grid_averages.index:
+                        grid_average = grid_averages.at[race_id, "grid_average"]
 
                         # Get constructor's best position
                         constructor_best = race_quals["position"].min()
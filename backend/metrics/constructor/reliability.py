@@ -24,7 +24,7 @@ class ConstructorDNFRate(BaseConstructorMetric):
 
             # Count total entries and DNFs
             total_entries = len(results)
-            dnfs = len(results[results["position"].isna() | (results["position"] == 0)])
+            dnfs = int(results["dnf"].sum())
 
             dnf_rate = (dnfs / total_entries) * 100 if total_entries > 0 else 0
 
@@ -66,7 +66,7 @@ class ConstructorMechanicalFailureRate(BaseConstructorMetric):
             ]
 
             total_entries = len(reliability_data)
-            dnfs = reliability_data[reliability_data["position"].isna() | (reliability_data["position"] == 0)]
+            dnfs = reliability_data[reliability_data["dnf"]]
 
             # Filter mechanical failures
             mechanical_dnfs = 0
@@ -119,12 +119,8 @@ class ConstructorFinishRate(BaseConstructorMetric):
             # Group by race and check finishes
             race_finishes = (results
                            .groupby("raceId")
-                           .agg({
-                               "position": lambda x: sum(pd.notna(x) & (x > 0)),  # Count finishers
-                               "driverId": "count"  # Count total entries
-                           })
+                           .agg(finishers=("finished", "sum"), total_cars=("driverId", "count"))
                            .reset_index())
-            race_finishes.columns = ["raceId", "finishers", "total_cars"]
 
             total_races = len(race_finishes)
             both_cars_finish = len(race_finishes[race_finishes["finishers"] == race_finishes["total_cars"]])
@@ -166,7 +162,7 @@ class ConstructorReliabilityIndex(BaseConstructorMetric):
                                   metadata={"error": "No race results found"})
 
             total_entries = len(results)
-            finishes = len(results[results["position"].notna() & (results["position"] > 0)])
+            finishes = int(results["finished"].sum())
 
             # Base reliability score (finish rate)
             finish_rate = (finishes / total_entries) * 100 if total_entries > 0 else 0
@@ -177,11 +173,7 @@ class ConstructorReliabilityIndex(BaseConstructorMetric):
 
             # Race completion reliability (avoiding early retirements)
             # This would require lap completion data, so we'll use position-based proxy
-            competitive_finishes = len(results[
-                results["position"].notna() &
-                (results["position"] > 0) &
-                (results["position"] <= 15)
-            ])
+            competitive_finishes = len(results[results["finished"] & (results["position"] <= 15)])
             competitive_reliability = (competitive_finishes / total_entries) * 100 if total_entries > 0 else 0
 
             # Combined reliability index (weighted average)
@@ -237,7 +229,7 @@ class ConstructorAverageReliability(BaseConstructorMetric):
             if season:
                 # Single season analysis
                 total_entries = len(results)
-                finishes = len(results[results["position"].notna() & (results["position"] > 0)])
+                finishes = int(results["finished"].sum())
                 reliability = (finishes / total_entries) * 100 if total_entries > 0 else 0
 
                 return MetricResult(
@@ -255,7 +247,7 @@ class ConstructorAverageReliability(BaseConstructorMetric):
                 for year in results["year"].unique():
                     year_results = results[results["year"] == year]
                     year_entries = len(year_results)
-                    year_finishes = len(year_results[year_results["position"].notna() & (year_results["position"] > 0)])
+                    year_finishes = int(year_results["finished"].sum())
 
                     if year_entries > 0:
                         year_reliability = (year_finishes / year_entries) * 100
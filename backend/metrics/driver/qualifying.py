@@ -5,7 +5,7 @@ import numpy as np
 from typing import Optional, List, Union
 from backend.metrics.base import DriverMetric, MetricResult
 from backend.data.loader import data_loader
-from backend.data.cache import metric_cache
+from backend.data.cache import metric_cache, single_flight_calculation
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,9 +20,7 @@ class QualifyingPositionAverage(DriverMetric):
             description="Average qualifying position across selected races"
         )
 
-    def get_required_data(self) -> List[str]:
-        return ["qualifying.csv", "races.csv", "drivers.csv"]
-
+    @single_flight_calculation
     def calculate(
         self,
         driver_id: Optional[int] = None,
@@ -45,15 +43,15 @@ class QualifyingPositionAverage(DriverMetric):
 
         try:
             # Get qualifying data
-            races = data_loader.get_races(season)
-            race_ids_filtered = race_ids or races["raceId"].tolist()
-            qualifying = data_loader.get_qualifying(race_ids_filtered)
-
-            if driver_id:
-                qualifying = qualifying[qualifying["driverId"] == driver_id]
-
-            if constructor_id:
-                qualifying = qualifying[qualifying["constructorId"] == constructor_id]
+            if race_ids:
+                qualifying = data_loader.get_qualifying(
+                    race_ids,
+                    driver_id=driver_id or None,
+                    constructor_id=constructor_id or None
+                )
+            else:
+                view = kwargs.get("view") or data_loader.season_view(season)
+                qualifying = view.table("qualifying", driverId=driver_id or None, constructorId=constructor_id or None)
 
             if qualifying.empty:
                 result = MetricResult(
@@ -70,12 +68,7 @@ class QualifyingPositionAverage(DriverMetric):
                 avg_position = valid_positions["position"].mean()
 
                 # Get driver name if single driver
-                driver_name = None
-                if driver_id:
-                    drivers = data_loader.get_drivers()
-                    driver_row = drivers[drivers["driverId"] == driver_id]
-                    if not driver_row.empty:
-                        driver_name = f"{driver_row.iloc[0]['forename']} {driver_row.iloc[0]['surname']}"
+                driver_name = data_loader.get_driver_name(driver_id) if driver_id else None
 
                 result = MetricResult(
                     metric_name=self.name,
@@ -110,9 +103,7 @@ class QualifyingConsistency(DriverMetric):
             description="Standard deviation of qualifying positions (lower is more consistent)"
         )
 
-    def get_required_data(self) -> List[str]:
-        return ["qualifying.csv", "races.csv", "drivers.csv"]
-
+    @single_flight_calculation
     def calculate(
         self,
         driver_id: Optional[int] = None,
@@ -133,15 +124,15 @@ class QualifyingConsistency(DriverMetric):
             return cached_result
 
         try:
-            races = data_loader.get_races(season)
-            race_ids_filtered = race_ids or races["raceId"].tolist()
-            qualifying = data_loader.get_qualifying(race_ids_filtered)
-
-            if driver_id:
-                qualifying = qualifying[qualifying["driverId"] == driver_id]
-
-            if constructor_id:
-                qualifying = qualifying[qualifying["constructorId"] == constructor_id]
+            if race_ids:
+                qualifying = data_loader.get_qualifying(
+                    race_ids,
+                    driver_id=driver_id or None,
+                    constructor_id=constructor_id or None
+                )
+            else:
+                view = kwargs.get("view") or data_loader.season_view(season)
+                qualifying = view.table("qualifying", driverId=driver_id or None, constructorId=constructor_id or None)
 
             if qualifying.empty:
                 result = MetricResult(
@@ -158,12 +149,7 @@ class QualifyingConsistency(DriverMetric):
                 consistency = valid_positions["position"].std()
 
                 # Get driver name if single driver
-                driver_name = None
-                if driver_id:
-                    drivers = data_loader.get_drivers()
-                    driver_row = drivers[drivers["driverId"] == driver_id]
-                    if not driver_row.empty:
-                        driver_name = f"{driver_row.iloc[0]['forename']} {driver_row.iloc[0]['surname']}"
+                driver_name = data_loader.get_driver_name(driver_id) if driver_id else None
 
                 result = MetricResult(
                     metric_name=self.name,
@@ -196,9 +182,7 @@ class PolePositionRate(DriverMetric):
             description="Percentage of qualifying sessions resulting in pole position"
         )
 
-    def get_required_data(self) -> List[str]:
-        return ["qualifying.csv", "races.csv", "drivers.csv"]
-
+    @single_flight_calculation
     def calculate(
         self,
         driver_id: Optional[int] = None,
@@ -219,15 +203,15 @@ class PolePositionRate(DriverMetric):
             return cached_result
 
         try:
-            races = data_loader.get_races(season)
-            race_ids_filtered = race_ids or races["raceId"].tolist()
-            qualifying = data_loader.get_qualifying(race_ids_filtered)
-
-            if driver_id:
-                qualifying = qualifying[qualifying["driverId"] == driver_id]
-
-            if constructor_id:
-                qualifying = qualifying[qualifying["constructorId"] == constructor_id]
+            if race_ids:
+                qualifying = data_loader.get_qualifying(
+                    race_ids,
+                    driver_id=driver_id or None,
+                    constructor_id=constructor_id or None
+                )
+            else:
+                view = kwargs.get("view") or data_loader.season_view(season)
+                qualifying = view.table("qualifying", driverId=driver_id or None, constructorId=constructor_id or None)
 
             if qualifying.empty:
                 result = MetricResult(
@@ -245,12 +229,7 @@ class PolePositionRate(DriverMetric):
                 pole_rate = (len(poles) / len(valid_qualifying) * 100) if len(valid_qualifying) > 0 else 0
 
                 # Get driver name if single driver
-                driver_name = None
-                if driver_id:
-                    drivers = data_loader.get_drivers()
-                    driver_row = drivers[drivers["driverId"] == driver_id]
-                    if not driver_row.empty:
-                        driver_name = f"{driver_row.iloc[0]['forename']} {driver_row.iloc[0]['surname']}"
+                driver_name = data_loader.get_driver_name(driver_id) if driver_id else None
 
                 result = MetricResult(
                     metric_name=self.name,
@@ -5,7 +5,7 @@ import numpy as np
 from typing import Optional, List, Union
 from backend.metrics.base import DriverMetric, MetricResult
 from backend.data.loader import data_loader
-from backend.data.cache import metric_cache
+from backend.data.cache import metric_cache, single_flight_calculation
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,9 +20,7 @@ class AverageFinishPosition(DriverMetric):
             description="Average race finish position (DNFs excluded from position calculation)"
         )
 
-    def get_required_data(self) -> List[str]:
-        return ["results.csv", "races.csv", "drivers.csv"]
-
+    @single_flight_calculation
     def calculate(
         self,
         driver_id: Optional[int] = None,
@@ -43,15 +41,15 @@ class AverageFinishPosition(DriverMetric):
             return cached_result
 
         try:
-            races = data_loader.get_races(season)
-            race_ids_filtered = race_ids or races["raceId"].tolist()
-            results = data_loader.get_results(race_ids_filtered)
-
-            if driver_id:
-                results = results[results["driverId"] == driver_id]
-
-            if constructor_id:
-                results = results[results["constructorId"] == constructor_id]
+            if race_ids:
+                results = data_loader.get_results(
+                    race_ids,
+                    driver_id=driver_id or None,
+                    constructor_id=constructor_id or None
+                )
+            else:
+                view = kwargs.get("view") or data_loader.season_view(season)
+                results = view.table("results", driverId=driver_id or None, constructorId=constructor_id or None)
 
             if results.empty:
                 result = MetricResult(
@@ -68,12 +66,7 @@ class AverageFinishPosition(DriverMetric):
                 avg_position = finished_results["positionOrder"].mean()
 
                 # Get driver name if single driver
-                driver_name = None
-                if driver_id:
-                    drivers = data_loader.get_drivers()
-                    driver_row = drivers[drivers["driverId"] == driver_id]
-                    if not driver_row.empty:
-                        driver_name = f"{driver_row.iloc[0]['forename']} {driver_row.iloc[0]['surname']}"
+                driver_name = data_loader.get_driver_name(driver_id) if driver_id else None
 
                 result = MetricResult(
                     metric_name=self.name,
@@ -108,9 +101,7 @@ class PointsPerRace(DriverMetric):
             description="Average championship points scored per race"
         )
 
-    def get_required_data(self) -> List[str]:
-        return ["results.csv", "races.csv", "drivers.csv"]
-
+    @single_flight_calculation
     def calculate(
         self,
         driver_id: Optional[int] = None,
@@ -131,15 +122,15 @@ class PointsPerRace(DriverMetric):
             return cached_result
 
         try:
-            races = data_loader.get_races(season)
-            race_ids_filtered = race_ids or races["raceId"].tolist()
-            results = data_loader.get_results(race_ids_filtered)
-
-            if driver_id:
-                results = results[results["driverId"] == driver_id]
-
-            if constructor_id:
-                results = results[results["constructorId"] == constructor_id]
+            if race_ids:
+                results = data_loader.get_results(
+                    race_ids,
+                    driver_id=driver_id or None,
+                    constructor_id=constructor_id or None
+                )
+            else:
+                view = kwargs.get("view") or data_loader.season_view(season)
+                results = view.table("results", driverId=driver_id or None, constructorId=constructor_id or None)
 
             if results.empty:
                 result = MetricResult(
@@ -155,12 +146,7 @@ class PointsPerRace(DriverMetric):
                 total_points = results["points"].sum()
 
                 # Get driver name if single driver
-                driver_name = None
-                if driver_id:
-                    drivers = data_loader.get_drivers()
-                    driver_row = drivers[drivers["driverId"] == driver_id]
-                    if not driver_row.empty:
-                        driver_name = f"{driver_row.iloc[0]['forename']} {driver_row.iloc[0]['surname']}"
+                driver_name = data_loader.get_driver_name(driver_id) if driver_id else None
 
                 result = MetricResult(
                     metric_name=self.name,
@@ -194,9 +180,7 @@ class DNFRate(DriverMetric):
             description="Percentage of races that ended in DNF (Did Not Finish)"
         )
 
-    def get_required_data(self) -> List[str]:
-        return ["results.csv", "races.csv", "drivers.csv"]
-
+    @single_flight_calculation
     def calculate(
         self,
         driver_id: Optional[int] = None,
@@ -217,15 +201,15 @@ class DNFRate(DriverMetric):
             return cached_result
 
         try:
-            races = data_loader.get_races(season)
-            race_ids_filtered = race_ids or races["raceId"].tolist()
-            results = data_loader.get_results(race_ids_filtered)
-
-            if driver_id:
-                results = results[results["driverId"] == driver_id]
-
-            if constructor_id:
-                results = results[results["constructorId"] == constructor_id]
+            if race_ids:
+                results = data_loader.get_results(
+                    race_ids,
+                    driver_id=driver_id or None,
+                    constructor_id=constructor_id or None
+                )
+            else:
+                view = kwargs.get("view") or data_loader.season_view(season)
+                results = view.table("results", driverId=driver_id or None, constructorId=constructor_id or None)
 
             if results.empty:
                 result = MetricResult(
@@ -242,12 +226,7 @@ class DNFRate(DriverMetric):
                 dnf_rate = (len(dnfs) / len(results) * 100) if len(results) > 0 else 0
 
                 # Get driver name if single driver
-                driver_name = None
-                if driver_id:
-                    drivers = data_loader.get_drivers()
-                    driver_row = drivers[drivers["driverId"] == driver_id]
-                    if not driver_row.empty:
-                        driver_name = f"{driver_row.iloc[0]['forename']} {driver_row.iloc[0]['surname']}"
+                driver_name = data_loader.get_driver_name(driver_id) if driver_id else None
 
                 result = MetricResult(
                     metric_name=self.name,
@@ -280,9 +259,7 @@ class PodiumRate(DriverMetric):
             description="Percentage of races resulting in podium finish (top 3)"
         )
 
-    def get_required_data(self) -> List[str]:
-        return ["results.csv", "races.csv", "drivers.csv"]
-
+    @single_flight_calculation
     def calculate(
         self,
         driver_id: Optional[int] = None,
@@ -303,15 +280,15 @@ class PodiumRate(DriverMetric):
             return cached_result
 
         try:
-            races = data_loader.get_races(season)
-            race_ids_filtered = race_ids or races["raceId"].tolist()
-            results = data_loader.get_results(race_ids_filtered)
-
-            if driver_id:
-                results = results[results["driverId"] == driver_id]
-
-            if constructor_id:
-                results = results[results["constructorId"] == constructor_id]
+            if race_ids:
+                results = data_loader.get_results(
+                    race_ids,
+                    driver_id=driver_id or None,
+                    constructor_id=constructor_id or None
+                )
+            else:
+                view = kwargs.get("view") or data_loader.season_view(season)
+                results = view.table("results", driverId=driver_id or None, constructorId=constructor_id or None)
 
             if results.empty:
                 result = MetricResult(
@@ -327,12 +304,7 @@ class PodiumRate(DriverMetric):
                 podium_rate = (len(podiums) / len(results) * 100) if len(results) > 0 else 0
 
                 # Get driver name if single driver
-                driver_name = None
-                if driver_id:
-                    drivers = data_loader.get_drivers()
-                    driver_row = drivers[drivers["driverId"] == driver_id]
-                    if not driver_row.empty:
-                        driver_name = f"{driver_row.iloc[0]['forename']} {driver_row.iloc[0]['surname']}"
+                driver_name = data_loader.get_driver_name(driver_id) if driver_id else None
 
                 # Count wins, second places, third places
                 wins = len(results[results["positionOrder"] == 1])
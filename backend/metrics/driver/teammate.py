@@ -5,7 +5,7 @@ import numpy as np
 from typing import Optional, List, Union
 from backend.metrics.base import DriverMetric, MetricResult
 from backend.data.loader import data_loader
-from backend.data.cache import metric_cache
+from backend.data.cache import metric_cache, single_flight_calculation
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,9 +20,7 @@ class TeammateQualifyingComparison(DriverMetric):
             description="Head-to-head qualifying record against teammates"
         )
 
-    def get_required_data(self) -> List[str]:
-        return ["qualifying.csv", "results.csv", "races.csv", "drivers.csv"]
-
+    @single_flight_calculation
     def calculate(
         self,
         driver_id: Optional[int] = None,
@@ -46,13 +44,12 @@ class TeammateQualifyingComparison(DriverMetric):
             return cached_result
 
         try:
-            races = data_loader.get_races(season)
-            race_ids_filtered = race_ids or races["raceId"].tolist()
-            qualifying = data_loader.get_qualifying(race_ids_filtered)
-            results = data_loader.get_results(race_ids_filtered)
-
+            view = None if race_ids else kwargs.get("view") or data_loader.season_view(season)
             # Get driver's qualifying results
-            driver_qualifying = qualifying[qualifying["driverId"] == driver_id]
+            if view is not None:
+                driver_qualifying = view.table("qualifying", driverId=driver_id)
+            else:
+                driver_qualifying = data_loader.get_qualifying(race_ids, driver_id=driver_id)
 
             if driver_qualifying.empty:
                 result = MetricResult(
@@ -70,11 +67,11 @@ class TeammateQualifyingComparison(DriverMetric):
                     constructor_id_race = driver_qual["constructorId"]
 
                     # Find teammate in same race and constructor
-                    race_qualifying = qualifying[qualifying["raceId"] == race_id]
-                    teammate_qualifying = race_qualifying[
-                        (race_qualifying["constructorId"] == constructor_id_race) &
-                        (race_qualifying["driverId"] != driver_id)
-                    ]
+                    if view is not None:
+                        race_qualifying = view.table("qualifying", raceId=[race_id], constructorId=constructor_id_race)
+                    else:
+                        race_qualifying = data_loader.get_qualifying([race_id], constructor_id=constructor_id_race)
+                    teammate_qualifying = race_qualifying[race_qualifying["driverId"] != driver_id]
 
                     if not teammate_qualifying.empty and not pd.isna(driver_qual["position"]):
                         teammate_qual = teammate_qualifying.iloc[0]
@@ -105,20 +102,14 @@ class TeammateQualifyingComparison(DriverMetric):
                     win_rate = (wins / total * 100) if total > 0 else 0
 
                     # Get driver name
-                    drivers = data_loader.get_drivers()
-                    driver_row = drivers[drivers["driverId"] == driver_id]
-                    driver_name = None
-                    if not driver_row.empty:
-                        driver_name = f"{driver_row.iloc[0]['forename']} {driver_row.iloc[0]['surname']}"
+                    driver_name = data_loader.get_driver_name(driver_id)
 
                     # Get teammate names
                     teammate_stats = {}
-                    for teammate_id in comp_df["teammate_id"].unique():
+                    teammate_names = data_loader.entities.drivers.name_map(comp_df["teammate_id"].unique())
+                    for teammate_id, teammate_name in teammate_names.items():
                         teammate_comparisons = comp_df[comp_df["teammate_id"] == teammate_id]
-                        teammate_row = drivers[drivers["driverId"] == teammate_id]
-                        teammate_name = "Unknown"
-                        if not teammate_row.empty:
-                            teammate_name = f"{teammate_row.iloc[0]['forename']} {teammate_row.iloc[0]['surname']}"
+                        teammate_name = teammate_name or "Unknown"
 
                         teammate_wins = teammate_comparisons["driver_better"].sum()
                         teammate_total = len(teammate_comparisons)
@@ -164,9 +155,7 @@ class TeammateRaceComparison(DriverMetric):
             description="Head-to-head race finishing record against teammates"
         )
 
-    def get_required_data(self) -> List[str]:
-        return ["results.csv", "races.csv", "drivers.csv"]
-
+    @single_flight_calculation
     def calculate(
         self,
         driver_id: Optional[int] = None,
@@ -190,12 +179,12 @@ class TeammateRaceComparison(DriverMetric):
             return cached_result
 
         try:
-            races = data_loader.get_races(season)
-            race_ids_filtered = race_ids or races["raceId"].tolist()
-            results = data_loader.get_results(race_ids_filtered)
-
+            view = None if race_ids else kwargs.get("view") or data_loader.season_view(season)
             # Get driver's race results
-            driver_results = results[results["driverId"] == driver_id]
+            if view is not None:
+                driver_results = view.table("results", driverId=driver_id)
+            else:
+                driver_results = data_loader.get_results(race_ids, driver_id=driver_id)
 
             if driver_results.empty:
                 result = MetricResult(
@@ -213,11 +202,11 @@ class TeammateRaceComparison(DriverMetric):
                     constructor_id_race = driver_result["constructorId"]
 
                     # Find teammate in same race and constructor
-                    race_results = results[results["raceId"] == race_id]
-                    teammate_results = race_results[
-                        (race_results["constructorId"] == constructor_id_race) &
-                        (race_results["driverId"] != driver_id)
-                    ]
+                    if view is not None:
+                        race_results = view.table("results", raceId=[race_id], constructorId=constructor_id_race)
+                    else:
+                        race_results = data_loader.get_results([race_id], constructor_id=constructor_id_race)
+                    teammate_results = race_results[race_results["driverId"] != driver_id]
 
                     if not teammate_results.empty:
                         teammate_result = teammate_results.iloc[0]
@@ -269,20 +258,14 @@ class TeammateRaceComparison(DriverMetric):
                     win_rate = (wins / total * 100) if total > 0 else 0
 
                     # Get driver name
-                    drivers = data_loader.get_drivers()
-                    driver_row = drivers[drivers["driverId"] == driver_id]
-                    driver_name = None
-                    if not driver_row.empty:
-                        driver_name = f"{driver_row.iloc[0]['forename']} {driver_row.iloc[0]['surname']}"
+                    driver_name = data_loader.get_driver_name(driver_id)
 
                     # Get teammate stats
                     teammate_stats = {}
-                    for teammate_id in comp_df["teammate_id"].unique():
+                    teammate_names = data_loader.entities.drivers.name_map(comp_df["teammate_id"].unique())
+                    for teammate_id, teammate_name in teammate_names.items():
                         teammate_comparisons = comp_df[comp_df["teammate_id"] == teammate_id]
-                        teammate_row = drivers[drivers["driverId"] == teammate_id]
-                        teammate_name = "Unknown"
-                        if not teammate_row.empty:
-                            teammate_name = f"{teammate_row.iloc[0]['forename']} {teammate_row.iloc[0]['surname']}"
+                        teammate_name = teammate_name or "Unknown"
 
                         teammate_wins = teammate_comparisons["driver_better"].sum()
                         teammate_total = len(teammate_comparisons)
@@ -0,0 +1,293 @@
+"""Lazy registry of every driver and constructor metric.
+
+Each metric is declared here with static metadata: its family, the module
+and class implementing it, a rough cost class and the dataset tables and
+columns it reads. Listing metrics (``/metrics/available``) or invalidating them after
+a dataset change only needs this metadata; a metric's module is imported
+and its calculator instantiated the first time it is actually computed.
+
+Workers can be restricted to some families with ``METRIC_FAMILIES`` so a
+slim deployment never imports the metrics it does not serve. The loader
+keeps only the columns the served metrics declare (plus its own), see
+``columns_for``.
+"""
+
+import importlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from backend.config import METRIC_FAMILIES
+
+logger = logging.getLogger(__name__)
+
+# Table -> columns read by a metric, through the loader accessors it is built on
+Columns = Dict[str, Tuple[str, ...]]
+
+_RACES = ("raceId", "year", "round")
+_ENTRIES = ("raceId", "driverId", "constructorId")
+_DRIVER_NAMES = {"drivers.csv": ("driverId", "forename", "surname")}
+
+_STANDINGS: Columns = {
+    "constructor_standings.csv": ("raceId", "constructorId", "points", "position", "wins"),
+    "races.csv": _RACES,
+}
+_RACE_RESULTS: Columns = {
+    "results.csv": _ENTRIES + ("position", "points", "statusId"),
+    "races.csv": _RACES,
+    "constructors.csv": ("constructorId", "name"),
+    "status.csv": ("statusId", "status"),
+}
+_QUALIFYING: Columns = {
+    "qualifying.csv": _ENTRIES + ("position",),
+    "races.csv": _RACES,
+}
+_PIT_STOPS: Columns = {
+    "pit_stops.csv": ("raceId", "driverId", "lap", "milliseconds"),
+    "results.csv": _ENTRIES,
+    "races.csv": _RACES,
+}
+_LAP_TIMES: Columns = {
+    "lap_times.csv": ("raceId", "driverId", "lap", "milliseconds"),
+    "results.csv": _ENTRIES,
+    "races.csv": _RACES + ("name", "date"),
+}
+_DRIVER_QUALIFYING: Columns = {
+    "qualifying.csv": ("raceId", "driverId", "position"),
+    "races.csv": _RACES,
+    **_DRIVER_NAMES,
+}
+_DRIVER_RESULTS: Columns = {
+    "results.csv": ("raceId", "driverId", "position", "positionText", "positionOrder", "points"),
+    "races.csv": _RACES,
+    **_DRIVER_NAMES,
+}
+_TEAMMATE_QUALIFYING: Columns = {
+    "qualifying.csv": _ENTRIES + ("position",),
+    "results.csv": _ENTRIES,
+    "races.csv": _RACES,
+    **_DRIVER_NAMES,
+}
+_TEAMMATE_RESULTS: Columns = {
+    "results.csv": _ENTRIES + ("position", "positionOrder", "laps"),
+    "races.csv": _RACES,
+    **_DRIVER_NAMES,
+}
+
+
+@dataclass(frozen=True)
+class MetricSpec:
+    """Static description of one metric."""
+    name: str
+    family: str  # "driver" or "constructor"
+    module: str
+    class_name: str
+    cost: str  # "low", "medium" or "high"
+    columns: Columns = field(compare=False)
+    comparison: bool = False
+
+    @property
+    def tables(self) -> Tuple[str, ...]:
+        """Dataset tables the metric reads."""
+        return tuple(self.columns)
+
+    @property
+    def group(self) -> str:
+        """Metric group, i.e. the module the metric lives in."""
+        return self.module.rsplit(".", 1)[-1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "family": self.family,
+            "group": self.group,
+            "cost": self.cost,
+            "tables": list(self.tables)
+        }
+
+
+def _driver(name: str, module: str, class_name: str, cost: str, columns: Columns,
+            comparison: bool = False) -> MetricSpec:
+    return MetricSpec(name, "driver", f"backend.metrics.driver.{module}", class_name, cost, columns, comparison)
+
+
+def _constructor(name: str, module: str, class_name: str, cost: str, columns: Columns) -> MetricSpec:
+    return MetricSpec(name, "constructor", f"backend.metrics.constructor.{module}", class_name, cost, columns)
+
+
+METRIC_SPECS: List[MetricSpec] = [
+    # Driver metrics
+    _driver("qualifying_position_average", "qualifying", "QualifyingPositionAverage", "low",
+            _DRIVER_QUALIFYING),
+    _driver("qualifying_consistency", "qualifying", "QualifyingConsistency", "low",
+            _DRIVER_QUALIFYING),
+    _driver("pole_position_rate", "qualifying", "PolePositionRate", "low",
+            _DRIVER_QUALIFYING),
+    _driver("average_finish_position", "race", "AverageFinishPosition", "low",
+            _DRIVER_RESULTS),
+    _driver("points_per_race", "race", "PointsPerRace", "low",
+            _DRIVER_RESULTS),
+    _driver("dnf_rate", "race", "DNFRate", "low",
+            _DRIVER_RESULTS),
+    _driver("podium_rate", "race", "PodiumRate", "low",
+            _DRIVER_RESULTS),
+    _driver("teammate_qualifying_comparison", "teammate", "TeammateQualifyingComparison", "medium",
+            _TEAMMATE_QUALIFYING, comparison=True),
+    _driver("teammate_race_comparison", "teammate", "TeammateRaceComparison", "medium",
+            _TEAMMATE_RESULTS, comparison=True),
+
+    # Championship metrics
+    _constructor("constructor_championship_position", "championship", "ConstructorChampionshipPosition", "low", _STANDINGS),
+    _constructor("constructor_championship_wins", "championship", "ConstructorChampionshipWins", "low", _STANDINGS),
+    _constructor("constructor_points_per_season", "championship", "ConstructorPointsPerSeason", "low", _RACE_RESULTS),
+    _constructor("constructor_points_per_race", "championship", "ConstructorPointsPerRace", "low", _RACE_RESULTS),
+    _constructor("constructor_top_three_finishes", "championship", "ConstructorTopThreeFinishes", "low", _STANDINGS),
+
+    # Race performance metrics
+    _constructor("constructor_win_rate", "race_performance", "ConstructorWinRate", "low", _RACE_RESULTS),
+    _constructor("constructor_podium_rate", "race_performance", "ConstructorPodiumRate", "low", _RACE_RESULTS),
+    _constructor("constructor_race_wins", "race_performance", "ConstructorRaceWins", "low", _RACE_RESULTS),
+    _constructor("constructor_podium_lockouts", "race_performance", "ConstructorPodiumLockouts", "low", _RACE_RESULTS),
+    _constructor("constructor_average_finish_position", "race_performance", "ConstructorAverageFinishPosition",
+                 "low", _RACE_RESULTS),
+    _constructor("constructor_points_scoring_rate", "race_performance", "ConstructorPointsScoringRate",
+                 "low", _RACE_RESULTS),
+    _constructor("constructor_front_row_lockouts", "race_performance", "ConstructorFrontRowLockouts",
+                 "low", _QUALIFYING),
+    _constructor("constructor_double_podiums", "race_performance", "ConstructorDoublePodiums", "low", _RACE_RESULTS),
+
+    # Qualifying metrics
+    _constructor("constructor_pole_position_rate", "qualifying", "ConstructorPolePositionRate", "low", _QUALIFYING),
+    _constructor("constructor_average_qualifying_position", "qualifying", "ConstructorAverageQualifyingPosition",
+                 "low", _QUALIFYING),
+    _constructor("constructor_qualifying_consistency", "qualifying", "ConstructorQualifyingConsistency",
+                 "low", _QUALIFYING),
+    _constructor("constructor_front_row_start_rate", "qualifying", "ConstructorFrontRowStartRate", "low", _QUALIFYING),
+    _constructor("constructor_top_ten_qualifying_rate", "qualifying", "ConstructorTopTenQualifyingRate",
+                 "low", _QUALIFYING),
+    _constructor("constructor_qualifying_advantage", "qualifying", "ConstructorQualifyingAdvantage",
+                 "medium", _QUALIFYING),
+
+    # Reliability metrics
+    _constructor("constructor_dnf_rate", "reliability", "ConstructorDNFRate", "low", _RACE_RESULTS),
+    _constructor("constructor_mechanical_failure_rate", "reliability", "ConstructorMechanicalFailureRate",
+                 "low", _RACE_RESULTS),
+    _constructor("constructor_finish_rate", "reliability", "ConstructorFinishRate", "low", _RACE_RESULTS),
+    _constructor("constructor_reliability_index", "reliability", "ConstructorReliabilityIndex", "low", _RACE_RESULTS),
+    _constructor("constructor_average_reliability", "reliability", "ConstructorAverageReliability",
+                 "low", _RACE_RESULTS),
+
+    # Competitiveness metrics
+    _constructor("constructor_season_dominance", "competitiveness", "ConstructorSeasonDominance",
+                 "low", {**_STANDINGS, **_RACE_RESULTS}),
+    _constructor("constructor_consistency_index", "competitiveness", "ConstructorConsistencyIndex",
+                 "low", _RACE_RESULTS),
+    _constructor("constructor_competitiveness_rating", "competitiveness", "ConstructorCompetitivenessRating",
+                 "low", _RACE_RESULTS),
+    _constructor("constructor_performance_consistency", "competitiveness", "ConstructorPerformanceConsistency",
+                 "low", _RACE_RESULTS),
+    _constructor("constructor_race_win_streak", "competitiveness", "ConstructorRaceWinStreak", "low", _RACE_RESULTS),
+    _constructor("constructor_seasonal_improvement", "competitiveness", "ConstructorSeasonalImprovement",
+                 "low", _RACE_RESULTS),
+
+    # Pit stop metrics
+    _constructor("constructor_average_pit_stop_time", "pit_stops", "ConstructorAveragePitStopTime",
+                 "medium", _PIT_STOPS),
+    _constructor("constructor_fastest_pit_stop", "pit_stops", "ConstructorFastestPitStop", "medium", _PIT_STOPS),
+    _constructor("constructor_pit_stop_consistency", "pit_stops", "ConstructorPitStopConsistency",
+                 "medium", _PIT_STOPS),
+    _constructor("constructor_sub_three_second_stops", "pit_stops", "ConstructorSubThreeSecondStops",
+                 "medium", _PIT_STOPS),
+    _constructor("constructor_pit_stop_efficiency", "pit_stops", "ConstructorPitStopEfficiency", "medium", _PIT_STOPS),
+    _constructor("constructor_average_pit_stops_per_race", "pit_stops", "ConstructorAveragePitStopsPerRace",
+                 "medium", _PIT_STOPS),
+    _constructor("constructor_pit_stop_time_improvement", "pit_stops", "ConstructorPitStopTimeImprovement",
+                 "medium", _PIT_STOPS),
+    _constructor("constructor_pit_stop_reliability", "pit_stops", "ConstructorPitStopReliability",
+                 "medium", _PIT_STOPS),
+    _constructor("constructor_pit_stop_strategic_success", "pit_stops", "ConstructorPitStopStrategicSuccess",
+                 "medium", _PIT_STOPS),
+
+    # Lap performance metrics
+    _constructor("constructor_average_lap_time", "lap_performance", "ConstructorAverageLapTime", "high", _LAP_TIMES),
+    _constructor("constructor_fastest_lap", "lap_performance", "ConstructorFastestLap", "high", _LAP_TIMES),
+    _constructor("constructor_lap_time_consistency", "lap_performance", "ConstructorLapTimeConsistency",
+                 "high", _LAP_TIMES),
+    _constructor("constructor_race_pace", "lap_performance", "ConstructorRacePace", "high", _LAP_TIMES),
+    _constructor("constructor_lap_time_improvement", "lap_performance", "ConstructorLapTimeImprovement",
+                 "high", _LAP_TIMES),
+    _constructor("constructor_tire_management", "lap_performance", "ConstructorTireManagement", "high", _LAP_TIMES),
+    _constructor("constructor_competitive_lap_rate", "lap_performance", "ConstructorCompetitiveLapRate",
+                 "high", _LAP_TIMES),
+    _constructor("constructor_lap_time_variability", "lap_performance", "ConstructorLapTimeVariability",
+                 "high", _LAP_TIMES),
+    _constructor("constructor_pace_dominance", "lap_performance", "ConstructorPaceDominance", "high", _LAP_TIMES),
+    _constructor("constructor_fuel_adjusted_pace", "lap_performance", "ConstructorFuelAdjustedPace",
+                 "high", _LAP_TIMES),
+]
+
+
+class MetricRegistry:
+    """Looks metrics up by name and instantiates their calculators on first use."""
+
+    def __init__(self, specs: Iterable[MetricSpec], families: Optional[Iterable[str]] = None):
+        self.families = set(families) if families is not None else None
+        self._specs: Dict[str, MetricSpec] = {
+            spec.name: spec for spec in specs
+            if self.families is None or spec.family in self.families
+        }
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def spec(self, name: str, family: Optional[str] = None) -> Optional[MetricSpec]:
+        """Metadata of a served metric, optionally required to be of ``family``."""
+        spec = self._specs.get(name)
+        if spec is None or (family is not None and spec.family != family):
+            return None
+        return spec
+
+    def specs(self, family: Optional[str] = None) -> List[MetricSpec]:
+        """Metadata of every served metric, in declaration order."""
+        return [spec for spec in self._specs.values() if family is None or spec.family == family]
+
+    def names(self, family: Optional[str] = None) -> List[str]:
+        return [spec.name for spec in self.specs(family)]
+
+    def has(self, name: str, family: Optional[str] = None) -> bool:
+        return self.spec(name, family) is not None
+
+    def get(self, name: str, family: Optional[str] = None) -> Optional[Any]:
+        """Calculator of a metric, importing its module on first use."""
+        spec = self.spec(name, family)
+        if spec is None:
+            return None
+
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    module = importlib.import_module(spec.module)
+                    instance = getattr(module, spec.class_name)()
+                    self._instances[name] = instance
+                    logger.debug(f"Loaded metric {name} from {spec.module}")
+        return instance
+
+    def tables_for(self, names: Iterable[str]) -> List[str]:
+        """Union of the tables read by ``names``."""
+        return sorted({table for name in names if name in self._specs for table in self._specs[name].tables})
+
+    def columns_for(self, names: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        """Union of the columns read by ``names`` (default: every served metric), per table."""
+        names = self._specs if names is None else names
+        columns: Dict[str, set] = {}
+        for name in names:
+            if name in self._specs:
+                for table, table_columns in self._specs[name].columns.items():
+                    columns.setdefault(table, set()).update(table_columns)
+        return {table: sorted(table_columns) for table, table_columns in sorted(columns.items())}
+
+
+# Global registry of the metric families this worker serves
+metric_registry = MetricRegistry(METRIC_SPECS, METRIC_FAMILIES)
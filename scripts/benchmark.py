@@ -0,0 +1,350 @@
+"""Ad-hoc performance benchmarks for the F1 metrics backend.
+
+Run from the repository root, e.g.::
+
+    python -m scripts.benchmark startup
+"""
+
+import argparse
+import asyncio
+import functools
+import multiprocessing
+import time
+import tracemalloc
+from typing import Callable, List, Optional
+
+import pandas as pd
+
+from backend.config import DATASET_DIR
+from backend.data.cache import MetricCache
+from backend.data.loader import SHARED_TABLES, F1DataLoader
+from backend.data.schema import memory_breakdown, read_table
+from backend.data.serializer import (
+    CACHE_COMPRESSIONS, CACHE_SERIALIZERS, PayloadSerializer, compression_available, serializer_available
+)
+from backend.data.sql import QUERY_ENGINES, engine_available
+from backend.metrics.registry import metric_registry
+
+# Tables loaded on a typical cold start, largest first
+STARTUP_TABLES = [
+    "lap_times.csv", "results.csv", "driver_standings.csv", "qualifying.csv",
+    "pit_stops.csv", "constructor_standings.csv", "races.csv", "drivers.csv",
+    "constructors.csv", "status.csv"
+]
+
+
+def _best_of(fn: Callable[[], object], repeat: int) -> float:
+    """Return the fastest of ``repeat`` runs of ``fn`` in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def bench_startup(repeat: int) -> None:
+    """Compare parsing the dataset CSVs against loading their snapshots."""
+    loader = F1DataLoader()
+    loader.build_snapshots()
+    tables: List[str] = [t for t in STARTUP_TABLES if (DATASET_DIR / t).exists()]
+
+    print(f"{'table':<28}{'csv ms':>10}{'snapshot ms':>14}{'speedup':>10}")
+    total_csv = total_snapshot = 0.0
+    for table in tables:
+        path = DATASET_DIR / table
+        csv_ms = _best_of(functools.partial(loader._read_csv, path), repeat)
+        snapshot_ms = _best_of(functools.partial(loader.snapshots.load, path, loader._read_csv), repeat)
+        total_csv += csv_ms
+        total_snapshot += snapshot_ms
+        print(f"{table:<28}{csv_ms:>10.1f}{snapshot_ms:>14.1f}{csv_ms / snapshot_ms:>9.1f}x")
+
+    print(f"{'total':<28}{total_csv:>10.1f}{total_snapshot:>14.1f}{total_csv / total_snapshot:>9.1f}x")
+
+
+def bench_memory() -> None:
+    """Compare the resident size of raw CSV frames against normalized ones."""
+    loader = F1DataLoader()
+    tables: List[str] = [t for t in STARTUP_TABLES if (DATASET_DIR / t).exists()]
+
+    print(f"{'table':<28}{'raw MiB':>10}{'typed MiB':>12}{'saved':>8}  largest columns (typed)")
+    total_raw = total_typed = 0
+    for table in tables:
+        path = DATASET_DIR / table
+        raw = sum(memory_breakdown(pd.read_csv(path)).values())
+        columns = memory_breakdown(loader._read_csv(path))
+        typed = sum(columns.values())
+        total_raw += raw
+        total_typed += typed
+
+        largest = sorted(columns.items(), key=lambda item: item[1], reverse=True)[:3]
+        detail = ", ".join(f"{name} {nbytes / 2**10:.0f}K" for name, nbytes in largest)
+        print(f"{table:<28}{raw / 2**20:>10.2f}{typed / 2**20:>12.2f}{1 - typed / raw:>8.0%}  {detail}")
+
+    print(f"{'total':<28}{total_raw / 2**20:>10.2f}{total_typed / 2**20:>12.2f}{1 - total_typed / total_raw:>8.0%}")
+
+
+def bench_columns(repeat: int) -> None:
+    """Report the parse time and resident bytes saved per table by column pruning."""
+    loader = F1DataLoader()
+    tables = [t for t in STARTUP_TABLES if (DATASET_DIR / t).exists()]
+
+    print(f"{'table':<28}{'columns':>9}{'csv ms':>9}{'pruned':>9}{'full KiB':>11}{'pruned':>9}{'saved':>9}")
+    total_full = total_kept = 0
+    for table in tables:
+        path = DATASET_DIR / table
+        columns = loader.table_columns(table)
+        full = read_table(path)
+        kept = read_table(path, columns)
+        full_ms = _best_of(functools.partial(read_table, path), repeat)
+        kept_ms = _best_of(functools.partial(read_table, path, columns), repeat)
+        full_bytes = sum(memory_breakdown(full).values())
+        kept_bytes = sum(memory_breakdown(kept).values())
+        total_full += full_bytes
+        total_kept += kept_bytes
+        print(f"{table:<28}{len(kept.columns):>4}/{len(full.columns):<4}{full_ms:>9.1f}{kept_ms:>9.1f}"
+              f"{full_bytes / 1024:>11.0f}{kept_bytes / 1024:>9.0f}{1 - kept_bytes / full_bytes:>8.0%}")
+
+    print(f"{'total':<46}{total_full / 1024:>11.0f}{total_kept / 1024:>9.0f}{1 - total_kept / total_full:>8.0%}")
+
+
+def _rss_mib() -> float:
+    """Current resident set size of this process (Linux only)."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _lap_probe(partitioned: bool, constructor_id: int, season: Optional[int], queue) -> None:
+    """Run one lap metric input in a fresh process and report its RSS growth."""
+    loader = F1DataLoader()
+    loader.partitions.enabled = partitioned
+    loader.get_results()  # non-lap tables are not part of the measurement
+    loader.get_races()
+
+    before = _rss_mib()
+    start = time.perf_counter()
+    loader.get_constructor_lap_performance(season, constructor_id)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    queue.put((_rss_mib() - before, elapsed_ms))
+
+
+def bench_laps(constructor_id: int, season: Optional[int]) -> None:
+    """Compare RSS of a lap metric input from the whole table vs season partitions."""
+    loader = F1DataLoader()
+    lap_path = DATASET_DIR / "lap_times.csv"
+    loader.snapshots.load(lap_path, loader._read_csv)  # whole-table snapshot
+    loader.build_snapshots()  # season partitions
+
+    context = multiprocessing.get_context("spawn")
+    print(f"constructor={constructor_id} season={season}")
+    for label, partitioned in (("whole table", False), ("season partitions", True)):
+        queue = context.Queue()
+        process = context.Process(target=_lap_probe, args=(partitioned, constructor_id, season, queue))
+        process.start()
+        rss_mib, elapsed_ms = queue.get()
+        process.join()
+        print(f"{label:<20} +{rss_mib:6.1f} MiB RSS  {elapsed_ms:7.1f} ms")
+
+
+def _proc_kib(path: str, field: str) -> int:
+    """Read one ``field:`` value in KiB from a /proc file (Linux only)."""
+    with open(path) as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _worker_probe(shared: bool, barrier, queue) -> None:
+    """Load the large tables like an API worker and report its memory growth."""
+    loader = F1DataLoader()
+    loader.shared.enabled = shared
+    loader.partitions.zero_copy = shared
+
+    before_rss = _proc_kib("/proc/self/status", "VmRSS")
+    before_pss = _proc_kib("/proc/self/smaps_rollup", "Pss")
+    for table in STARTUP_TABLES:
+        if table != "lap_times.csv" and (DATASET_DIR / table).exists():
+            loader.load_csv(table)
+    loader.get_lap_times()
+
+    # Measure once every worker holds its tables, so shared pages are split
+    barrier.wait()
+    rss = _proc_kib("/proc/self/status", "VmRSS") - before_rss
+    pss = _proc_kib("/proc/self/smaps_rollup", "Pss") - before_pss
+    queue.put((rss / 1024, pss / 1024))
+    barrier.wait()
+
+
+def bench_workers(worker_counts: List[int]) -> None:
+    """Compare per-worker memory of private tables against shared column maps."""
+    F1DataLoader().build_snapshots()
+    for table in SHARED_TABLES:
+        path = DATASET_DIR / table
+        if path.exists():
+            F1DataLoader().shared.load(path, read_table)
+            F1DataLoader().snapshots.load(path, read_table)
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'mode':<10}{'workers':>8}{'RSS/worker':>12}{'PSS/worker':>12}{'PSS total':>11}  (MiB)")
+    for label, shared in (("private", False), ("shared", True)):
+        for count in worker_counts:
+            barrier = context.Barrier(count)
+            queue = context.Queue()
+            processes = [context.Process(target=_worker_probe, args=(shared, barrier, queue))
+                         for _ in range(count)]
+            for process in processes:
+                process.start()
+            samples = [queue.get() for _ in processes]
+            for process in processes:
+                process.join()
+
+            rss = sum(sample[0] for sample in samples) / count
+            pss = sum(sample[1] for sample in samples)
+            print(f"{label:<10}{count:>8}{rss:>12.1f}{pss / count:>12.1f}{pss:>11.1f}")
+
+
+def bench_bulk(constructor_id: int, season: Optional[int], repeat: int) -> None:
+    """Time and trace allocations of a full /metrics/constructor/bulk call."""
+    from backend.api.routes import metrics
+    from backend.api.schemas import MetricRequest
+
+    request = MetricRequest(constructor_id=constructor_id, season=season)
+    names = metric_registry.names("constructor")
+
+    def run():
+        return asyncio.run(metrics.calculate_multiple_constructor_metrics(names, request))
+
+    run()  # load tables outside the measurement
+    latency_ms = _best_of(run, repeat)
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"constructor={constructor_id} season={season} metrics={len(names)}")
+    print(f"latency: {latency_ms:.1f} ms (best of {repeat})")
+    print(f"peak traced allocations: {peak / 2**20:.1f} MiB")
+
+
+# Loader aggregations that an embedded SQL engine pushes down
+SQL_BENCH_METHODS = [
+    "get_constructor_points_data", "get_constructor_race_wins", "get_constructor_lap_performance",
+]
+
+
+def _uncached_call(loader: F1DataLoader, fn: Callable, *args):
+    """Call ``fn`` with an empty frame cache, so it aggregates again."""
+    loader.frame_cache.clear()
+    return fn(*args)
+
+
+def bench_sql(constructor_id: Optional[int], season: Optional[int], repeat: int) -> None:
+    """Compare the pandas aggregations against the embedded SQL engines.
+
+    The frame cache is cleared before every call so each run aggregates.
+    """
+    engines = [engine for engine in QUERY_ENGINES if engine == "pandas" or engine_available(engine)]
+    timings = {}
+    for engine in engines:
+        loader = F1DataLoader(query_engine=engine)
+        loader.warm()
+        for method in SQL_BENCH_METHODS:
+            run = functools.partial(_uncached_call, loader, getattr(loader, method), season, constructor_id)
+            timings[(engine, method)] = (_best_of(run, repeat), len(run()))
+
+    print(f"constructor={constructor_id} season={season or 'all'} (best of {repeat})")
+    print(f"{'method':<36}{'engine':<8}{'rows':>7}{'ms':>10}{'vs pandas':>11}")
+    for method in SQL_BENCH_METHODS:
+        baseline = timings[("pandas", method)][0]
+        for engine in engines:
+            ms, rows = timings[(engine, method)]
+            print(f"{method:<36}{engine:<8}{rows:>7}{ms:>10.1f}{baseline / ms:>10.1f}x")
+
+
+def _cache_documents(season: Optional[int]) -> List[dict]:
+    """Cache documents of every metric for every driver and constructor of a season."""
+    from backend.data.loader import data_loader
+
+    results = data_loader.get_results(data_loader.get_season_race_ids(season))
+    documents = []
+    for driver_id in results["driverId"].unique().tolist():
+        for name in metric_registry.names("driver"):
+            params = {"driver_id": driver_id, "constructor_id": None, "season": season, "race_ids": None}
+            result = metric_registry.get(name, "driver").calculate(**params)
+            documents.append(MetricCache.document(name, result, **params))
+    for constructor_id in results["constructorId"].unique().tolist():
+        for name in metric_registry.names("constructor"):
+            result = metric_registry.get(name, "constructor").calculate(constructor_id, season)
+            documents.append(MetricCache.document(name, result, constructor_id=constructor_id, season=season))
+    return documents
+
+
+def _apply_all(fn: Callable, items: List) -> List:
+    return [fn(item) for item in items]
+
+
+def bench_serializers(season: Optional[int], repeat: int) -> None:
+    """Compare cache payload encodings against the indented JSON files written before."""
+    import json
+
+    from backend.data.cache import metric_cache
+    metric_cache.enabled = False
+    documents = _cache_documents(season)
+
+    codecs = {"json indent=2 (old)": (lambda doc: json.dumps(doc, default=str, indent=2).encode(), json.loads)}
+    for serializer in CACHE_SERIALIZERS:
+        for compression in CACHE_COMPRESSIONS:
+            if serializer_available(serializer) and compression_available(compression):
+                codec = PayloadSerializer(serializer, compression)
+                codecs[f"{serializer}+{compression}"] = (codec.dumps, codec.loads)
+
+    compact = PayloadSerializer("json", "none")
+    compressible = sum(1 for doc in documents if len(compact.dumps(doc)) >= compact.compress_min_bytes)
+    print(f"season={season} documents={len(documents)} (best of {repeat}, per document); "
+          f"{compressible} reach the {compact.compress_min_bytes}-byte compression threshold")
+    print(f"{'encoding':<22}{'encode us':>11}{'decode us':>11}{'bytes':>9}{'vs old':>8}")
+    baseline = None
+    for label, (dumps, loads) in codecs.items():
+        payloads = [dumps(doc) for doc in documents]
+        size = sum(len(payload) for payload in payloads) / len(documents)
+        baseline = baseline or size
+        encode_us = _best_of(functools.partial(_apply_all, dumps, documents), repeat) * 1000 / len(documents)
+        decode_us = _best_of(functools.partial(_apply_all, loads, payloads), repeat) * 1000 / len(documents)
+        print(f"{label:<22}{encode_us:>11.1f}{decode_us:>11.1f}{size:>9.0f}{size / baseline:>7.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("benchmark", choices=["startup", "memory", "laps", "workers", "bulk", "sql", "columns",
+                                                     "serializers"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--constructor-id", type=int, default=131)
+    parser.add_argument("--season", type=int, default=None)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    if args.benchmark == "startup":
+        bench_startup(args.repeat)
+    elif args.benchmark == "memory":
+        bench_memory()
+    elif args.benchmark == "laps":
+        bench_laps(args.constructor_id, args.season)
+    elif args.benchmark == "workers":
+        bench_workers(args.workers)
+    elif args.benchmark == "bulk":
+        bench_bulk(args.constructor_id, args.season, args.repeat)
+    elif args.benchmark == "columns":
+        bench_columns(args.repeat)
+    elif args.benchmark == "sql":
+        bench_sql(args.constructor_id or None, args.season, args.repeat)
+    elif args.benchmark == "serializers":
+        bench_serializers(args.season, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
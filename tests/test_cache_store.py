@@ -0,0 +1,68 @@
+"""Tests for the persistent stores of the metric cache."""
+
+import pytest
+
+from backend.data.cache_store import FileStore, SqliteStore
+
+
+@pytest.fixture(params=["files", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        return SqliteStore(tmp_path / "cache.sqlite")
+    return FileStore(tmp_path / "cache")
+
+
+def _document(metric_name, **parameters):
+    return {"metric_name": metric_name, "result": {"value": 1.5}, "result_type": "dict",
+            "cached_at": "2024-01-01T00:00:00", "parameters": parameters}
+
+
+def _keys(store, keys, version="v1"):
+    return {key for key in keys if store.read(key, version) is not None}
+
+
+def test_write_then_read(store):
+    data = _document("wins", driver_id=1, season=2023)
+    store.write("a", data, "v1")
+
+    stored, stored_at = store.read("a", "v1")
+    assert stored == data
+    assert stored_at > 0
+    assert store.read("missing", "v1") is None
+
+
+def test_other_dataset_version_is_a_miss(store):
+    store.write("a", _document("wins", season=2023), "v1")
+
+    assert store.read("a", "v2") is None
+    assert store.read("a", "v1") is not None
+
+
+def test_invalidate_removes_affected_entries(store):
+    store.write("season", _document("wins", season=2023), "v1")
+    store.write("other_season", _document("wins", season=2022), "v1")
+    store.write("all_seasons", _document("wins"), "v1")
+    store.write("races", _document("wins", race_ids=[1100, 1101]), "v1")
+    store.write("other_races", _document("wins", race_ids=[1000]), "v1")
+    store.write("other_metric", _document("points", season=2023), "v1")
+    keys = ["season", "other_season", "all_seasons", "races", "other_races", "other_metric"]
+
+    removed = store.invalidate({"wins"}, seasons={2023}, race_ids={1101})
+
+    assert removed == 3
+    assert _keys(store, keys) == {"other_season", "other_races", "other_metric"}
+
+    # Unknown seasons invalidate every entry of the metric
+    assert store.invalidate({"wins"}, seasons=None, race_ids=None) == 2
+    assert _keys(store, keys) == {"other_metric"}
+
+
+def test_clear_one_metric_or_everything(store):
+    store.write("a", _document("wins", season=2023), "v1")
+    store.write("b", _document("points", season=2023), "v1")
+
+    store.clear("wins")
+    assert _keys(store, ["a", "b"]) == {"b"}
+
+    store.clear()
+    assert _keys(store, ["a", "b"]) == set()
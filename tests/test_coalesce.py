@@ -0,0 +1,127 @@
+"""Tests for the coalescing of identical concurrent metric computations."""
+
+import asyncio
+import threading
+
+import pytest
+
+from backend.api.coalesce import RequestCoalescer
+
+
+def _gated(release: threading.Event, calls: list, result=None, error=None):
+    """A computation that counts its calls and blocks until ``release`` is set."""
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        if error is not None:
+            raise error
+        return result
+    return compute
+
+
+async def _until_in_flight(coalescer: RequestCoalescer, requests: int) -> None:
+    while coalescer.get_stats()["requests"] < requests:
+        await asyncio.sleep(0.001)
+
+
+def test_followers_share_the_leaders_result():
+    coalescer = RequestCoalescer()
+    release, calls = threading.Event(), []
+
+    async def scenario():
+        compute = _gated(release, calls, result={"value": 42})
+        tasks = [asyncio.create_task(coalescer.run_async("key", compute)) for _ in range(3)]
+        await _until_in_flight(coalescer, 3)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(scenario()) == [{"value": 42}] * 3
+    assert len(calls) == 1
+    stats = coalescer.get_stats()
+    assert stats["computations"] == 1
+    assert stats["coalesced_requests"] == 2
+    assert stats["in_flight"] == 0
+
+
+def test_leader_error_reaches_every_request():
+    coalescer = RequestCoalescer()
+    release, calls = threading.Event(), []
+
+    async def scenario():
+        compute = _gated(release, calls, error=ValueError("boom"))
+        tasks = [asyncio.create_task(coalescer.run_async("key", compute)) for _ in range(3)]
+        await _until_in_flight(coalescer, 3)
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    outcomes = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+
+
+def test_cancelled_follower_leaves_the_others_served():
+    coalescer = RequestCoalescer()
+    release, calls = threading.Event(), []
+
+    async def scenario():
+        compute = _gated(release, calls, result="done")
+        tasks = [asyncio.create_task(coalescer.run_async("key", compute)) for _ in range(3)]
+        await _until_in_flight(coalescer, 3)
+        tasks[1].cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    leader, cancelled, follower = asyncio.run(scenario())
+    assert isinstance(cancelled, asyncio.CancelledError)
+    assert leader == follower == "done"
+    assert len(calls) == 1
+
+
+def test_cancelled_leader_still_serves_its_followers():
+    coalescer = RequestCoalescer()
+    release, calls = threading.Event(), []
+
+    async def scenario():
+        compute = _gated(release, calls, result="done")
+        tasks = [asyncio.create_task(coalescer.run_async("key", compute)) for _ in range(2)]
+        await _until_in_flight(coalescer, 2)
+        tasks[0].cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    cancelled, follower = asyncio.run(scenario())
+    assert isinstance(cancelled, asyncio.CancelledError)
+    assert follower == "done"
+    assert coalescer.get_stats()["in_flight"] == 0
+
+
+def test_threads_share_one_computation():
+    coalescer = RequestCoalescer()
+    release, calls, results = threading.Event(), [], []
+    compute = _gated(release, calls, result=7)
+
+    threads = [threading.Thread(target=lambda: results.append(coalescer.run("key", compute)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    while coalescer.get_stats()["requests"] < 4:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == [7] * 4
+    assert len(calls) == 1
+
+
+def test_sync_leader_raises_its_error():
+    coalescer = RequestCoalescer()
+
+    def compute():
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        coalescer.run("key", compute)
+    assert coalescer.get_stats()["in_flight"] == 0
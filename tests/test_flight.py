@@ -0,0 +1,113 @@
+"""Tests for the single-flight computation of metric cache misses."""
+
+import threading
+import time
+
+import pytest
+
+import backend.data.cache as cache_module
+from backend.data.cache import MetricCache, single_flight_calculation
+from backend.data.cache_store import FileStore
+from backend.data.flight import FlightLocks
+
+
+def _cache(tmp_path, timeout=5.0):
+    """A cache sharing its store and lock directory with every other one on ``tmp_path``.
+
+    Each instance has its own memory tier, like a separate worker process.
+    """
+    cache = MetricCache(generation_path=tmp_path / "generation")
+    cache.store = FileStore(tmp_path / "cache")
+    cache.flights = FlightLocks(tmp_path / "locks", timeout=timeout, poll_interval=0.01)
+    cache.enabled = True
+    return cache
+
+
+def _run_concurrently(*targets):
+    barrier = threading.Barrier(len(targets))
+    results = [None] * len(targets)
+
+    def run(i, target):
+        barrier.wait()
+        results[i] = target()
+
+    threads = [threading.Thread(target=run, args=(i, target)) for i, target in enumerate(targets)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return results
+
+
+@pytest.mark.skipif(not FlightLocks().enabled, reason="needs fcntl")
+def test_concurrent_misses_compute_once(tmp_path):
+    caches = [_cache(tmp_path), _cache(tmp_path)]
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"value": 42}
+
+    results = _run_concurrently(*(lambda cache=cache: cache.get_or_compute("wins", compute, season=2023)
+                                  for cache in caches))
+
+    assert results == [{"value": 42}] * 2
+    assert len(calls) == 1
+    assert sum(cache.flights.waited for cache in caches) == 1
+
+
+@pytest.mark.skipif(not FlightLocks().enabled, reason="needs fcntl")
+def test_decorated_calculation_computes_once(tmp_path, monkeypatch):
+    caches = [_cache(tmp_path), _cache(tmp_path)]
+    calls = []
+
+    # Each thread sees the cache of its own "worker"
+    local = threading.local()
+
+    class CacheOfThread:
+        def __getattr__(self, name):
+            return getattr(local.cache, name)
+
+    monkeypatch.setattr(cache_module, "metric_cache", CacheOfThread())
+
+    class Metric:
+        name = "wins"
+
+        @single_flight_calculation
+        def calculate(self, driver_id=None, constructor_id=None, season=None, race_ids=None):
+            calls.append(1)
+            time.sleep(0.2)
+            result = {"driver": driver_id}
+            cache_module.metric_cache.set(self.name, result, driver_id=driver_id,
+                                          constructor_id=constructor_id, season=season, race_ids=race_ids)
+            return result
+
+    def calculate(cache):
+        local.cache = cache
+        return Metric().calculate(driver_id=1, season=2023)
+
+    results = _run_concurrently(*(lambda cache=cache: calculate(cache) for cache in caches))
+
+    assert results == [{"driver": 1}] * 2
+    assert len(calls) == 1
+
+
+@pytest.mark.skipif(not FlightLocks().enabled, reason="needs fcntl")
+def test_lock_timeout_computes_without_the_lock(tmp_path):
+    cache = _cache(tmp_path, timeout=0.1)
+    holder = FlightLocks(tmp_path / "locks")
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"value": 7}
+
+    with holder.hold(cache._generate_key("wins", season=2023)):
+        start = time.monotonic()
+        assert cache.get_or_compute("wins", compute, season=2023) == {"value": 7}
+        assert time.monotonic() - start < 2
+
+    assert len(calls) == 1
+    assert cache.flights.get_stats()["timeouts"] == 1
+    assert cache.get("wins", season=2023) == {"value": 7}
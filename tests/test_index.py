@@ -0,0 +1,84 @@
+"""Tests for the group-offset indexes of loaded tables."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.data.index import TableIndex
+
+COLUMNS = ["raceId", "driverId"]
+
+BASE = pd.DataFrame({"raceId": [3, 1, 2, 1, 3, 5], "driverId": [10, 11, 10, 12, 11, 10]})
+# Existing keys (1, 3, 10, 11), new keys (4, 7, 13) and a key below every existing one (0)
+ROWS = pd.DataFrame({"raceId": [3, 4, 1, 7, 0, 4], "driverId": [13, 10, 11, 13, 12, 10]})
+
+CRITERIA = [
+    {"raceId": 1},
+    {"raceId": 4},
+    {"raceId": 0},
+    {"raceId": 6},
+    {"raceId": [1, 4, 7]},
+    {"raceId": [6, 8]},
+    {"raceId": []},
+    {"raceId": slice(2, 4)},
+    {"raceId": slice(None, 1)},
+    {"raceId": slice(5, None)},
+    {"raceId": slice(8, None)},
+    {"raceId": slice(5, 4)},
+    {"raceId": [1, 3, 4], "driverId": 11},
+    {"raceId": slice(3, None), "driverId": [10, 13]},
+    {"raceId": 1, "driverId": 13},
+    {"raceId": None, "driverId": 12},
+]
+
+
+@pytest.fixture
+def indexes():
+    combined = pd.concat([BASE, ROWS], ignore_index=True)
+    extended = TableIndex(BASE, COLUMNS).extended(ROWS)
+    return extended, TableIndex(combined, COLUMNS)
+
+
+def test_extended_matches_rebuilt_index(indexes):
+    extended, rebuilt = indexes
+    assert extended.size == rebuilt.size
+    for column in COLUMNS:
+        np.testing.assert_array_equal(extended.columns[column].keys, rebuilt.columns[column].keys)
+        for key in rebuilt.columns[column].keys:
+            np.testing.assert_array_equal(extended.columns[column].positions(key),
+                                          rebuilt.columns[column].positions(key))
+
+
+@pytest.mark.parametrize("criteria", CRITERIA)
+def test_extended_lookup_matches_rebuilt_index(indexes, criteria):
+    extended, rebuilt = indexes
+    expected = rebuilt.lookup(**criteria)
+    np.testing.assert_array_equal(extended.lookup(**criteria), expected)
+
+
+@pytest.mark.parametrize("criteria", CRITERIA)
+def test_lookup_matches_boolean_filter(indexes, criteria):
+    combined = pd.concat([BASE, ROWS], ignore_index=True)
+    mask = np.ones(len(combined), dtype=bool)
+    for column, keys in criteria.items():
+        values = combined[column]
+        if keys is None:
+            continue
+        if isinstance(keys, int):
+            mask &= values.eq(keys).to_numpy()
+        elif isinstance(keys, slice):
+            low = keys.start if keys.start is not None else values.min()
+            high = keys.stop if keys.stop is not None else values.max()
+            mask &= values.between(low, high).to_numpy()
+        else:
+            mask &= values.isin(keys).to_numpy()
+
+    extended, _ = indexes
+    np.testing.assert_array_equal(extended.lookup(**criteria), np.flatnonzero(mask))
+
+
+def test_lookup_without_criteria_selects_everything(indexes):
+    extended, _ = indexes
+    assert extended.lookup() is None
+    assert extended.lookup(raceId=None) is None
+    assert len(TableIndex.select(BASE, None)) == len(BASE)
@@ -0,0 +1,24 @@
+"""Tests for the ingestion of new race weekends as segments."""
+
+import pandas as pd
+import pytest
+
+from backend.data.loader import DATASET_DIR, F1DataLoader
+from backend.data.segments import SegmentStore
+
+
+def test_dtype_mismatch_is_rejected_before_the_segment_is_written(tmp_path):
+    loader = F1DataLoader()
+    loader.segments = SegmentStore(tmp_path / "segments", enabled=True)
+
+    races = pd.read_csv(DATASET_DIR / "races.csv").tail(1)
+    race_id = int(races["raceId"].iloc[0]) + 1
+    races = races.assign(raceId=race_id, round=races["round"] + 1)
+    results = pd.read_csv(DATASET_DIR / "results.csv", nrows=1).astype(object)
+    results = results.assign(raceId=race_id, points="lots")
+
+    with pytest.raises(ValueError, match="points"):
+        loader.ingest({"races.csv": races, "results.csv": results})
+
+    assert loader.segments.segments(loader._state.fingerprint) == []
+    assert loader.get_race_results().query("raceId == @race_id").empty
@@ -0,0 +1,40 @@
+"""Tests for the season partitions of the per-lap tables."""
+
+import pandas as pd
+
+from backend.data.partitions import SeasonPartitionStore
+
+
+def _write_races(dataset_dir, race_years):
+    pd.DataFrame({
+        "raceId": list(race_years),
+        "year": list(race_years.values()),
+    }).to_csv(dataset_dir / "races.csv", index=False)
+
+
+def test_partitions_rebuild_when_races_change(tmp_path):
+    dataset_dir = tmp_path / "dataset"
+    dataset_dir.mkdir()
+    lap_times = dataset_dir / "lap_times.csv"
+    pd.DataFrame({
+        "raceId": [1, 1, 2],
+        "driverId": [10, 11, 10],
+        "lap": [1, 1, 1],
+        "position": [1, 2, 1],
+        "time": ["1:30.000", "1:31.000", "1:32.000"],
+        "milliseconds": [90000, 91000, 92000],
+    }).to_csv(lap_times, index=False)
+    _write_races(dataset_dir, {1: 2020})
+
+    store = SeasonPartitionStore(tmp_path / "partitions", enabled=True, zero_copy=False)
+    assert store.build(lap_times, {1: 2020}) == {2020: 2}
+    assert store.is_fresh(lap_times)
+
+    # Race 2 is added to races.csv after its laps were exported
+    _write_races(dataset_dir, {1: 2020, 2: 2021})
+    assert not store.is_fresh(lap_times)
+
+    store.ensure(lap_times, {1: 2020, 2: 2021})
+    assert store.is_fresh(lap_times)
+    assert store.seasons(lap_times) == [2020, 2021]
+    assert len(store.load_season(lap_times, 2021)) == 1
@@ -0,0 +1,49 @@
+"""Tests for the encoding of cached metric payloads."""
+
+import itertools
+import json
+
+import pytest
+
+from backend.data.serializer import MAGIC, PayloadSerializer
+
+SETTINGS = list(itertools.product(["json", "pickle"], ["none", "zlib"]))
+
+DOCUMENT = {
+    "metric_name": "wins",
+    "result": {"value": 12.5, "per_race": [1, 0, 1] * 200, "label": "Red Bull"},
+    "result_type": "dict",
+    "cached_at": "2024-01-01T00:00:00",
+    "parameters": {"driver_id": 1, "season": 2023, "race_ids": None},
+}
+SMALL_DOCUMENT = {"metric_name": "wins", "result": 1}
+
+
+@pytest.mark.parametrize("writer", SETTINGS)
+@pytest.mark.parametrize("reader", SETTINGS)
+@pytest.mark.parametrize("document", [DOCUMENT, SMALL_DOCUMENT])
+def test_payloads_decode_with_any_setting(writer, reader, document):
+    payload = PayloadSerializer(*writer, compress_min_bytes=256).dumps(document)
+    assert PayloadSerializer(*reader, compress_min_bytes=256).loads(payload) == document
+
+
+@pytest.mark.parametrize("serializer", ["json", "pickle"])
+def test_small_payloads_are_not_compressed(serializer):
+    payload = PayloadSerializer(serializer, "zlib", compress_min_bytes=256).dumps(SMALL_DOCUMENT)
+    if serializer == "json":
+        assert payload == json.dumps(SMALL_DOCUMENT, separators=(",", ":")).encode()
+    else:
+        assert payload[:4] == MAGIC + bytes([2, 0])
+
+
+def test_large_payloads_are_compressed():
+    plain = PayloadSerializer("json", "none").dumps(DOCUMENT)
+    compressed = PayloadSerializer("json", "zlib", compress_min_bytes=256).dumps(DOCUMENT)
+    assert compressed.startswith(MAGIC)
+    assert len(compressed) < len(plain)
+
+
+@pytest.mark.parametrize("reader", SETTINGS)
+def test_old_indented_json_files_decode(reader):
+    payload = json.dumps(DOCUMENT, indent=2, default=str).encode()
+    assert PayloadSerializer(*reader).loads(payload) == DOCUMENT
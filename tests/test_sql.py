@@ -0,0 +1,77 @@
+"""Parity of the embedded SQL engine with the pandas aggregations."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import backend.data.loader as loader_module
+from backend.config import DATASET_DIR
+from backend.data.loader import F1DataLoader
+from backend.data.partitions import SeasonPartitionStore
+from backend.data.reload import dataset_fingerprint
+from backend.data.segments import SegmentStore
+from backend.data.shared import SharedTableStore
+from backend.data.snapshot import SnapshotStore
+
+SEASON = 2023
+
+
+def _write_lap_times(dataset_dir):
+    """Synthetic laps for every driver of ``SEASON`` and the season before, with one single-lap entry."""
+    races = pd.read_csv(DATASET_DIR / "races.csv")
+    results = pd.read_csv(DATASET_DIR / "results.csv")
+    entries = results[results["raceId"].isin(races.loc[races["year"].isin([SEASON - 1, SEASON]), "raceId"])]
+
+    rng = np.random.default_rng(7)
+    rows = []
+    for i, (race_id, driver_id) in enumerate(entries[["raceId", "driverId"]].itertuples(index=False)):
+        laps = 1 if i == 0 else 5
+        for lap in range(1, laps + 1):
+            milliseconds = int(rng.integers(80_000, 100_000))
+            rows.append((race_id, driver_id, lap, 1, f"{milliseconds / 1000:.3f}", milliseconds))
+
+    pd.DataFrame(rows, columns=["raceId", "driverId", "lap", "position", "time", "milliseconds"]).to_csv(
+        dataset_dir / "lap_times.csv", index=False)
+
+
+def _loader(tmp_path, query_engine):
+    loader = F1DataLoader(query_engine=query_engine)
+    snapshot_dir = tmp_path / f"snapshots-{query_engine}"
+    loader.snapshots = SnapshotStore(snapshot_dir)
+    loader.shared = SharedTableStore(snapshot_dir / "shared")
+    loader.partitions = SeasonPartitionStore(snapshot_dir / "partitions")
+    loader.segments = SegmentStore(snapshot_dir / "segments")
+    loader.clear_cache()
+    return loader
+
+
+@pytest.fixture(scope="module")
+def loaders(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("sql")
+    dataset_dir = tmp_path / "dataset"
+    dataset_dir.mkdir()
+    for csv_path in DATASET_DIR.glob("*.csv"):
+        (dataset_dir / csv_path.name).symlink_to(csv_path.resolve())
+    _write_lap_times(dataset_dir)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(loader_module, "DATASET_DIR", dataset_dir)
+        monkeypatch.setattr(loader_module, "dataset_fingerprint", lambda: dataset_fingerprint(dataset_dir))
+        yield _loader(tmp_path, "pandas"), _loader(tmp_path, "sqlite")
+
+
+@pytest.mark.parametrize("method", ["get_constructor_points_data", "get_constructor_race_wins",
+                                    "get_constructor_lap_performance"])
+@pytest.mark.parametrize("season", [SEASON, None])
+@pytest.mark.parametrize("constructor_id", [None, 9])
+def test_sqlite_matches_pandas(loaders, method, season, constructor_id):
+    pandas_loader, sql_loader = loaders
+    assert pandas_loader.sql is None and sql_loader.sql is not None
+
+    expected = getattr(pandas_loader, method)(season, constructor_id)
+    actual = getattr(sql_loader, method)(season, constructor_id)
+
+    keys = ["raceId", "constructorId"]
+    assert not expected.empty
+    pd.testing.assert_frame_equal(actual.sort_values(keys).reset_index(drop=True),
+                                  expected.sort_values(keys).reset_index(drop=True))
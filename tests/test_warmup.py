@@ -0,0 +1,16 @@
+"""Tests for the background warm-up on the committed dataset."""
+
+from backend.api.warmup import Warmup
+from backend.data.loader import data_loader
+
+
+def test_warmup_succeeds_on_committed_dataset():
+    warmup = Warmup()
+    warmup.run(driver_metrics=[], constructor_metrics=[])
+
+    stats = warmup.get_stats()
+    assert stats["status"] == "ready", stats["error"]
+    assert stats["error"] is None
+    assert stats["season"] == data_loader.latest_season()
+    assert data_loader._state.entries is not None
+    assert data_loader._state.race_results is not None